@@ -0,0 +1,98 @@
+from functools import partial
+from config import COLOUR
+from bench import generate, grading_cap
+from pool import ordered_map
+from runner import run_test
+from stats import percentile, wilcoxon_signed_rank
+
+
+def _run_binary(bonus, options, task):
+	# Worker entry point: task is (binary, input)
+	push_swap, numbers = task
+	return run_test(bonus, numbers, push_swap=push_swap, **options)
+
+
+def _interleaved(binaries, inputs):
+	# Input i runs every binary, starting with binary i mod n, so that no binary
+	# always goes first (or last) while the machine warms up or gets busy
+	count = len(binaries)
+	for i, numbers in enumerate(inputs):
+		for k in range(count):
+			yield binaries[(i + k) % count], numbers
+
+
+def _paired_report(label, base, other, unit, scale):
+	# base/other: the same inputs' values for the baseline and the challenger
+	differences = [(o - b) * scale for b, o in zip(base, other)]
+	wins = sum(1 for d in differences if d < 0)
+	losses = sum(1 for d in differences if d > 0)
+	z, p = wilcoxon_signed_rank(differences)
+	mean = sum(differences) / len(differences)
+	verdict = "significant" if p < 0.05 else "not significant"
+	print(
+		f"  {label}: mean diff {mean:+.2f} {unit}"
+		f" (p5/p50/p95 {percentile(differences, 5):+.2f}/{percentile(differences, 50):+.2f}/{percentile(differences, 95):+.2f})"
+		f" | better on {wins}, worse on {losses}, tied on {len(differences) - wins - losses}"
+		f" | Wilcoxon z = {z:+.2f}, p = {p:.3g} ({verdict})"
+	)
+
+
+def run_ab(binaries, size, count=100, seed=42, bonus=False, jobs=None, **options):
+	"""
+	Runs several push_swap binaries on the same random inputs and compares them.
+
+	The inputs are generated once and kept in memory. Each input is run by every
+	binary in turn, rotating which binary goes first, so slow drifts in machine load
+	affect every binary alike. The first binary is the baseline: every other one is
+	compared with it on the inputs both sorted, per input, with win/loss counts and
+	a Wilcoxon signed-rank test on the op and time differences.
+
+	As in `bench.run_benchmark`, unless a `budget` option is given, runs are only
+	stopped once they can no longer score any points, so every build that still
+	scores is compared.
+
+	Parameters:
+		binaries (list[str]): Paths of the push_swap binaries; the first is the baseline.
+		size (int): Number of values per input.
+		count (int): Number of inputs.
+		seed (int): Seed for the input generator.
+		bonus (bool): Whether to also verify with the bonus checker.
+		jobs (int | None): Number of worker processes.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		dict[str, list[CaseResult]]: Every binary's results, in input order.
+	"""
+	# The cache is keyed on config.PUSH_SWAP only
+	options.pop("cache", None)
+	options.setdefault("budget", grading_cap(size))
+	inputs = list(generate(size, count, seed))
+	print(COLOUR["HEADER"], f"A/B: {len(binaries)} binaries on {count} inputs of {size} values...", COLOUR["ENDC"])
+
+	results = {binary: [None] * count for binary in binaries}
+	tasks = _interleaved(binaries, inputs)
+	run = partial(_run_binary, bonus, options)
+	for position, result in enumerate(ordered_map(run, tasks, jobs)):
+		i, k = divmod(position, len(binaries))
+		results[binaries[(i + k) % len(binaries)]][i] = result
+
+	for binary in binaries:
+		passed = [r for r in results[binary] if r.ok]
+		failed = count - len(passed)
+		ops = sum(r.ops for r in passed) / len(passed) if passed else 0
+		wall = sum(r.wall for r in passed) / len(passed) if passed else 0
+		colour = COLOUR["RED"] if failed else COLOUR["BLUE"]
+		print(colour, f"{binary}: {len(passed)}/{count} passed, AVG {ops:.2f} ops, {wall * 1000:.2f} ms", COLOUR["ENDC"])
+		for result in [r for r in results[binary] if not r.ok][:3]:
+			print(result.message or f"❌ {result.status}")
+
+	baseline = binaries[0]
+	for binary in binaries[1:]:
+		pairs = [(b, o) for b, o in zip(results[baseline], results[binary]) if b.ok and o.ok]
+		print(COLOUR["BLUE"], f"{binary} vs {baseline} on {len(pairs)} inputs:", COLOUR["ENDC"])
+		if not pairs:
+			print(COLOUR["RED"], "⚠️  No input sorted by both binaries", COLOUR["ENDC"])
+			continue
+		_paired_report("OPS", [b.ops for b, _ in pairs], [o.ops for _, o in pairs], "ops", 1)
+		_paired_report("TIME", [b.wall for b, _ in pairs], [o.wall for _, o in pairs], "ms", 1000)
+	return results
@@ -0,0 +1,159 @@
+from verifier import Verifier
+
+# Adjacent pairs that undo each other
+CANCELS = {
+	("ra", "rra"), ("rra", "ra"),
+	("rb", "rrb"), ("rrb", "rb"),
+	("rr", "rrr"), ("rrr", "rr"),
+	("pa", "pb"), ("pb", "pa"),
+	("sa", "sa"), ("sb", "sb"), ("ss", "ss"),
+}
+
+# Adjacent pairs that can be replaced by a single operation
+MERGES = {
+	("ra", "rb"): "rr", ("rb", "ra"): "rr",
+	("rra", "rrb"): "rrr", ("rrb", "rra"): "rrr",
+	("sa", "sb"): "ss", ("sb", "sa"): "ss",
+}
+
+# Single-stack rotations and the stack they turn
+ROTATIONS = {"ra": "a", "rra": "a", "rb": "b", "rrb": "b"}
+
+
+class Analyzer:
+	"""
+	Finds wasted operations in a push_swap output, one operation at a time.
+
+	Three kinds of waste are counted in a single linear pass:
+		- cancelling pairs (ra/rra, pb/pa, sa/sa, ...), including the cascades that
+		  appear once an inner pair is removed (ra pb pa rra);
+		- mergeable pairs (ra+rb -> rr, rra+rrb -> rrr, sa+sb -> ss);
+		- runs of a single-stack rotation that go the long way round, e.g. 7 x ra on a
+		  stack of 10 where 3 x rra would do.
+
+	The first two are applied by a peephole optimiser whose output is kept in
+	`optimized`; rotation runs are only counted.
+
+	Parameters:
+		numbers (list[int]): The input push_swap was given.
+	"""
+
+	def __init__(self, numbers):
+		self.numbers = list(numbers)
+		self.total = 0
+		self.cancelled = 0
+		self.merged = 0
+		self.rotation = 0
+		self.optimized = []
+		self._sizes = {"a": len(self.numbers), "b": 0}
+		# Whether each kept push actually moved an element; a push from an empty
+		# stack is a no-op and must not cancel the next push
+		self._moved = []
+		self._run_op = None
+		self._run_length = 0
+
+	def feed(self, op):
+		"""
+		Analyses the next operation.
+		"""
+		self.total += 1
+		self._track_rotation(op)
+		moved = self._apply_size(op)
+
+		out = self.optimized
+		if out:
+			last = out[-1]
+			if (last, op) in CANCELS and (op not in ("pa", "pb") or (self._moved[-1] and moved)):
+				out.pop()
+				self._moved.pop()
+				self.cancelled += 2
+				return
+			merged = MERGES.get((last, op))
+			if merged:
+				out[-1] = merged
+				self._moved[-1] = True
+				self.merged += 1
+				return
+		out.append(op)
+		self._moved.append(moved)
+
+	def _apply_size(self, op):
+		sizes = self._sizes
+		if op == "pb" and sizes["a"]:
+			sizes["a"] -= 1
+			sizes["b"] += 1
+			return True
+		if op == "pa" and sizes["b"]:
+			sizes["b"] -= 1
+			sizes["a"] += 1
+			return True
+		return op not in ("pa", "pb")
+
+	def _track_rotation(self, op):
+		if op == self._run_op:
+			self._run_length += 1
+			return
+		self._close_run()
+		if op in ROTATIONS:
+			self._run_op = op
+			self._run_length = 1
+		else:
+			self._run_op = None
+			self._run_length = 0
+
+	def _close_run(self):
+		# A run of k rotations on a stack of n is equivalent to k mod n rotations one
+		# way or n - (k mod n) the other way
+		if self._run_op is None:
+			return
+		size = self._sizes[ROTATIONS[self._run_op]]
+		if size > 1:
+			k = self._run_length
+			self.rotation += k - min(k % size, size - k % size)
+
+	@property
+	def saveable(self) -> int:
+		"""
+		Total number of operations the three passes could remove.
+
+		Rotation runs are measured on the original stream, so a run that the peephole
+		pass also shortens is counted by both.
+		"""
+		return self.total - len(self.optimized) + self.rotation
+
+	def summary(self, verify=True):
+		"""
+		Finishes the analysis and returns its counts as a dict.
+
+		Parameters:
+			verify (bool): Whether to replay the optimised stream to check it still sorts.
+		"""
+		self._close_run()
+		self._run_op = None
+		summary = {
+			"ops": self.total,
+			"saveable": self.saveable,
+			"cancelled": self.cancelled,
+			"merged": self.merged,
+			"rotation": self.rotation,
+			"optimized": len(self.optimized),
+		}
+		if verify:
+			verifier = Verifier(self.numbers)
+			for op in self.optimized:
+				verifier.apply(op)
+			summary["optimized_ok"] = verifier.verdict() is None
+		return summary
+
+
+def analyze_ops(numbers, ops, verify=True):
+	"""
+	Analyses a complete operation list.
+
+	Returns:
+		tuple[dict, list[str]]: The `Analyzer.summary` and the optimised operations.
+	"""
+	analyzer = Analyzer(numbers)
+	for op in ops:
+		analyzer.feed(op)
+	return analyzer.summary(verify), analyzer.optimized
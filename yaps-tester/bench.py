@@ -0,0 +1,181 @@
+import random
+from functools import partial
+from itertools import permutations
+from config import BENCH_SIZES, COLOUR, GRADING, MAX_TEST_SIZE, TEST_COUNT
+from pool import ordered_map
+from runner import INT_MIN, INT_MAX, run_test, run_cases
+from stats import Distribution, wilson_interval
+
+
+def bench_sizes():
+	"""
+	Returns the input sizes to benchmark: `BENCH_SIZES` up to `MAX_TEST_SIZE`, plus
+	`MAX_TEST_SIZE` itself.
+	"""
+	sizes = sorted({s for s in BENCH_SIZES if s <= MAX_TEST_SIZE} | {MAX_TEST_SIZE})
+	return sizes
+
+
+def generate(size, count, seed):
+	"""
+	Yields `count` random inputs of `size` distinct integers.
+
+	Each size gets its own random stream derived from `seed`, so adding or removing
+	a size does not change the inputs generated for the others.
+	"""
+	rng = random.Random(f"{seed}:{size}")
+	for _ in range(count):
+		yield rng.sample(range(INT_MIN, INT_MAX + 1), size)
+
+
+def grading_cap(size):
+	"""
+	Returns the largest operation count that still scores points for `size`, or
+	True (the regular op budget) if there is no grading table for it.
+	"""
+	if size in GRADING:
+		return max(limit for limit, _ in GRADING[size])
+	return True
+
+
+def run_benchmark(size, count=TEST_COUNT, seed=42, jobs=None, recorder=None, **options):
+	"""
+	Runs `count` random inputs of `size` numbers and prints their statistics.
+
+	Unless a `budget` option is given, runs are only stopped once they can no longer
+	score any points, so pass rates cover every threshold.
+
+	Inputs are generated and executed as a stream and results are folded into
+	`stats.Distribution`s, so memory does not grow with `count`.
+
+	Parameters:
+		size (int): Number of values per input.
+		count (int): Number of inputs to run.
+		seed (int): Seed for the input generator.
+		jobs (int | None): Number of worker processes.
+		recorder (ResultWriter | None): Where to store every run's result, if anywhere.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		Distribution: The operation counts of the successful runs.
+	"""
+	print(COLOUR["HEADER"], f"Benchmarking {count} x {size} values (seed {seed})...", COLOUR["ENDC"])
+	options.setdefault("budget", grading_cap(size))
+	ops = Distribution()
+	wall = Distribution(resolution=0.01)
+	failures = 0
+	over_budget = 0
+	results = ordered_map(partial(run_test, False, **options), generate(size, count, seed), jobs)
+	# The generator is deterministic, so the inputs are regenerated alongside the
+	# results rather than kept in memory
+	for i, (numbers, result) in enumerate(zip(generate(size, count, seed), results)):
+		if recorder is not None:
+			recorder.record(f"Bench: {size}", f"{size} values #{i + 1}", numbers, result)
+		if result.status == "budget":
+			over_budget += 1
+			continue
+		if not result.ok:
+			if failures < 3 and result.message:
+				print(result.message)
+			failures += 1
+			continue
+		ops.add(result.ops)
+		if not result.cached:
+			wall.add(result.wall * 1000)
+
+	if failures:
+		print(COLOUR["RED"], f"❌ {failures}/{count} runs failed", COLOUR["ENDC"])
+	if over_budget:
+		print(COLOUR["YELLOW"], f"⚠️  {over_budget}/{count} runs stopped over the op budget", COLOUR["ENDC"])
+	if not ops.n:
+		print(COLOUR["RED"], "⚠️  No successful tests to calculate statistics", COLOUR["ENDC"])
+		return ops
+	print_distribution(size, ops, wall, count)
+	return ops
+
+
+def run_exhaustive(size, jobs=None, recorder=None, **options):
+	"""
+	Runs every permutation of 1..`size` and prints their statistics.
+
+	Goes through `runner.run_cases`, so permutations already run by the suites in
+	this process (or found in the result cache) cost nothing.
+
+	Parameters:
+		size (int): Number of values per input (720 permutations for 6, 5040 for 7).
+		jobs (int | None): Number of worker processes.
+		recorder (ResultWriter | None): Where to store every run's result, if anywhere.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		Distribution: The operation counts of the successful runs.
+	"""
+	inputs = [list(p) for p in permutations(range(1, size + 1))]
+	print(COLOUR["HEADER"], f"Running all {len(inputs)} permutations of {size} values...", COLOUR["ENDC"])
+	options.setdefault("budget", grading_cap(size))
+	ops = Distribution()
+	wall = Distribution(resolution=0.01)
+	failed = []
+	worst = []
+	for i, (numbers, result) in enumerate(zip(inputs, run_cases(False, inputs, jobs, **options))):
+		if recorder is not None:
+			recorder.record(f"Exhaustive: {size}", f"permutation #{i + 1}", numbers, result)
+		if not result.ok:
+			failed.append((numbers, result))
+			continue
+		ops.add(result.ops)
+		if not result.cached:
+			wall.add(result.wall * 1000)
+		worst.append((result.ops, numbers))
+
+	for numbers, result in failed[:3]:
+		print(result.message or f"❌ Failed on: {numbers} ({result.status})")
+	if failed:
+		print(COLOUR["RED"], f"❌ {len(failed)}/{len(inputs)} permutations failed", COLOUR["ENDC"])
+	if not ops.n:
+		print(COLOUR["RED"], "⚠️  No successful tests to calculate statistics", COLOUR["ENDC"])
+		return ops
+	print_distribution(size, ops, wall, len(inputs))
+	worst.sort(key=lambda item: -item[0])
+	for count, numbers in worst[:5]:
+		print(f"{count} ops: {' '.join(map(str, numbers))}")
+	return ops
+
+
+def print_distribution(size, ops, wall, total):
+	"""
+	Prints the summary, histogram and grading pass rates of a benchmark.
+
+	Parameters:
+		size (int): Number of values per input.
+		ops (Distribution): Operation counts of the successful runs.
+		wall (Distribution): Wall-clock times of the successful runs that were
+			measured rather than replayed from the cache, in ms.
+		total (int): Number of runs including failures, used for pass rates.
+	"""
+	low, high = ops.confidence_interval()
+	print(COLOUR["BLUE"], f"RUNS: {ops.n} MEAN: {ops.mean:.2f} (95% CI {low:.2f}-{high:.2f}) STDDEV: {ops.stddev:.2f}", COLOUR["ENDC"])
+	print(
+		COLOUR["BLUE"],
+		f"MIN: {ops.min} p50: {ops.percentile(50)} p90: {ops.percentile(90)}"
+		f" p95: {ops.percentile(95)} p99: {ops.percentile(99)} MAX: {ops.max}",
+		COLOUR["ENDC"],
+	)
+	if wall.n:
+		print(
+			COLOUR["BLUE"],
+			f"TIME p50/p95/max: {wall.percentile(50):.2f}/{wall.percentile(95):.2f}/{wall.max:.2f} ms"
+			+ (f" ({wall.n} of {ops.n} runs measured, the rest cached)" if wall.n < ops.n else ""),
+			COLOUR["ENDC"],
+		)
+	else:
+		print(COLOUR["BLUE"], "TIME: every result came from the cache, nothing measured", COLOUR["ENDC"])
+	for line in ops.histogram():
+		print(line)
+	for limit, points in GRADING.get(size, []):
+		passed = ops.at_most(limit)
+		low, high = wilson_interval(passed, total)
+		print(
+			f"<= {limit} ops ({points} pts): {100 * passed / total:.1f}%"
+			f" (95% CI {100 * low:.1f}-{100 * high:.1f}%)"
+		)
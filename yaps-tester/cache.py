@@ -0,0 +1,119 @@
+import hashlib
+import json
+import os
+import tempfile
+from config import PUSH_SWAP, CHECKER, BONUS_CHECKER, CACHE_DIR, CACHE_MAX_ENTRIES
+
+
+def file_hash(path):
+	"""
+	Returns the SHA-256 hex digest of the file at `path`, or "" if it does not exist.
+	"""
+	if not path or not os.path.isfile(path):
+		return ""
+	digest = hashlib.sha256()
+	with open(path, "rb") as f:
+		for chunk in iter(lambda: f.read(1 << 20), b""):
+			digest.update(chunk)
+	return digest.hexdigest()
+
+
+class ResultCache:
+	"""
+	On-disk cache of push_swap results.
+
+	Entries are keyed by the SHA-256 of the push_swap and checker binaries, the
+	exact input and the run options, limits included, so rebuilding either binary
+	or changing the op budget or time limits invalidates the entries. Only the
+	verdict is stored, never the timings of the run that produced it. Each
+	entry is a small JSON file; the least recently used ones are removed by `prune`
+	once there are more than `max_entries`.
+
+	The binaries are hashed once, when the cache is created, so the object can be
+	handed to worker processes cheaply.
+	"""
+
+	# Only outcomes that depend on the binary and the input alone are cached;
+	# crashes and timeouts may be flaky, so they are always re-run.
+	CACHEABLE = ("ok", "ko", "budget")
+
+	def __init__(self, directory=CACHE_DIR, max_entries=CACHE_MAX_ENTRIES):
+		self.directory = directory
+		self.max_entries = max_entries
+		self.push_swap_hash = file_hash(PUSH_SWAP)
+		self.checker_hash = file_hash(CHECKER)
+		self.bonus_hash = file_hash(BONUS_CHECKER)
+
+	def key(self, numbers, **options):
+		"""
+		Returns the cache key for running `numbers` with the given run_test options
+		and limits (the resolved op budget, not just whether one applies).
+		"""
+		digest = hashlib.sha256()
+		digest.update(self.push_swap_hash.encode())
+		digest.update(self.checker_hash.encode())
+		if options.get("bonus"):
+			digest.update(self.bonus_hash.encode())
+		digest.update(json.dumps(options, sort_keys=True).encode())
+		digest.update(" ".join(str(n) for n in numbers).encode())
+		return digest.hexdigest()
+
+	def _path(self, key):
+		return os.path.join(self.directory, key[:2], key + ".json")
+
+	def get(self, key):
+		"""
+		Returns the stored fields for `key` as a dict, or None on a miss.
+		"""
+		path = self._path(key)
+		try:
+			with open(path) as f:
+				entry = json.load(f)
+		except (OSError, ValueError):
+			return None
+		# Touch the entry so pruning is least-recently-used rather than oldest-written
+		try:
+			os.utime(path)
+		except OSError:
+			pass
+		return entry
+
+	def put(self, key, entry):
+		"""
+		Stores `entry` (a JSON-serialisable dict) under `key`.
+
+		The file is written to a temporary name and renamed into place, so concurrent
+		workers never see a partial entry.
+		"""
+		path = self._path(key)
+		os.makedirs(os.path.dirname(path), exist_ok=True)
+		fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+		with os.fdopen(fd, "w") as f:
+			json.dump(entry, f)
+		os.replace(tmp, path)
+
+	def prune(self):
+		"""
+		Removes the least recently used entries until at most `max_entries` remain.
+
+		Returns:
+			int: The number of entries removed.
+		"""
+		entries = []
+		for root, _, files in os.walk(self.directory):
+			for name in files:
+				path = os.path.join(root, name)
+				try:
+					entries.append((os.stat(path).st_mtime, path))
+				except OSError:
+					pass
+		excess = len(entries) - self.max_entries
+		if excess <= 0:
+			return 0
+		entries.sort()
+		for _, path in entries[:excess]:
+			try:
+				os.remove(path)
+			except OSError:
+				pass
+		return excess
@@ -4,7 +4,43 @@ import platform
 # Config
 # You can change these values to test different scenarios
 MAX_TEST_SIZE			= 500  # Test up to 500 numbers
-TEST_COUNT 				= 5      # Tests per size
+TEST_COUNT 				= 1000   # Tests per size (benchmark mode)
+BENCH_SIZES				= [3, 5, 100, 500]  # Benchmark sizes, capped at MAX_TEST_SIZE
+
+# Limits for a single push_swap run. A run that goes over any of them is killed
+# and reported as failed instead of hanging the suite.
+# OP_BUDGET maps input size to the maximum number of operations; sizes in between
+# use the next larger entry. It is a safety cap against runaway output, ten times
+# the full-marks threshold in GRADING: slower but valid sorts still pass, and are
+# counted per suite as over the threshold.
+OP_BUDGET				= {3: 30, 5: 120, 100: 7000, 500: 55000}
+TIMEOUT					= 10     # Wall-clock seconds
+CPU_LIMIT				= 10     # CPU seconds
+
+# Memory check (memcheck mode): inputs per size and wall-clock seconds per run.
+# Valgrind slows push_swap down 20-50x, hence the separate timeout.
+MEMCHECK_SAMPLE			= 10
+MEM_TIMEOUT				= 120
+
+# Result cache: entries are keyed on the push_swap/checker binaries and the input,
+# so it never needs clearing by hand. Disable with --no-cache.
+CACHE_DIR				= ".yapst_cache"
+CACHE_MAX_ENTRIES		= 20000
+
+# Every run's results are saved here for `compare` (see store.py)
+RESULTS_DIR				= ".yapst_results"
+
+# The launcher that measures push_swap's own CPU time and memory (see launcher.c)
+# is compiled here on first use
+BUILD_DIR				= ".yapst_build"
+
+# Grading thresholds: (maximum operations, points) per input size
+GRADING					= {
+	3: [(3, 5)],
+	5: [(12, 5)],
+	100: [(700, 5), (900, 4), (1100, 3), (1300, 2), (1500, 1)],
+	500: [(5500, 5), (7000, 4), (8500, 3), (10000, 2), (11500, 1)],
+}
 
 # Probably don't need to change these
 PUSH_SWAP 				= "./push_swap"
@@ -19,7 +55,6 @@ elif userOs == "Linux":
     CHECKER = "./checker_linux"
 else:
     CHECKER = None
-print(f"checker: {CHECKER}")
 
 
 # COLOURS
@@ -0,0 +1,124 @@
+import os
+import random
+import sys
+from array import array
+
+CORPUS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "corpus")
+
+INT_MIN = -2147483648
+INT_MAX = 2147483647
+
+
+class Suite:
+	"""
+	A lazily materialised list of (name, test) cases.
+
+	Nothing is built until the suite is first iterated, and cases are yielded one
+	at a time, so importing `tests` costs the same however large the corpus is.
+
+	Parameters:
+		load (callable): A function returning an iterable of (name, test) tuples.
+	"""
+
+	def __init__(self, load):
+		self._load = load
+
+	def __iter__(self):
+		yield from self._load()
+
+	def __len__(self):
+		return sum(1 for _ in self)
+
+
+def _draw(rng, size, distribution):
+	if distribution == "uniform":
+		# Distinct values across the whole int range
+		return rng.sample(range(INT_MIN, INT_MAX + 1), size)
+	if distribution == "mixed":
+		# 70% small values, 30% anywhere in the int range, without duplicates
+		values = set()
+		numbers = []
+		while len(numbers) < size:
+			if rng.random() < 0.7:
+				value = rng.randint(-size * 3, size * 3)
+			else:
+				value = rng.randint(INT_MIN, INT_MAX)
+			if value not in values:
+				values.add(value)
+				numbers.append(value)
+		return numbers
+	if distribution == "permutation":
+		numbers = list(range(1, size + 1))
+		rng.shuffle(numbers)
+		return numbers
+	raise ValueError(f"Unknown distribution: {distribution}")
+
+
+DISTRIBUTIONS = ("uniform", "mixed", "permutation")
+
+
+def generated(label, seed, size, count, distribution="uniform"):
+	"""
+	Returns a Suite of `count` random inputs described by (seed, size, distribution).
+
+	Parameters:
+		label (str): Case name prefix; cases are named "<label> #<n>".
+		seed (int): Seed for the generator. The same descriptor always yields the same cases.
+		size (int): Number of values per case.
+		count (int): Number of cases.
+		distribution (str): One of DISTRIBUTIONS.
+	"""
+	def load():
+		rng = random.Random(seed)
+		for i in range(count):
+			yield f"{label} #{i + 1}", _draw(rng, size, distribution)
+	return Suite(load)
+
+
+def read_packed(path, size):
+	"""
+	Yields the cases stored in a packed corpus file, `size` values at a time.
+
+	Files hold little-endian 32-bit integers back to back, one case after the other.
+	"""
+	with open(path, "rb") as f:
+		while True:
+			numbers = array("i")
+			try:
+				numbers.fromfile(f, size)
+			except EOFError:
+				if len(numbers):
+					raise ValueError(f"{path}: truncated case ({len(numbers)} of {size} values)")
+				return
+			if sys.byteorder != "little":
+				numbers.byteswap()
+			yield numbers.tolist()
+
+
+def write_packed(path, cases):
+	"""
+	Writes `cases` (lists of ints of the same length) to a packed corpus file.
+	"""
+	with open(path, "wb") as f:
+		for numbers in cases:
+			packed = array("i", numbers)
+			if sys.byteorder != "little":
+				packed.byteswap()
+			packed.tofile(f)
+
+
+def packed(label, filename, size):
+	"""
+	Returns a Suite backed by a packed corpus file in CORPUS_DIR.
+
+	Parameters:
+		label (str): Case name prefix; cases are named "<label> #<n>".
+		filename (str): File name inside CORPUS_DIR.
+		size (int): Number of values per case.
+	"""
+	path = os.path.join(CORPUS_DIR, filename)
+
+	def load():
+		for i, numbers in enumerate(read_packed(path, size)):
+			yield f"{label} #{i + 1}", numbers
+	return Suite(load)
@@ -0,0 +1,320 @@
+import hashlib
+import json
+import sys
+import time
+import xml.etree.ElementTree as ET
+from config import COLOUR
+
+# Where events go. Until `add_sink` is called, events are rendered on the console.
+_sinks = []
+_default = None
+
+
+def input_digest(numbers):
+	"""
+	Returns a short fingerprint of an input, used to tell whether two runs of the
+	same case really had the same input.
+	"""
+	return hashlib.sha256(" ".join(str(n) for n in numbers).encode()).hexdigest()[:16]
+
+
+def add_sink(sink):
+	"""
+	Registers an object with a `handle(event)` method (and optionally `close()`)
+	to receive every event.
+	"""
+	_sinks.append(sink)
+
+
+def emit(kind, **fields):
+	"""
+	Sends an event to every sink.
+
+	Events are flat JSON-serialisable dicts with an "event" key naming their kind:
+		run_start (push_swap, checker, shard), suite_start (suite, count),
+		case (id, suite, index, case, size, input and the CaseResult fields),
+		suite_end (suite, total: the cases it has, and the `runner.suite_summary`
+		fields, whose count is the cases that ran; fewer when a run stops early),
+		error_case (suite, case, test, passed, lines),
+		error_suite_end (suite, count, passed), warning (text),
+		coverage (reason, elapsed, done, total, suites: [name, done, total] per
+		suite; only when a run stops early), run_end (elapsed).
+	"""
+	global _default
+	event = {"event": kind, **fields}
+	sinks = _sinks
+	if not sinks:
+		if _default is None:
+			_default = ConsoleRenderer()
+		sinks = [_default]
+	for sink in sinks:
+		sink.handle(event)
+
+
+def close():
+	"""
+	Closes every sink that needs it (e.g. to write the JUnit report).
+	"""
+	for sink in _sinks:
+		if hasattr(sink, "close"):
+			sink.close()
+	_sinks.clear()
+
+
+class ConsoleRenderer:
+	"""
+	Renders events as the tester's coloured console report. Only failures are
+	printed per case, so the cost per passing case is a dict lookup.
+	"""
+
+	def handle(self, event):
+		render = getattr(self, "_" + event["event"], None)
+		if render is not None:
+			render(event)
+
+	def _run_start(self, event):
+		print(COLOUR["HEADER"], "Starting tests...", COLOUR["ENDC"])
+		if event["shard"]:
+			print(COLOUR["HEADER"], "Shard {} of {}".format(*event["shard"]), COLOUR["ENDC"])
+
+	def _suite_start(self, event):
+		print(COLOUR["HEADER"], f"Running {event['suite']} tests...", COLOUR["ENDC"])
+
+	def _warning(self, event):
+		print(f"⚠️  {event['text']}")
+
+	def _error_case(self, event):
+		print(f"Running test: {event['case']} - {event['test']}")
+		for line in event["lines"]:
+			print(line)
+
+	def _error_suite_end(self, event):
+		if event["passed"] == event["count"]:
+			print(COLOUR["GREEN"], "✅ All error-handling tests passed", COLOUR["ENDC"])
+
+	def _case(self, event):
+		if event["status"] == "ok":
+			return
+		if event["message"]:
+			print(event["message"])
+		print(f"❌ Test failed: {event['case']}")
+
+	def _suite_end(self, event):
+		print_summary(event)
+		if event.get("total", event["count"]) > event["count"]:
+			print(
+				COLOUR["YELLOW"],
+				f"⚠️  \"{event['suite']}\" incomplete: ran {event['count']} of {event['total']} cases",
+				COLOUR["ENDC"],
+			)
+			return
+		print(COLOUR["GREEN"], COLOUR["BOLD"], f"✅ \"{event['suite']}\" passed", COLOUR["ENDC"], COLOUR["ENDC"])
+
+	def _coverage(self, event):
+		print_coverage(event)
+
+
+def print_coverage(event):
+	"""
+	Prints how much of a run was done before it stopped early.
+	"""
+	percent = 100 * event["done"] / event["total"] if event["total"] else 0
+	print(
+		COLOUR["YELLOW"],
+		f"⚠️  Stopped ({event['reason']}) after {event['elapsed']:.1f}s:"
+		f" ran {event['done']} of {event['total']} cases ({percent:.1f}%)",
+		COLOUR["ENDC"],
+	)
+	for name, done, total in event["suites"]:
+		if done < total:
+			print(f"  {name}: {done}/{total} cases")
+
+
+def print_summary(summary):
+	"""
+	Prints a suite summary (see `runner.suite_summary`): LOW/HIGH/AVG, resource
+	percentiles of the measured (not cached) runs and, when analysed, the wasted
+	operations.
+	"""
+	if not summary["passed"]:
+		print(COLOUR["RED"], "⚠️  No successful tests to calculate statistics", COLOUR["ENDC"])
+		return
+	print(COLOUR["BLUE"], f"LOW: {summary['low']} HIGH: {summary['high']} AVG: {summary['avg']:.2f}", COLOUR["ENDC"])
+	if summary.get("over_max"):
+		print(
+			COLOUR["YELLOW"],
+			f"⚠️  {summary['over_max']} of {summary['passed']} runs sorted but went over the full-marks threshold for their size",
+			COLOUR["ENDC"],
+		)
+	measured = summary.get("measured", summary["passed"])
+	if not measured:
+		print(COLOUR["BLUE"], "TIME/CPU/RSS: every result came from the cache, nothing measured", COLOUR["ENDC"])
+	else:
+		print(
+			COLOUR["BLUE"],
+			"TIME p50/p95/max: {:.1f}/{:.1f}/{:.1f} ms".format(*summary["wall"]),
+			" CPU p50/p95/max: {:.1f}/{:.1f}/{:.1f} ms".format(*summary["cpu"]),
+			" RSS p50/p95/max: {:.1f}/{:.1f}/{:.1f} MiB".format(*summary["rss"]),
+			f" ({measured} of {summary['passed']} runs measured, the rest cached)" if measured < summary["passed"] else "",
+			COLOUR["ENDC"],
+		)
+	waste = summary.get("waste")
+	if waste:
+		total = waste["ops"]
+		print(
+			COLOUR["BLUE"],
+			f"WASTE: {waste['saveable']} of {total} ops saveable ({100 * waste['saveable'] / total if total else 0:.1f}%):"
+			f" {waste['cancelled']} cancelling,"
+			f" {waste['merged']} mergeable,"
+			f" {waste['rotation']} in long rotations",
+			COLOUR["ENDC"],
+		)
+		if waste["broken"]:
+			print(COLOUR["YELLOW"], f"⚠️  Optimised stream failed to sort in {waste['broken']} cases", COLOUR["ENDC"])
+
+
+class ProgressRenderer:
+	"""
+	Quiet console output for large runs: one progress bar per suite (on a
+	terminal), then a one-line summary and at most `max_failures` failures.
+
+	Parameters:
+		stream (file): Where to draw; the bar is only drawn if it is a terminal.
+		max_failures (int): Failures printed per suite; the rest are only counted.
+	"""
+
+	WIDTH = 30
+
+	def __init__(self, stream=sys.stderr, max_failures=5):
+		self.stream = stream
+		self.tty = stream.isatty()
+		self.max_failures = max_failures
+		self._total = 0
+		self._done = 0
+		self._failures = []
+		self._drawn = 0.0
+
+	def handle(self, event):
+		kind = event["event"]
+		if kind == "suite_start":
+			self._total = event["count"]
+			self._done = 0
+			self._failures = []
+			self._suite = event["suite"]
+		elif kind == "case":
+			self._done += 1
+			if event["status"] != "ok":
+				self._failures.append(event)
+			now = time.monotonic()
+			if self.tty and (now - self._drawn >= 0.1 or self._done == self._total):
+				self._drawn = now
+				self._draw()
+		elif kind == "suite_end":
+			self._clear()
+			self._report(event)
+		elif kind == "error_case" and not event["passed"]:
+			for line in event["lines"]:
+				print(line)
+		elif kind == "error_suite_end":
+			colour = COLOUR["GREEN"] if event["passed"] == event["count"] else COLOUR["RED"]
+			print(colour, f"{event['suite']}: {event['passed']}/{event['count']} passed", COLOUR["ENDC"])
+		elif kind == "warning":
+			print(f"⚠️  {event['text']}")
+		elif kind == "coverage":
+			print_coverage(event)
+
+	def _draw(self):
+		filled = self.WIDTH * self._done // self._total if self._total else self.WIDTH
+		bar = "#" * filled + " " * (self.WIDTH - filled)
+		self.stream.write(f"\r[{bar}] {self._done}/{self._total} {self._suite}")
+		self.stream.flush()
+
+	def _clear(self):
+		if self.tty:
+			self.stream.write("\r\033[K")
+			self.stream.flush()
+
+	def _report(self, event):
+		for failure in self._failures[:self.max_failures]:
+			print(failure["message"] or f"❌ {failure['status']}: {failure['case']}")
+		hidden = len(self._failures) - self.max_failures
+		if hidden > 0:
+			print(f"... and {hidden} more failures")
+		colour = COLOUR["RED"] if self._failures else COLOUR["GREEN"]
+		line = f"{event['suite']}: {event['passed']}/{event['count']} passed"
+		if event.get("total", event["count"]) > event["count"]:
+			if not self._failures:
+				colour = COLOUR["YELLOW"]
+			line += f" (incomplete: ran {event['count']} of {event['total']} cases)"
+		if event["passed"]:
+			line += f", LOW: {event['low']} HIGH: {event['high']} AVG: {event['avg']:.2f}"
+		if event.get("over_max"):
+			line += f", {event['over_max']} over the full-marks threshold"
+		print(colour, line, COLOUR["ENDC"])
+
+
+class JsonLinesSink:
+	"""
+	Writes every event as one JSON object per line, flushed as it happens so that
+	other tools can follow the file while the run is going.
+	"""
+
+	def __init__(self, path):
+		self._file = open(path, "w")
+
+	def handle(self, event):
+		self._file.write(json.dumps(event) + "\n")
+		self._file.flush()
+
+	def close(self):
+		self._file.close()
+
+
+class JUnitSink:
+	"""
+	Collects case and error-case events and writes them as a JUnit XML report
+	(one <testsuite> per suite) when closed.
+	"""
+
+	def __init__(self, path):
+		self.path = path
+		self._suites = {}
+
+	def _suite(self, name):
+		if name not in self._suites:
+			self._suites[name] = ET.Element("testsuite", name=name)
+		return self._suites[name]
+
+	def handle(self, event):
+		kind = event["event"]
+		if kind == "case":
+			case = ET.SubElement(
+				self._suite(event["suite"]),
+				"testcase",
+				classname=event["suite"],
+				name=event["case"],
+				time=f"{event['wall']:.6f}",
+			)
+			ET.SubElement(case, "properties").extend([
+				ET.Element("property", name="ops", value=str(event["ops"])),
+				ET.Element("property", name="size", value=str(event["size"])),
+			])
+			if event["status"] != "ok":
+				failure = ET.SubElement(case, "failure", type=event["status"], message=event["message"] or event["status"])
+				failure.text = event["message"] or ""
+		elif kind == "error_case":
+			case = ET.SubElement(self._suite(event["suite"]), "testcase", classname=event["suite"], name=event["case"])
+			if not event["passed"]:
+				failure = ET.SubElement(case, "failure", type="error", message=event["lines"][0] if event["lines"] else "failed")
+				failure.text = "\n".join(event["lines"])
+
+	def close(self):
+		root = ET.Element("testsuites")
+		for suite in self._suites.values():
+			cases = suite.findall("testcase")
+			suite.set("tests", str(len(cases)))
+			suite.set("failures", str(sum(1 for case in cases if case.find("failure") is not None)))
+			suite.set("time", f"{sum(float(case.get('time', 0)) for case in cases):.6f}")
+			root.append(suite)
+		ET.indent(root)
+		ET.ElementTree(root).write(self.path, encoding="utf-8", xml_declaration=True)
@@ -0,0 +1,215 @@
+import random
+import re
+from functools import partial
+from config import PUSH_SWAP, BONUS_CHECKER, COLOUR
+from pool import ordered_map
+from runner import INT_MIN, INT_MAX, check_error
+
+# Cases per worker task: one push_swap run is short, so batching keeps the pool's
+# per-task overhead from dominating
+FUZZ_BATCH = 50
+
+# What push_swap must accept: an optional sign and ASCII digits, in int range
+INTEGER = re.compile(r"[+-]?[0-9]+")
+
+# Separators the subject does not pin down: implementations may split on them,
+# reject them or read them as part of a number
+UNCLEAR_SPACE = re.compile(r"[\t\n\v\f\r]")
+
+
+def expects_error(args, single_arg=False):
+	"""
+	The oracle: whether push_swap must print "Error" for `args`.
+
+	Every argument must be an integer (an optional "+" or "-", then digits; leading
+	zeros allowed) within int range, and no two may have the same value, so "01 1"
+	and "-0 0" are duplicates. With `single_arg`, an argument may hold several
+	numbers separated by spaces.
+
+	Parameters:
+		args (list[str]): The arguments, as passed to push_swap.
+		single_arg (bool): Whether push_swap supports numbers in one string.
+
+	Returns:
+		bool | None: True if "Error" is required, False if it is forbidden, and None
+		if the subject allows either (empty or blank arguments, tabs and other
+		whitespace, or spaces without `single_arg`) and nothing else is invalid.
+	"""
+	seen = set()
+	unclear = False
+	for arg in args:
+		words = [word for word in arg.split(" ") if word]
+		if UNCLEAR_SPACE.search(arg) or not words or (" " in arg and not single_arg):
+			unclear = True
+			continue
+		for word in words:
+			if not INTEGER.fullmatch(word):
+				return True
+			value = int(word)
+			if value < INT_MIN or value > INT_MAX or value in seen:
+				return True
+			seen.add(value)
+	return None if unclear else False
+
+
+def _padded(rng, value):
+	# A random spelling of `value`: explicit "+" and leading zeros are both valid
+	sign = "-" if value < 0 else rng.choice(["", "", "+"])
+	return sign + "0" * rng.choice([0, 0, 1, 3, 12]) + str(abs(value))
+
+
+def _sign_only(rng):
+	return [rng.choice(["+", "-"])]
+
+
+def _bad_sign(rng):
+	n = str(rng.randint(0, 99))
+	return [rng.choice([
+		"--" + n, "++" + n, "+-" + n, "-+" + n, n + "-", n + "+", n + "-" + n, "-" + n + "+1",
+	])]
+
+
+def _leading_zeros(rng):
+	return [_padded(rng, rng.randint(-1000, 1000)) for _ in range(rng.randint(1, 3))]
+
+
+def _zero(rng):
+	return rng.sample(["0", "-0", "+0", "00", "-000"], rng.randint(1, 2))
+
+
+def _int_bounds(rng):
+	value = rng.choice([INT_MIN, INT_MAX]) + rng.choice([-1, 0, 0, 1])
+	return [_padded(rng, value)]
+
+
+def _huge(rng):
+	digits = rng.choice("123456789") + "".join(rng.choice("0123456789") for _ in range(rng.randint(10, 39)))
+	# Values that wrap to small numbers in a 32- or 64-bit atoi
+	wrapped = rng.choice([2 ** 32, 2 ** 32 + 5, 2 ** 64, 2 ** 64 + 1, 2 ** 63])
+	return [rng.choice(["", "-"]) + rng.choice([digits, str(wrapped)])]
+
+
+def _not_numeric(rng):
+	return [rng.choice([
+		"a", "1a", "a1", "0x1F", "1.0", "1e3", "1,2", "#", "*", "'1'", "inf", "nan",
+		"١", "５", "1\u00a0", "½",
+	])]
+
+
+def _whitespace(rng):
+	numbers = [str(n) for n in rng.sample(range(-50, 50), rng.randint(1, 4))]
+	space = rng.choice([" ", "  ", "\t", "\n", " \t "])
+	joined = space.join(numbers)
+	return [rng.choice([joined, " " + joined, joined + " ", "", " ", "\t"])]
+
+
+def _normalised_duplicate(rng):
+	value = rng.randint(-99, 99)
+	spellings = {_padded(rng, value) for _ in range(4)} | {str(value)}
+	return rng.sample(sorted(spellings), 2) if len(spellings) > 1 else [str(value)] * 2
+
+
+def _split_duplicate(rng):
+	# A number repeated across a single string and a separate argument
+	value = rng.randint(-99, 99)
+	return [f"{value} {rng.randint(100, 200)}", _padded(rng, value)]
+
+
+GENERATORS = {
+	"sign only": _sign_only,
+	"bad sign": _bad_sign,
+	"leading zeros": _leading_zeros,
+	"signed zero": _zero,
+	"int bounds": _int_bounds,
+	"huge number": _huge,
+	"not numeric": _not_numeric,
+	"whitespace": _whitespace,
+	"normalised duplicate": _normalised_duplicate,
+	"split duplicate": _split_duplicate,
+}
+
+
+def fuzz_cases(count, seed=42, single_arg=False):
+	"""
+	Generates malformed and borderline push_swap arguments with their oracle.
+
+	Each case mixes a few ordinary numbers with the output of one generator from
+	GENERATORS, at random positions. Repeated inputs are dropped.
+
+	Parameters:
+		count (int): Cases to generate.
+		seed (int): Seed for the generator.
+		single_arg (bool): Passed on to `expects_error`.
+
+	Returns:
+		list[tuple[str, list[str], bool | None]]: (class, args, should_error) cases.
+	"""
+	rng = random.Random(seed)
+	names = list(GENERATORS)
+	cases = []
+	seen = set()
+	for _ in range(count * 2):
+		if len(cases) == count:
+			break
+		name = rng.choice(names)
+		args = [str(n) for n in rng.sample(range(100, 1000), rng.randint(0, 3))]
+		for arg in GENERATORS[name](rng):
+			args.insert(rng.randint(0, len(args)), arg)
+		if tuple(args) in seen:
+			continue
+		seen.add(tuple(args))
+		cases.append((name, args, expects_error(args, single_arg)))
+	return cases
+
+
+def _run_batch(bonus, batch):
+	problems = []
+	for _, args, should_error in batch:
+		problem, output = check_error([PUSH_SWAP], args, should_error)
+		if problem is None and bonus:
+			problem, _ = check_error([BONUS_CHECKER], args, should_error, stdin=output)
+			if problem:
+				problem = "checker " + problem
+		problems.append(problem)
+	return problems
+
+
+def run_fuzz(count, seed=42, bonus=False, single_arg=False, jobs=None):
+	"""
+	Runs generated argument-parsing cases and reports each kind of failure once.
+
+	Cases run in batches of FUZZ_BATCH across the worker pool. Failures are grouped
+	by class (generator and what went wrong, e.g. "int bounds: missing Error"); each
+	group is printed with its count and its shortest input.
+
+	Parameters:
+		count (int): Cases to generate.
+		seed (int): Seed for the generator.
+		bonus (bool): Whether to check the bonus checker's error handling too.
+		single_arg (bool): Whether push_swap supports numbers in one string.
+		jobs (int | None): Number of worker processes.
+
+	Returns:
+		dict[tuple[str, str], tuple[int, list[str]]]: The (count, shortest input) of
+		each (class, problem) that failed.
+	"""
+	cases = fuzz_cases(count, seed, single_arg)
+	print(COLOUR["HEADER"], f"Fuzzing argument parsing with {len(cases)} inputs (seed {seed})...", COLOUR["ENDC"])
+	batches = [cases[i:i + FUZZ_BATCH] for i in range(0, len(cases), FUZZ_BATCH)]
+	failures = {}
+	for batch, problems in zip(batches, ordered_map(partial(_run_batch, bonus), batches, jobs)):
+		for (name, args, _), problem in zip(batch, problems):
+			if problem is None:
+				continue
+			seen, example = failures.get((name, problem), (0, args))
+			if len(repr(args)) < len(repr(example)):
+				example = args
+			failures[(name, problem)] = (seen + 1, example)
+
+	for (name, problem), (seen, example) in sorted(failures.items(), key=lambda f: -f[1][0]):
+		print(COLOUR["RED"], f"❌ {name}: {problem} ({seen} inputs)", COLOUR["ENDC"])
+		program = BONUS_CHECKER if problem.startswith("checker") else PUSH_SWAP
+		print(f"    e.g. {program} {' '.join(repr(a) for a in example)}")
+	if not failures:
+		print(COLOUR["GREEN"], f"✅ All {len(cases)} inputs handled as expected", COLOUR["ENDC"])
+	return failures
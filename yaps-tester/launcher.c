@@ -0,0 +1,77 @@
+/*
+** Runs a program in a fresh child process and reports that child's own
+** resource usage.
+**
+** Usage: launcher REPORT_FD CPU_LIMIT PROGRAM [ARGS...]
+**
+** A process forked from the Python tester starts with the tester's memory
+** mapped, and on Linux exec() carries that high-water mark into the program's
+** peak RSS. Forked from this small launcher instead, push_swap's figures are its
+** own. Once the child is reaped, "utime stime maxrss" (seconds, seconds, KiB)
+** is written to REPORT_FD, and the launcher exits the way the child did.
+*/
+#include <errno.h>
+#include <fcntl.h>
+#include <signal.h>
+#include <stdio.h>
+#include <stdlib.h>
+#include <sys/resource.h>
+#include <sys/wait.h>
+#include <unistd.h>
+
+int	main(int argc, char **argv)
+{
+	struct rlimit	limit;
+	struct rusage	usage;
+	sigset_t		mask;
+	pid_t			pid;
+	int				status;
+	int				report;
+	long			maxrss;
+
+	if (argc < 4)
+		return (127);
+	report = atoi(argv[1]);
+	fcntl(report, F_SETFD, FD_CLOEXEC);
+	/* SIGXCPU at the soft limit; the hard one, a second later, would be SIGKILL */
+	limit.rlim_cur = strtoul(argv[2], NULL, 10);
+	limit.rlim_max = limit.rlim_cur + 1;
+	pid = fork();
+	if (pid < 0)
+		return (127);
+	if (pid == 0)
+	{
+		if (limit.rlim_cur)
+			setrlimit(RLIMIT_CPU, &limit);
+		execvp(argv[3], argv + 3);
+		_exit(127);
+	}
+	/* Only the child writes to stdout: let the reader see EOF as soon as it exits */
+	close(STDOUT_FILENO);
+	while (wait4(pid, &status, 0, &usage) < 0)
+		if (errno != EINTR)
+			return (127);
+#ifdef __APPLE__
+	maxrss = usage.ru_maxrss / 1024;
+#else
+	maxrss = usage.ru_maxrss;
+#endif
+	dprintf(report, "%ld.%06ld %ld.%06ld %ld\n",
+		(long)usage.ru_utime.tv_sec, (long)usage.ru_utime.tv_usec,
+		(long)usage.ru_stime.tv_sec, (long)usage.ru_stime.tv_usec, maxrss);
+	close(report);
+	if (WIFSIGNALED(status))
+	{
+		/* Die of the same signal, without leaving a core file of our own */
+		limit.rlim_cur = 0;
+		limit.rlim_max = 0;
+		setrlimit(RLIMIT_CORE, &limit);
+		sigemptyset(&mask);
+		sigaddset(&mask, WTERMSIG(status));
+		sigprocmask(SIG_UNBLOCK, &mask, NULL);
+		signal(WTERMSIG(status), SIG_DFL);
+		kill(getpid(), WTERMSIG(status));
+		return (128 + WTERMSIG(status));
+	}
+	return (WEXITSTATUS(status));
+}
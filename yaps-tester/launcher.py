@@ -0,0 +1,38 @@
+import hashlib
+import os
+import subprocess
+import tempfile
+from functools import lru_cache
+from config import BUILD_DIR
+
+# C source of the launcher, shipped next to this file
+SOURCE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "launcher.c")
+
+
+@lru_cache(maxsize=None)
+def launcher_path():
+	"""
+	Returns the path of the compiled launcher (see launcher.c), building it into
+	BUILD_DIR with `$CC` (default `cc`) the first time, or None if it cannot be built.
+
+	The binary is named after the hash of its source, so an updated launcher.c is
+	rebuilt, and built under a temporary name first, so concurrent workers never
+	run a partial file. The answer is remembered for the life of the process.
+	"""
+	with open(SOURCE, "rb") as f:
+		digest = hashlib.sha256(f.read()).hexdigest()[:12]
+	path = os.path.abspath(os.path.join(BUILD_DIR, f"launcher-{digest}"))
+	if os.access(path, os.X_OK):
+		return path
+	tmp = None
+	try:
+		os.makedirs(BUILD_DIR, exist_ok=True)
+		fd, tmp = tempfile.mkstemp(dir=BUILD_DIR, suffix=".tmp")
+		os.close(fd)
+		subprocess.run([os.environ.get("CC", "cc"), "-O2", "-o", tmp, SOURCE], check=True, capture_output=True)
+		os.replace(tmp, path)
+	except (OSError, subprocess.CalledProcessError):
+		if tmp is not None and os.path.exists(tmp):
+			os.remove(tmp)
+		return None
+	return path
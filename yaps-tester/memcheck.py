@@ -0,0 +1,185 @@
+import os
+import re
+import subprocess
+import tempfile
+import xml.etree.ElementTree as ET
+from functools import partial
+from typing import NamedTuple
+from config import PUSH_SWAP, COLOUR, MEM_TIMEOUT
+from pool import ordered_map
+
+# How many frames of a stack identify a leak; deeper frames are usually libc startup
+STACK_DEPTH = 8
+
+
+class MemIssue(NamedTuple):
+	"""
+	One leak or memory error reported for a run.
+
+	kind is Valgrind's error kind ("Leak_DefinitelyLost", "InvalidRead", ...) or
+	"Leak" for the leaks fallback; stack is a tuple of "function (file:line)" frames.
+	"""
+	kind: str
+	what: str
+	bytes: int
+	blocks: int
+	stack: tuple
+
+	@property
+	def leak(self) -> bool:
+		return self.kind.startswith("Leak")
+
+
+class MemResult(NamedTuple):
+	"""
+	Outcome of one push_swap run under the memory tester.
+
+	status is "ok", "leak", "error" (invalid reads/writes, ...) or "failed" (the
+	memory tester timed out or produced no readable report).
+	"""
+	status: str
+	issues: tuple = ()
+	message: str = ""
+
+
+def _frame(frame):
+	fn = frame.findtext("fn") or frame.findtext("obj") or frame.findtext("ip") or "?"
+	if frame.findtext("file"):
+		return f"{fn} ({frame.findtext('file')}:{frame.findtext('line')})"
+	return fn
+
+
+def parse_valgrind_xml(source):
+	"""
+	Parses a Valgrind `--xml=yes` report.
+
+	Parameters:
+		source (str | file): Path or file object of the XML report.
+
+	Returns:
+		list[MemIssue]: One entry per <error> element, leaks included.
+
+	Raises:
+		xml.etree.ElementTree.ParseError: If the report is malformed or truncated.
+	"""
+	issues = []
+	for error in ET.parse(source).getroot().iter("error"):
+		xwhat = error.find("xwhat")
+		if xwhat is not None:
+			what = xwhat.findtext("text", "")
+			size = int(xwhat.findtext("leakedbytes", "0"))
+			blocks = int(xwhat.findtext("leakedblocks", "0"))
+		else:
+			what = error.findtext("what", "")
+			size = blocks = 0
+		stack = error.find("stack")
+		frames = tuple(_frame(f) for f in stack.iter("frame"))[:STACK_DEPTH] if stack is not None else ()
+		issues.append(MemIssue(error.findtext("kind", "?"), what, size, blocks, frames))
+	return issues
+
+
+def _status(issues):
+	if any(not issue.leak for issue in issues):
+		return "error"
+	if issues:
+		return "leak"
+	return "ok"
+
+
+def _run_valgrind(mem, args):
+	fd, path = tempfile.mkstemp(prefix="yapst-vg-", suffix=".xml")
+	os.close(fd)
+	try:
+		cmd = mem.split() + ["--show-leak-kinds=all", "--xml=yes", f"--xml-file={path}", PUSH_SWAP] + args
+		subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=MEM_TIMEOUT)
+		issues = parse_valgrind_xml(path)
+	except subprocess.TimeoutExpired:
+		return MemResult("failed", message=f"Memory test timed out after {MEM_TIMEOUT}s")
+	except ET.ParseError as e:
+		return MemResult("failed", message=f"Unreadable Valgrind report ({e})")
+	finally:
+		os.remove(path)
+	return MemResult(_status(issues), tuple(issues))
+
+
+def _run_leaks(mem, args):
+	# macOS `leaks` has no XML output: read its summary line instead
+	try:
+		result = subprocess.run(mem.split() + [PUSH_SWAP] + args, capture_output=True, text=True, timeout=MEM_TIMEOUT)
+	except subprocess.TimeoutExpired:
+		return MemResult("failed", message=f"Memory test timed out after {MEM_TIMEOUT}s")
+	match = re.search(r"(\d+) leaks? for (\d+) total leaked bytes", result.stdout)
+	if match is None:
+		return MemResult("failed", message="No leaks summary in the output")
+	count, size = int(match.group(1)), int(match.group(2))
+	if not count:
+		return MemResult("ok")
+	return MemResult("leak", (MemIssue("Leak", match.group(0), size, count, ()),))
+
+
+def run_memcheck(mem, numbers):
+	"""
+	Runs push_swap on `numbers` under the memory tester.
+
+	Parameters:
+		mem (str): The command prefix returned by `setup.set_mem_tester`.
+		numbers (list[int | str]): The input.
+
+	Returns:
+		MemResult: The run's leaks and memory errors.
+	"""
+	args = [str(n) for n in numbers]
+	if mem.split()[0] == "valgrind":
+		return _run_valgrind(mem, args)
+	return _run_leaks(mem, args)
+
+
+def memcheck_class(mem, label, inputs, jobs=None):
+	"""
+	Runs a group of inputs under the memory tester and prints the distinct issues.
+
+	Runs go through the worker pool. The group stops at the first run that proves
+	a leak, since more runs of the same size would mostly report the same stacks.
+	Identical issues (same kind and stack) found in several runs are reported once,
+	with their run count.
+
+	Parameters:
+		mem (str): The command prefix returned by `setup.set_mem_tester`.
+		label (str): Name of the group, e.g. "500 values".
+		inputs (list[list[int | str]]): The inputs to run.
+		jobs (int | None): Number of worker processes.
+
+	Returns:
+		bool: True if no run leaked, hit a memory error or failed.
+	"""
+	print(COLOUR["HEADER"], f"Memory check: {label}...", COLOUR["ENDC"])
+	issues = {}
+	runs = 0
+	failed = 0
+	leaked = False
+	results = ordered_map(partial(run_memcheck, mem), inputs, jobs)
+	for numbers, result in zip(inputs, results):
+		runs += 1
+		if result.status == "failed":
+			failed += 1
+			print(f"❌ {result.message} on: {numbers}")
+		for issue in result.issues:
+			key = (issue.kind, issue.stack or issue.what)
+			first, count = issues.get(key, (issue, 0))
+			issues[key] = (first, count + 1)
+		if any(issue.leak for issue in result.issues):
+			leaked = runs < len(inputs)
+			results.close()
+			break
+
+	for issue, count in issues.values():
+		detail = f"{issue.bytes} bytes in {issue.blocks} blocks" if issue.leak else issue.what
+		print(COLOUR["RED"], f"❌ {issue.kind}: {detail} ({count} of {runs} runs)", COLOUR["ENDC"])
+		for i, frame in enumerate(issue.stack):
+			print(f"    {'at' if i == 0 else 'by'} {frame}")
+	if leaked:
+		print(COLOUR["YELLOW"], f"⚠️  Leak found, skipping the remaining {label} inputs", COLOUR["ENDC"])
+	if not issues and not failed:
+		print(COLOUR["GREEN"], f"✅ No leaks or memory errors in {runs} runs", COLOUR["ENDC"])
+		return True
+	return False
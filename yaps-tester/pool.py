@@ -0,0 +1,88 @@
+import os
+import atexit
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+_executors = {}
+
+
+def default_jobs() -> int:
+	"""
+	Returns the default worker count: one per available core.
+	"""
+	return os.cpu_count() or 1
+
+
+def get_executor(jobs):
+	"""
+	Returns a process pool with `jobs` workers, reusing it across calls.
+
+	The pool is created on first use and shut down when the interpreter exits, so
+	consecutive suites share the same warm workers.
+	"""
+	if jobs not in _executors:
+		_executors[jobs] = ProcessPoolExecutor(max_workers=jobs)
+	return _executors[jobs]
+
+
+@atexit.register
+def _shutdown():
+	for executor in _executors.values():
+		executor.shutdown(wait=False, cancel_futures=True)
+	_executors.clear()
+
+
+def _result(future, deadline):
+	if deadline is None:
+		return future.result()
+	try:
+		return future.result(timeout=max(deadline - time.time(), 0))
+	except FutureTimeout:
+		raise TimeoutError("deadline passed") from None
+
+
+def ordered_map(func, items, jobs=None, deadline=None):
+	"""
+	Applies `func` to every item and yields the results in input order.
+
+	Parameters:
+		func (callable): A picklable (module-level) function taking one item.
+		items (iterable): The inputs. Consumed lazily, so generators are fine.
+		jobs (int | None): Worker count. None uses every core, 1 runs serially in-process.
+		deadline (float | None): A `time.time()` after which no more results are
+			waited for.
+
+	Yields:
+		The result of `func(item)` for each item, in the same order as `items`.
+
+	Raises:
+		TimeoutError: If `deadline` passes before the next result is ready. Queued
+			work is cancelled, but calls already running are left to finish, so
+			`func` should bound its own run time by the same deadline.
+
+	Only a bounded window of items is in flight at once, so memory does not grow
+	with the length of `items`.
+	"""
+	if jobs is None:
+		jobs = default_jobs()
+	if jobs <= 1:
+		for item in items:
+			if deadline is not None and time.time() >= deadline:
+				raise TimeoutError("deadline passed")
+			yield func(item)
+		return
+
+	executor = get_executor(jobs)
+	window = deque()
+	try:
+		for item in items:
+			window.append(executor.submit(func, item))
+			if len(window) >= jobs * 4:
+				yield _result(window.popleft(), deadline)
+		while window:
+			yield _result(window.popleft(), deadline)
+	finally:
+		# Reached on early exit (break / generator close): drop queued work
+		for future in window:
+			future.cancel()
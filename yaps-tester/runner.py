@@ -1,152 +1,724 @@
+import errno
+import os
+import resource
+import signal
 import subprocess
-from config import PUSH_SWAP, CHECKER, COLOUR
+import threading
+import time
+from functools import partial
+from typing import NamedTuple, Optional
+from config import PUSH_SWAP, CHECKER, BONUS_CHECKER, OP_BUDGET, TIMEOUT, CPU_LIMIT, GRADING
+from pool import ordered_map
+from stats import spread
+from events import emit, input_digest
+from verifier import Verifier
+from analyze import Analyzer
+from launcher import launcher_path
 import platform
 
-def run_test(bonus, numbers):
+# ru_maxrss is in KiB on Linux but in bytes on macOS
+RSS_UNIT = 1024 if platform.system() == "Darwin" else 1
+# Read size when piping push_swap into the checker
+PIPE_CHUNK = 1 << 16
+# The CaseResult fields kept in the result cache
+CACHED_FIELDS = ("status", "ops", "message", "analysis")
+
+
+class CaseResult(NamedTuple):
+	"""
+	Outcome of a single push_swap run.
+
+	status is one of "ok", "ko", "crash", "budget" (too many operations) or "timeout"
+	(wall-clock or CPU limit hit); message describes the failure, if any. The timing
+	fields describe the push_swap process only, as reported by wait4() in the
+	launcher that started it (see `launcher.launcher_path`). A result
+	replayed from the cache is `cached` and has no timings: they are not measured
+	again, so they are left out of every timing statistic.
+	"""
+	status: str
+	ops: int = 0
+	message: Optional[str] = None
+	wall: float = 0.0     # Wall-clock seconds
+	utime: float = 0.0    # User CPU seconds
+	stime: float = 0.0    # System CPU seconds
+	maxrss: int = 0       # Peak resident set size, KiB
+	analysis: Optional[dict] = None  # analyze.Analyzer summary, when requested
+	cached: bool = False  # Replayed from the result cache, without timings
+
+	@property
+	def ok(self) -> bool:
+		return self.status == "ok"
+
+
+def op_budget(size):
+	"""
+	Returns the maximum number of operations allowed for an input of `size` numbers.
+
+	Sizes between the entries of `config.OP_BUDGET` use the next larger entry. Sizes
+	past the largest entry scale its budget quadratically, which keeps runs bounded
+	without failing any reasonable algorithm.
+	"""
+	for limit in sorted(OP_BUDGET):
+		if size <= limit:
+			return OP_BUDGET[limit]
+	largest = max(OP_BUDGET)
+	return OP_BUDGET[largest] * (size * size) // (largest * largest)
+
+
+def max_score_limit(size):
+	"""
+	Returns the most operations an input of `size` numbers may take for full marks
+	(the first GRADING threshold), or None if there is no grading table for it.
+	"""
+	if size in GRADING:
+		return GRADING[size][0][0]
+	return None
+
+
+def resolve_budget(budget, size):
+	"""
+	Returns the operation limit a run of `size` numbers gets from a `budget` option
+	(True, False or an explicit limit), or None for no limit.
+	"""
+	if budget is True:
+		return op_budget(size)
+	return budget or None
+
+
+def _kill(proc):
+	# push_swap may be a wrapper script: kill its whole process group so no
+	# grandchild keeps the stdout pipe open
+	try:
+		os.killpg(proc.pid, signal.SIGKILL)
+	except ProcessLookupError:
+		pass
+
+
+def _exit_reason(returncode):
+	# How a process ended abnormally: "SIGSEGV", "signal 99" or "exit code 2"
+	if returncode < 0:
+		try:
+			return signal.Signals(-returncode).name
+		except ValueError:
+			return f"signal {-returncode}"
+	return f"exit code {returncode}"
+
+
+def _time_left(deadline):
+	# Seconds a run may take: TIMEOUT, or less if `deadline` (a time.time()) is sooner
+	if deadline is None:
+		return TIMEOUT
+	return min(TIMEOUT, deadline - time.time())
+
+
+def _limit_cpu():
+	# Runs in the child between fork and exec: SIGXCPU once CPU_LIMIT is used up.
+	# At the hard limit the kernel sends SIGKILL instead, so it is one second later.
+	resource.setrlimit(resource.RLIMIT_CPU, (CPU_LIMIT, CPU_LIMIT + 1))
+
+
+def run_test(bonus, numbers, cross_check=False, budget=True, cache=None, pipe=False, analyze=False, push_swap=None, single_arg=False, deadline=None):
 	"""
 	Executes a test for the push_swap program using the provided list of numbers.
 
+	push_swap's output is streamed: operations are counted and verified in-process
+	by `verifier.Verifier` as they arrive. The run is killed as soon as it prints
+	more than `op_budget(len(numbers))` operations, runs longer than
+	`config.TIMEOUT` seconds (or past `deadline`) or uses more than
+	`config.CPU_LIMIT` seconds of CPU. The checker binary is only started when
+	`cross_check` is set.
+
+	With `pipe`, the in-process verifier is skipped: push_swap's stdout is copied
+	chunk by chunk into the checker (and bonus checker) as it is produced, and only
+	newlines are counted, so the operations are never decoded or held. The checkers
+	are killed along with push_swap when the run times out.
+
+	With a `cache`, a result stored for the same binaries, input, options and limits
+	(the resolved op budget, TIMEOUT and CPU_LIMIT) is returned without running
+	anything, marked `cached` and without timings. The cache only knows
+	`config.PUSH_SWAP`, so it is not used when another `push_swap` binary is given.
+
+	Nothing is printed here so that runs can happen in worker processes; the caller
+	reports `message` in whatever order it needs.
+
 	Parameters:
 		bonus (bool): Whether to enable bonus checker verification.
 		numbers (list[int]): A list of integers to be sorted by the push_swap program.
+		cross_check (bool): Whether to also verify the output with the external checker.
+		budget (bool | int): Whether to enforce the operation budget, or an explicit limit.
+		cache (ResultCache | None): The result cache to consult and fill, if any.
+		pipe (bool): Whether to verify with the checker binary through a pipe instead.
+		analyze (bool): Whether to look for wasted operations (see `analyze.Analyzer`).
+			Ignored with `pipe`, which never decodes the operations.
+		push_swap (str | None): The push_swap binary to run. Defaults to `config.PUSH_SWAP`.
+		single_arg (bool): Whether to pass the input as one space-separated argument
+			(`./push_swap "3 1 2"`) instead of one argument per number.
+		deadline (float | None): A `time.time()` at which the run is killed (as a
+			"timeout") even if TIMEOUT has not passed; a run not started by then
+			is not started at all.
+
+	Returns:
+		CaseResult: The status and number of operations performed by the push_swap program.
+	"""
+	if cache is None or push_swap is not None:
+		return _run_push_swap(bonus, numbers, cross_check, budget, pipe, analyze, push_swap or PUSH_SWAP, single_arg, deadline)
+
+	key = cache.key(
+		numbers,
+		bonus=bonus,
+		cross_check=cross_check,
+		budget=resolve_budget(budget, len(numbers)),
+		pipe=pipe,
+		analyze=analyze,
+		single_arg=single_arg,
+		timeout=TIMEOUT,
+		cpu_limit=CPU_LIMIT,
+	)
+	entry = cache.get(key)
+	if entry is not None:
+		return CaseResult(**{field: entry.get(field) for field in CACHED_FIELDS}, cached=True)
+	result = _run_push_swap(bonus, numbers, cross_check, budget, pipe, analyze, PUSH_SWAP, single_arg, deadline)
+	if result.status in cache.CACHEABLE:
+		# Timings are measurements of this run, not properties of the input
+		cache.put(key, {field: getattr(result, field) for field in CACHED_FIELDS})
+	return result
+
+
+def _tee(proc, checkers, limit):
+	"""
+	Copies push_swap's stdout into the stdin of every checker, counting newlines.
+
+	Works on raw byte chunks: the operations are never decoded or kept. The bytes
+	pass through here rather than over a pipe from push_swap to the checker because
+	the op count and budget need to see them, and a direct pipe would take a third
+	process to count them. A write to a checker that stopped reading blocks until
+	the run's timer kills the checkers.
 
 	Returns:
-		int: The number of operations performed by the push_swap program if successful.
-		bool: False if the test fails or the program crashes.
+		tuple[int, bool]: The number of operations, and whether `limit` was exceeded.
 	"""
+	op_count = 0
+	fd = proc.stdout.fileno()
+	sinks = [checker.stdin for checker in checkers]
+	while True:
+		chunk = os.read(fd, PIPE_CHUNK)
+		if not chunk:
+			return op_count, False
+		op_count += chunk.count(b"\n")
+		if limit is not None and op_count > limit:
+			_kill(proc)
+			return op_count, True
+		for sink in list(sinks):
+			try:
+				sink.write(chunk)
+			except BrokenPipeError:
+				# The checker gave up early (e.g. on an invalid operation); its
+				# verdict is read once push_swap is done
+				sinks.remove(sink)
+
+
+def _run_push_swap(bonus, numbers, cross_check, budget, pipe, analyze, push_swap, single_arg, deadline=None):
+	timeout = _time_left(deadline)
+	if timeout <= 0:
+		return CaseResult("timeout", 0, f"❌ Time budget used up before running: {numbers}")
 	args = [str(n) for n in numbers]
-	cmd_push = [PUSH_SWAP] + args
+	if single_arg:
+		args = [" ".join(args)]
+	cmd_push = [push_swap] + args
 	cmd_check = [CHECKER] + args
+	cmd_bonus = [BONUS_CHECKER] + args
+	limit = resolve_budget(budget, len(numbers))
+	# The checkers need the whole output, so only keep it when one will run
+	# after push_swap rather than alongside it
+	keep = [] if (cross_check or bonus) and not pipe else None
+
+	# push_swap is forked from the launcher, which reports its resource usage on
+	# `report`; without one it is forked from this worker, which sets its CPU limit
+	launcher = launcher_path()
+	popen_options = {"preexec_fn": _limit_cpu}
+	report = None
+	if launcher is not None:
+		report, report_w = os.pipe()
+		cmd_push = [launcher, str(report_w), str(CPU_LIMIT)] + cmd_push
+		popen_options = {"pass_fds": (report_w,)}
 
+	verifier = Verifier(int(n) for n in numbers)
+	analyzer = Analyzer(int(n) for n in numbers) if analyze and not pipe else None
+	checkers = {}
+	op_count = 0
+	over_budget = False
+	start = time.perf_counter()
 	try:
-		# Run push_swap and count operations
-		result = subprocess.run(cmd_push, capture_output=True, text=True, check=True)
-		ops = result.stdout.splitlines()
-		op_count = len(ops)
-
-		# print(f"Test: {numbers} Running command: {cmd_push} with {op_count} operations")
-		# print(f"Output: {result.stdout}")
-		# print(f"Error: {result.stderr}")
-		# print(f"Return code: {result.returncode}")
-
-		# Verify with checker
-		checker = subprocess.run(cmd_check, input=result.stdout, capture_output=True, text=True)
+		proc = subprocess.Popen(
+			cmd_push,
+			stdout=subprocess.PIPE,
+			stderr=subprocess.DEVNULL,
+			text=not pipe,
+			# Anything that is not UTF-8 becomes an invalid operation, not a crash
+			errors=None if pipe else "replace",
+			start_new_session=True,
+			**popen_options,
+		)
+	except OSError as e:
+		if report is not None:
+			os.close(report)
+		if e.errno != errno.E2BIG:
+			raise
+		return CaseResult("crash", 0, f"❌ Input of {len(numbers)} values is too large for the command line ({e.strerror})")
+	finally:
+		if report is not None:
+			os.close(report_w)
+	timed_out = threading.Event()
+
+	def expire():
+		# The checkers too: one that stops reading would block `_tee` forever
+		timed_out.set()
+		for process in [proc] + list(checkers.values()):
+			_kill(process)
+
+	timer = threading.Timer(timeout, expire)
+	try:
+		if pipe:
+			# push_swap -> tee -> checker(s), all running at the same time
+			for name, cmd in [("Checker", cmd_check)] + ([("Bonus checker", cmd_bonus)] if bonus else []):
+				checkers[name] = subprocess.Popen(
+					cmd,
+					stdin=subprocess.PIPE,
+					stdout=subprocess.PIPE,
+					stderr=subprocess.DEVNULL,
+					start_new_session=True,
+				)
+		timer.start()
+		if pipe:
+			op_count, over_budget = _tee(proc, checkers.values(), limit)
+		else:
+			# Run push_swap and count operations as they are printed
+			for line in proc.stdout:
+				op_count += 1
+				if limit is not None and op_count > limit:
+					over_budget = True
+					_kill(proc)
+					break
+				op = line.rstrip("\n")
+				verifier.apply(op)
+				if analyzer is not None:
+					analyzer.feed(op)
+				if keep is not None:
+					keep.append(line)
+		proc.stdout.close()
+		# wait4 reaps the child and hands back its resource usage in one call
+		_, status, usage = os.wait4(proc.pid, 0)
+		returncode = proc.returncode = os.waitstatus_to_exitcode(status)
+		wall = time.perf_counter() - start
+	finally:
+		timer.cancel()
+		if proc.returncode is None:
+			_kill(proc)
+			proc.wait()
+		reported = _read_report(report) if report is not None else None
+		verdicts = {name: _close_checker(checker) for name, checker in checkers.items()}
+
+	timing = {
+		"wall": wall,
+		"utime": usage.ru_utime,
+		"stime": usage.ru_stime,
+		"maxrss": usage.ru_maxrss // RSS_UNIT,
+	}
+	if reported is not None:
+		timing.update(reported)
+	if analyzer is not None:
+		timing["analysis"] = analyzer.summary()
+
+	if over_budget:
+		return CaseResult("budget", op_count, f"❌ Budget exceeded at op {op_count} (limit {limit}) on: {numbers}", **timing)
+	if returncode == -signal.SIGXCPU:
+		return CaseResult("timeout", op_count, f"❌ CPU limit of {CPU_LIMIT}s exceeded on: {numbers}", **timing)
+	if timed_out.is_set():
+		if timeout < TIMEOUT:
+			return CaseResult("timeout", op_count, f"❌ Stopped at the time budget after {timeout:.1f}s on: {numbers}", **timing)
+		return CaseResult("timeout", op_count, f"❌ Timed out after {TIMEOUT}s on: {numbers}", **timing)
+	if returncode != 0:
+		return CaseResult("crash", op_count, f"❌ Crashed ({_exit_reason(returncode)}) on: {numbers}", **timing)
+
+	if pipe:
+		for name, verdict in verdicts.items():
+			if verdict != "OK":
+				return CaseResult("ko", op_count, f"❌ {name} failed on: {numbers} ({verdict or 'no verdict'})", **timing)
+		return CaseResult("ok", op_count, **timing)
+
+	reason = verifier.verdict()
+	if reason:
+		return CaseResult("ko", op_count, f"❌ Failed on: {numbers} ({reason})", **timing)
+
+	output = "".join(keep) if keep is not None else ""
+	# Cross-check with the reference checker if requested
+	if cross_check:
+		checker = subprocess.run(cmd_check, input=output, capture_output=True, text=True)
 		if "KO" in checker.stdout:
-			print(f"❌ Failed on: {numbers}")
-			return False
+			return CaseResult("ko", op_count, f"❌ Checker failed on: {numbers}", **timing)
+
+	# Verify with bonus checker if enabled
+	if bonus:
+		checker_bonus = subprocess.run(cmd_bonus, input=output, capture_output=True, text=True)
+		if "KO" in checker_bonus.stdout:
+			return CaseResult("ko", op_count, f"❌ Bonus checker failed on: {numbers}", **timing)
+
+	return CaseResult("ok", op_count, **timing)
 
-		# Verify with bonus checker if enabled
-		if bonus:
-			checker_bonus = subprocess.run(cmd_check, input=result.stdout, capture_output=True, text=True)
-			if "KO" in checker_bonus.stdout:
-				print(f"❌ Bonus checker failed on: {numbers}")
-				return False
 
-		return op_count
-	except subprocess.CalledProcessError as e:
-		# print(f"⚠️  Crash on: {numbers}")
-		# print(f"Running command: {cmd_push}")
-		# print(f"Error: {e.stderr}")  # Use e.stderr instead of result.stderr
-		# print(f"Return code: {e.returncode}")  # Use e.returncode
-		return False
+def _read_report(fd):
+	# The launcher's "utime stime maxrss" line, as CaseResult fields; None if it was
+	# killed (e.g. on a timeout) before writing it
+	with os.fdopen(fd) as f:
+		fields = f.read().split()
+	if len(fields) != 3:
+		return None
+	return {"utime": float(fields[0]), "stime": float(fields[1]), "maxrss": int(fields[2])}
 
 
-def run_error_cases(bonus, mem, test_name, test_cases):
+def _close_checker(checker):
+	# Close its stdin and collect the checker's verdict ("OK", "KO", ...)
+	try:
+		output, _ = checker.communicate(timeout=TIMEOUT)
+	except subprocess.TimeoutExpired:
+		checker.kill()
+		checker.communicate()
+		return "checker timed out"
+	return output.decode(errors="replace").strip()
+
+
+def check_error(cmd, args, should_error, stdin=None, timeout=TIMEOUT):
 	"""
-	Executes error-handling test cases to verify the program's robustness.
+	Runs a program on arguments that may be invalid and checks its error handling.
+
+	Parameters:
+		cmd (list[str]): The program to run, e.g. [PUSH_SWAP].
+		args (list[str]): Its arguments, passed as-is.
+		should_error (bool | None): Whether "Error" is expected on stderr; None if
+			either answer is acceptable, so only crashes and timeouts count.
+		stdin (str | None): Text to feed on standard input.
+		timeout (float): Seconds after which the program (and anything it started)
+			is killed.
+
+	Returns:
+		tuple[str | None, str]: What went wrong ("missing Error", "unexpected Error",
+		"crashed (SIGSEGV)", "timed out"), or None, and the program's standard output.
 	"""
-	print(COLOUR["HEADER"], f"Running {test_name} tests...", COLOUR["ENDC"])
+	proc = subprocess.Popen(
+		cmd + args,
+		stdin=subprocess.PIPE,
+		stdout=subprocess.PIPE,
+		stderr=subprocess.PIPE,
+		text=True,
+		start_new_session=True,
+	)
+	try:
+		stdout, stderr = proc.communicate(stdin, timeout=max(timeout, 0))
+	except subprocess.TimeoutExpired:
+		_kill(proc)
+		proc.communicate()
+		return "timed out", ""
+	if proc.returncode < 0:
+		return f"crashed ({_exit_reason(proc.returncode)})", stdout
+	if should_error is not None and ("Error" in stderr) != should_error:
+		return "missing Error" if should_error else "unexpected Error", stdout
+	return None, stdout
+
+
+def run_error_case(mem, case, bonus=False, deadline=None):
+	"""
+	Runs one error-handling case on push_swap (and the bonus checker, fed push_swap's
+	output), optionally under the memory tester.
+
+	Parameters:
+		mem (str): The memory tester command prefix, or "" to skip the memory check.
+		case (tuple): (name, test, should_error) as found in `tests.ERROR_HANDLING`.
+			test is a string split on whitespace, or a list of arguments passed as-is.
+		bonus (bool): Whether to check the bonus checker too.
+		deadline (float | None): A `time.time()` at which runs are killed even if
+			TIMEOUT has not passed.
+
+	Returns:
+		tuple[bool, list[str]]: Whether the case passed, and the lines to report for it.
+	"""
+	name, test, should_error = case
+	args = _parse_case(test)
 	cmd_push = [PUSH_SWAP]
-	cmd_bonus = [CHECKER]
+	lines = []
 
+	timeout = _time_left(deadline)
+	problem, output = check_error(cmd_push, args, should_error, timeout=timeout)
+	if problem == "timed out":
+		lines.append(f"❌ Timed out after {timeout:g}s: {name} - {test}")
+		return False, lines
+	if problem:
+		lines.append(f"❌ Test failed: {name} - {test} ({problem})")
+		return False, lines
+	if bonus:
+		problem, _ = check_error([BONUS_CHECKER], args, should_error, stdin=output, timeout=_time_left(deadline))
+		if problem:
+			lines.append(f"❌ Error checker test failed: {name} - {test} ({problem})")
+			return False, lines
 	if mem:
-		# print(f"memory tester: {mem}")
 		mem_cmd_push = mem.split() + cmd_push
-		# print(f"cmd_push with memory tester: {mem_cmd_push}")
-
-	for name, test, should_error in test_cases:
-		print(f"Running test: {name} - {test}")
-		result = subprocess.run(cmd_push + test.split(), capture_output=True, text=True)
-		# print(f"test cmd: {cmd_push + test.split()}")
-		if ("Error" in result.stderr) != should_error:
-			print(f"❌ Test failed: {name} - {test}")
-			return False
-		if mem:
-			# print(f"Memory test cmd: {mem_cmd_push + test.split()}")
-			try:
-				mem_result = subprocess.run(
-					mem_cmd_push + test.split(),
-					capture_output=True,
-					text=True,
-					timeout=30
-				)
-				# print("Valgrind Output (stdout):", mem_result.stdout)
-				# print("Valgrind Output (stderr):", mem_result.stderr)
-				# print("Valgrind Return Code:", mem_result.returncode)
+		try:
+			mem_result = subprocess.run(
+				mem_cmd_push + args,
+				capture_output=True,
+				text=True,
+				timeout=30
+			)
+			# print("Valgrind Output (stdout):", mem_result.stdout)
+			# print("Valgrind Output (stderr):", mem_result.stderr)
+			# print("Valgrind Return Code:", mem_result.returncode)
+
+			# Check if the program exited with an expected error
+			if "Error" in mem_result.stderr and should_error:
+				lines.append(f"✅ Expected error detected for: {name} - {test}")
+				return True, lines  # Skip further checks for this test case
+
+			# Check Valgrind output for memory leaks
+			if "All heap blocks were freed" in mem_result.stderr and "ERROR SUMMARY: 0 errors" in mem_result.stderr:
+				lines.append(f"✅ No memory leaks detected for: {name} - {test}")
+			elif mem_result.returncode != 0:
+				lines.append(f"❌ Memory leak detected for: {name} - {test}")
+				lines.append(mem_result.stderr)
+				return False, lines
+		except subprocess.TimeoutExpired:
+			lines.append(f"❌ Memory test timed out for: {name} - {test}")
+			return False, lines
+	return True, lines
 
-				# Check if the program exited with an expected error
-				if "Error" in mem_result.stderr and should_error:
-					print(f"✅ Expected error detected for: {name} - {test}")
-					continue  # Skip further checks for this test case
 
-				# Check Valgrind output for memory leaks
-				if "All heap blocks were freed" in mem_result.stderr and "ERROR SUMMARY: 0 errors" in mem_result.stderr:
-					print(f"✅ No memory leaks detected for: {name} - {test}")
-				elif mem_result.returncode != 0:
-					print(f"❌ Memory leak detected for: {name} - {test}")
-					print(mem_result.stderr)
-					return False
-			except subprocess.TimeoutExpired:
-				print(f"❌ Memory test timed out for: {name} - {test}")
-				return False
+def run_error_cases(bonus, mem, test_name, test_cases, jobs=None, deadline=None):
+	"""
+	Executes error-handling test cases to verify the program's robustness.
 
-	print(COLOUR["GREEN"], "✅ All error-handling tests passed", COLOUR["ENDC"])
-	return True
+	Cases run concurrently across `jobs` workers, but are reported (as "error_case"
+	events) in input order and stop at the first failure, exactly as a serial run would.
+	With `bonus`, each case also checks the bonus checker's error handling.
 
+	With a `deadline` (a `time.time()`), runs still going at that moment are killed
+	and the remaining cases are skipped with a warning; a case cut short this way
+	is not reported as a failure.
 
-def run_test_cases(bonus, test_name, test_cases):
+	Returns:
+		bool: False if a case failed.
 	"""
-	Executes a series of regular test cases and calculates statistics.
+	emit("suite_start", suite=test_name, count=len(test_cases))
+	passed = 0
+	failed = False
+	results = ordered_map(partial(run_error_case, mem, bonus=bonus, deadline=deadline), test_cases, jobs, deadline)
+	try:
+		for (name, test, _), (ok, lines) in zip(test_cases, results):
+			if not ok and deadline is not None and time.time() >= deadline:
+				# Killed at the deadline rather than failed on its own
+				break
+			emit("error_case", suite=test_name, case=name, test=test, passed=ok, lines=lines)
+			if not ok:
+				failed = True
+				break
+			passed += 1
+	except TimeoutError:
+		pass
+	finally:
+		results.close()
+	if not failed and passed < len(test_cases):
+		emit("warning", text=f"Time budget used up after {passed} of {len(test_cases)} {test_name} cases")
+	emit("error_suite_end", suite=test_name, count=len(test_cases), passed=passed)
+	return not failed
+
+
+def _parse_case(test):
+	if isinstance(test, str):
+		return test.split()
+	if isinstance(test, list):
+		return test
+	return None
+
+
+INT_MIN = -2147483648
+INT_MAX = 2147483647
+
+# Results of this process's runs, keyed by canonical input and run options
+_memo = {}
+
+
+def canonical(numbers):
+	"""
+	Reduces an input to the key push_swap's behaviour depends on.
+
+	push_swap only compares values, so any two inputs with the same rank
+	permutation ("5 1 3" and "30 -2 7" are both (2, 0, 1)) must produce the same
+	operations. Inputs containing INT_MIN or INT_MAX are kept as-is, since
+	boundary handling is exactly what those cases are there to check.
 
 	Parameters:
-		bonus (bool): Whether to enable bonus checker verification.
-		test_name (str): The name of the test suite.
-		test_cases (list[tuple]): A list of tuples, where each tuple contains:
-			- name (str): The name of the test case.
-			- test (str | list[int]): The input to the push_swap program, either as a string or a list of integers.
+		numbers (list[int | str]): The input to push_swap.
 
 	Returns:
-		float: The average number of operations across all successful tests, or 0 if no tests succeed.
-	"""
-	count = 0
-	op_total = 0
-	op_low = float("inf")
-	op_high = float("-inf")
-
-	print(COLOUR["HEADER"], f"Running {test_name} tests...", COLOUR["ENDC"])
-	for name, test in test_cases:
-		if isinstance(test, str):
-			ops = run_test(bonus, test.split())
-		elif isinstance(test, list):
-			ops = run_test(bonus, test)
-		else:
-			print(f"⚠️  Invalid test input: {test} (type: {type(test)})")
-			continue
+		tuple: The rank permutation, or ("exact", *values) for boundary inputs.
+	"""
+	values = [int(n) for n in numbers]
+	if INT_MIN in values or INT_MAX in values:
+		return ("exact",) + tuple(values)
+	rank = {v: i for i, v in enumerate(sorted(values))}
+	return tuple(rank[v] for v in values)
+
+
+def retarget(result, ran, numbers):
+	"""
+	Returns `result`, produced by running `ran`, as the result of the
+	order-isomorphic input `numbers`: a message quoting the input that was run
+	quotes `numbers` instead, so every case's repro line is its own.
+	"""
+	if not result.message or ran is numbers:
+		return result
+	return result._replace(message=result.message.replace(str(ran), str(numbers)))
+
+
+def iter_cases(bonus, inputs, jobs=None, dedupe=True, memo=None, **options):
+	"""
+	Runs push_swap on every input and yields each result as soon as it is known.
+
+	With `dedupe`, push_swap runs once per distinct `canonical` input (and run
+	options), and the result is shared by every other input with the same rank
+	permutation, each quoting its own input (see `retarget`). Results are kept in
+	`memo`, so later calls with the same memo reuse them: by default the memo lives
+	as long as the process.
+
+	Runs are submitted in the order of `inputs`; inputs whose result is already in
+	the memo are yielded first. Closing the generator cancels the runs not started.
+	With a `deadline` option, runs are killed at that time and the generator raises
+	TimeoutError once it passes (see `pool.ordered_map`).
+
+	Parameters:
+		bonus (bool): Whether to enable bonus checker verification.
+		inputs (list[list[int | str]]): The inputs to run.
+		jobs (int | None): Number of worker processes.
+		dedupe (bool): Whether to share results between order-isomorphic inputs.
+		memo (dict | None): Where shared results are kept. Defaults to the
+			process-wide memo.
+		**options: Extra keyword arguments passed on to `run_test`.
 
-		if ops is False:
-			print(f"❌ Test failed: {name}")
+	Yields:
+		tuple[int, CaseResult]: An input's position in `inputs` and its result.
+	"""
+	run = partial(run_test, bonus, **options)
+	deadline = options.get("deadline")
+	if not dedupe:
+		outcomes = ordered_map(run, inputs, jobs, deadline)
+		try:
+			yield from enumerate(outcomes)
+		finally:
+			outcomes.close()
+		return
+
+	if memo is None:
+		memo = _memo
+	settings = (bonus,) + tuple(sorted((k, v) for k, v in options.items() if k not in ("cache", "deadline")))
+	groups = {}
+	for position, numbers in enumerate(inputs):
+		groups.setdefault((canonical(numbers),) + settings, []).append(position)
+	todo = []
+	for key, positions in groups.items():
+		if key not in memo:
+			todo.append(key)
 			continue
+		ran, result = memo[key]
+		for position in positions:
+			yield position, retarget(result, ran, inputs[position])
+
+	outcomes = ordered_map(run, (inputs[groups[key][0]] for key in todo), jobs, deadline)
+	try:
+		for key, result in zip(todo, outcomes):
+			ran = inputs[groups[key][0]]
+			# Timeouts depend on the machine's load (and the deadline), not the input
+			if result.status != "timeout":
+				memo[key] = (ran, result)
+			for position in groups[key]:
+				yield position, retarget(result, ran, inputs[position])
+	finally:
+		outcomes.close()
+
+
+def run_cases(bonus, inputs, jobs=None, dedupe=True, **options):
+	"""
+	Runs push_swap on every input and returns the results in input order.
+
+	A list-returning wrapper around `iter_cases`, which see for the parameters.
 
-		# print(f"✅ TEST: {name} OPS: {ops}")
-		if ops < op_low:
-			op_low = ops
-		if ops > op_high:
-			op_high = ops
-		op_total += ops
-		count += 1
-	if count > 0:
-		print(COLOUR["BLUE"], f"LOW: {op_low} HIGH: {op_high} AVG: {op_total / count:.2f}", COLOUR["ENDC"])
-	else:
-		print(COLOUR["RED"], "⚠️  No successful tests to calculate statistics", COLOUR["ENDC"])
-	print(COLOUR["GREEN"], COLOUR["BOLD"], f"✅ \"{test_name}\" passed", COLOUR["ENDC"], COLOUR["ENDC"])
-	return op_total / count if count > 0 else 0
+	Returns:
+		list[CaseResult]: One result per input.
+	"""
+	results = [None] * len(inputs)
+	for position, result in iter_cases(bonus, inputs, jobs, dedupe, **options):
+		results[position] = result
+	return results
+
+
+def emit_case(test_name, index, name, numbers, result):
+	"""
+	Emits the "case" event for one result.
+
+	Parameters:
+		test_name (str): The suite name.
+		index (int): The case's position in its suite.
+		name (str): The case name.
+		numbers (list[int | str]): The case's input.
+		result (CaseResult): The outcome.
+	"""
+	emit(
+		"case",
+		id=f"{test_name}/{index}",
+		suite=test_name,
+		index=index,
+		case=name,
+		size=len(numbers),
+		input=input_digest(numbers),
+		**result._asdict(),
+	)
+
+
+def suite_summary(results, count=None, sizes=None):
+	"""
+	Computes operation statistics (LOW/HIGH/AVG) and resource percentiles for a suite.
+
+	Parameters:
+		results (list[CaseResult]): The successful runs of the suite.
+		count (int | None): The number of cases run, failures included.
+		sizes (list[int] | None): The input size of each result, to count the runs
+			that passed but went over `max_score_limit`.
+
+	Returns:
+		dict: count, passed, low, high, avg (0 when nothing passed), over_max (runs
+		over the full-marks threshold), wall and cpu (p50, p95, max in ms), rss (in
+		MiB), measured (the runs the timings come from: cached results have none)
+		and waste (summed `analysis` counts, or None when the runs were not analysed).
+	"""
+	ops = [r.ops for r in results]
+	over_max = 0
+	for result, size in zip(results, sizes or []):
+		limit = max_score_limit(size)
+		if limit is not None and result.ops > limit:
+			over_max += 1
+	measured = [r for r in results if not r.cached]
+	summary = {
+		"count": len(results) if count is None else count,
+		"passed": len(results),
+		"low": min(ops) if ops else 0,
+		"high": max(ops) if ops else 0,
+		"avg": sum(ops) / len(ops) if ops else 0,
+		"over_max": over_max,
+		"wall": spread([r.wall * 1000 for r in measured]),
+		"cpu": spread([(r.utime + r.stime) * 1000 for r in measured]),
+		"rss": spread([r.maxrss / 1024 for r in measured]),
+		"measured": len(measured),
+		"waste": None,
+	}
+	analyses = [r.analysis for r in results if r.analysis]
+	if analyses:
+		waste = {key: sum(a[key] for a in analyses) for key in ("ops", "saveable", "cancelled", "merged", "rotation")}
+		waste["broken"] = sum(1 for a in analyses if not a.get("optimized_ok", True))
+		summary["waste"] = waste
+	return summary
@@ -0,0 +1,203 @@
+import time
+from typing import NamedTuple
+from events import emit, input_digest
+from runner import _parse_case, emit_case, iter_cases, suite_summary
+from store import latest_runs, load_run
+
+# Results files read for past timings, most recent last
+HISTORY_RUNS = 3
+
+
+class Work(NamedTuple):
+	"""
+	One case to schedule: where it belongs in the report, its input and its
+	estimated wall-clock cost in seconds.
+	"""
+	suite: int
+	index: int
+	name: str
+	numbers: list
+	cost: float
+
+
+def size_cost(size):
+	"""
+	Fallback cost estimate in seconds for an input of `size` values, used when no
+	past run has timed it: process start-up plus a quadratic term for the sort.
+	"""
+	return 0.02 + 2e-7 * size * size
+
+
+def load_timings(paths=None):
+	"""
+	Reads the wall-clock times of past runs from the results store.
+
+	Parameters:
+		paths (list[str] | None): Results files, oldest first. Defaults to the
+			HISTORY_RUNS most recent runs in RESULTS_DIR.
+
+	Returns:
+		tuple[dict, dict]: The time of each (suite, index, input digest), and the
+		mean time per input size. Later runs override earlier ones.
+	"""
+	if paths is None:
+		paths = latest_runs(HISTORY_RUNS)
+	by_case = {}
+	by_size = {}
+	for path in paths:
+		try:
+			_, cases = load_run(path)
+		except (OSError, ValueError):
+			continue
+		for case in cases:
+			if case["status"] != "ok" or case.get("cached"):
+				continue
+			by_case[(case["suite"], case["index"], case["input"])] = case["wall"]
+			by_size.setdefault(case["size"], []).append(case["wall"])
+	return by_case, {size: sum(times) / len(times) for size, times in by_size.items()}
+
+
+def select(suites, names=None, sizes=None):
+	"""
+	Applies the --suite and --size filters.
+
+	Parameters:
+		suites (list[tuple[str, iterable[tuple], list[int] | None]]): (name, cases,
+			indexes) triples, as returned by `shard.shard_suites`.
+		names (list[str] | None): Keep suites whose name contains one of these
+			(case-insensitive).
+		sizes (list[int] | None): Keep cases with one of these input sizes.
+
+	Returns:
+		list[tuple[str, list[tuple[int, str, list]]]]: For each remaining suite, its
+		(index, name, numbers) cases.
+	"""
+	selected = []
+	for name, cases, indexes in suites:
+		if names and not any(n.lower() in name.lower() for n in names):
+			continue
+		picked = []
+		for position, (case, test) in enumerate(cases):
+			numbers = _parse_case(test)
+			if numbers is None:
+				emit("warning", text=f"Invalid test input: {test} (type: {type(test)})")
+				continue
+			if sizes and len(numbers) not in sizes:
+				continue
+			picked.append((indexes[position] if indexes else position, case, numbers))
+		if picked:
+			selected.append((name, picked))
+	return selected
+
+
+def run_scheduled(bonus, suites, jobs=None, dedupe=True, fail_fast=False, time_budget=None, timings=None, started=None, **options):
+	"""
+	Runs the cases of several suites as one pool of work, longest first.
+
+	Each case's cost is its wall time in a recent saved run (same suite, position
+	and input), else the mean time of past inputs of its size, else `size_cost`.
+	Submitting the most expensive cases first keeps every worker busy until the end
+	instead of leaving the 500-value benchmarks for last.
+
+	Suites are still reported (as events) in their given order, each one as soon as
+	it and every suite before it are done. With `fail_fast` the run stops at the
+	first failing case; with `time_budget` it stops once that many seconds have
+	passed: results are only waited for until then, every run is killed at that
+	point and queued runs are cancelled. Runs cut short by the budget are not
+	counted as failures. In both cases the finished cases are reported, followed
+	by a "coverage" event.
+
+	Parameters:
+		bonus (bool): Whether to enable bonus checker verification.
+		suites (list[tuple[str, list[tuple[int, str, list]]]]): As returned by `select`.
+		jobs (int | None): Number of worker processes.
+		dedupe (bool): Whether to run order-isomorphic inputs only once (see
+			`runner.iter_cases`).
+		fail_fast (bool): Whether to stop at the first failure.
+		time_budget (float | None): Seconds the run may take.
+		timings (tuple[dict, dict] | None): Past timings, as returned by `load_timings`.
+		started (float | None): The `time.monotonic()` at which the run began, when
+			work was done before this call; `time_budget` and the reported elapsed
+			time count from it. Defaults to now.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		tuple[bool, int]: Whether every case ran, and how many failed.
+	"""
+	start = time.monotonic() if started is None else started
+	by_case, by_size = timings if timings is not None else load_timings()
+	work = []
+	for s, (name, cases) in enumerate(suites):
+		for index, case, numbers in cases:
+			cost = by_case.get((name, index, input_digest(numbers)))
+			if cost is None:
+				cost = by_size.get(len(numbers), size_cost(len(numbers)))
+			work.append(Work(s, index, case, numbers, cost))
+	work.sort(key=lambda w: w.cost, reverse=True)
+
+	results = [{} for _ in suites]
+	remaining = [len(cases) for _, cases in suites]
+	reported = 0
+	failed = 0
+	stopped = None
+
+	def flush(partial_ok=False):
+		# Report every suite, in order, whose cases are all done
+		nonlocal reported
+		while reported < len(suites) and (partial_ok or remaining[reported] == 0):
+			name, cases = suites[reported]
+			done = results[reported]
+			if done:
+				emit("suite_start", suite=name, count=len(done))
+				passed = []
+				sizes = []
+				for index, case, numbers in cases:
+					result = done.get(index)
+					if result is None:
+						continue
+					emit_case(name, index, case, numbers, result)
+					if result.ok:
+						passed.append(result)
+						sizes.append(len(numbers))
+				emit("suite_end", suite=name, total=len(cases), **suite_summary(passed, len(done), sizes))
+			reported += 1
+
+	deadline = None
+	if time_budget is not None:
+		# An absolute time, so that the runs in the worker processes share it
+		deadline = time.time() + max(time_budget - (time.monotonic() - start), 0)
+		options["deadline"] = deadline
+	outcomes = iter_cases(bonus, [w.numbers for w in work], jobs, dedupe, **options)
+	try:
+		for position, result in outcomes:
+			if deadline is not None and time.time() >= deadline:
+				stopped = "time budget"
+				# A timeout now is the budget killing the run, not a verdict
+				if result.status == "timeout":
+					break
+			w = work[position]
+			results[w.suite][w.index] = result
+			remaining[w.suite] -= 1
+			if not result.ok:
+				failed += 1
+			flush()
+			if fail_fast and not result.ok:
+				stopped = "fail-fast"
+			if stopped:
+				break
+	except TimeoutError:
+		stopped = "time budget"
+	finally:
+		outcomes.close()
+
+	if stopped:
+		flush(partial_ok=True)
+		emit(
+			"coverage",
+			reason=stopped,
+			elapsed=time.monotonic() - start,
+			done=sum(len(done) for done in results),
+			total=len(work),
+			suites=[[name, len(done), len(cases)] for (name, cases), done in zip(suites, results)],
+		)
+	return stopped is None, failed
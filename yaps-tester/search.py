@@ -0,0 +1,140 @@
+import heapq
+import os
+import random
+import time
+from functools import partial
+from config import COLOUR
+from corpus import CORPUS_DIR, write_packed
+from pool import default_jobs, ordered_map
+from runner import run_test
+
+MUTATIONS = ("swap", "reverse", "rotate")
+
+
+def mutate(rng, numbers):
+	"""
+	Returns a copy of `numbers` with one random swap, block reversal or block rotation.
+	"""
+	child = list(numbers)
+	size = len(child)
+	if size < 2:
+		return child
+	i, j = sorted(rng.sample(range(size), 2))
+	kind = rng.choice(MUTATIONS)
+	if kind == "swap":
+		child[i], child[j] = child[j], child[i]
+	elif kind == "reverse":
+		child[i:j + 1] = child[i:j + 1][::-1]
+	else:
+		block = child[i:j + 1]
+		shift = rng.randrange(1, len(block)) if len(block) > 1 else 0
+		child[i:j + 1] = block[shift:] + block[:shift]
+	return child
+
+
+def _score(result, metric):
+	return result.wall if metric == "time" else result.ops
+
+
+def search_worst(size, seconds=60, top=10, seed=42, metric="ops", jobs=None, **options):
+	"""
+	Searches for the inputs of `size` values on which push_swap does worst.
+
+	A steady-state genetic search over permutations of 1..size: each generation
+	mutates parents picked by tournament (swaps, block reversals, rotations),
+	evaluates the children across the worker pool and keeps the highest-scoring
+	individuals as the next population. Runs until `seconds` have passed.
+
+	Parameters:
+		size (int): Number of values per input.
+		seconds (float): Time budget for the search.
+		top (int): Number of worst inputs to return.
+		seed (int): Seed for the search.
+		metric (str): "ops" to maximise the op count, "time" for wall-clock time.
+		jobs (int | None): Number of worker processes.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		tuple[list[tuple[float, list[int]]], list[tuple[list[int], CaseResult]]]: The
+		`top` worst (score, input) pairs, worst first, and any inputs that made
+		push_swap fail outright.
+	"""
+	jobs = jobs or default_jobs()
+	rng = random.Random(seed)
+	population_size = max(16, jobs * 4)
+	options.setdefault("budget", False)
+	# Almost every input is new, so caching them would only evict useful entries
+	options.pop("cache", None)
+	evaluate = partial(run_test, False, **options)
+	deadline = time.monotonic() + seconds
+
+	seen = set()
+	worst = []      # min-heap of (score, tiebreak, input) holding the `top` worst
+	failures = []
+	population = []
+
+	def consider(batch):
+		for numbers, result in zip(batch, ordered_map(evaluate, batch, jobs)):
+			if not result.ok:
+				failures.append((numbers, result))
+				continue
+			score = _score(result, metric)
+			population.append((score, numbers))
+			entry = (score, rng.random(), numbers)
+			if len(worst) < top:
+				heapq.heappush(worst, entry)
+			elif entry > worst[0]:
+				heapq.heapreplace(worst, entry)
+
+	def fresh(candidates):
+		# Drop inputs that have already been evaluated
+		batch = []
+		for numbers in candidates:
+			key = tuple(numbers)
+			if key not in seen:
+				seen.add(key)
+				batch.append(numbers)
+		return batch
+
+	print(COLOUR["HEADER"], f"Searching worst-case inputs of {size} values for {seconds}s...", COLOUR["ENDC"])
+	initial = []
+	for _ in range(population_size):
+		numbers = list(range(1, size + 1))
+		rng.shuffle(numbers)
+		initial.append(numbers)
+	consider(fresh(initial))
+
+	generation = 0
+	while population and time.monotonic() < deadline:
+		generation += 1
+		children = []
+		for _ in range(population_size):
+			# Tournament selection: the worst of three random individuals
+			parent = max(rng.sample(population, min(3, len(population))))[1]
+			child = parent
+			for _ in range(rng.randint(1, 3)):
+				child = mutate(rng, child)
+			children.append(child)
+		consider(fresh(children))
+		population.sort(key=lambda item: item[0], reverse=True)
+		del population[population_size:]
+		unit = "ms" if metric == "time" else "ops"
+		best = population[0][0] * 1000 if metric == "time" else population[0][0]
+		print(f"Generation {generation}: worst so far {best:g} {unit} ({len(seen)} inputs tried)")
+
+	worst = sorted(((score, numbers) for score, _, numbers in worst), key=lambda item: item[0], reverse=True)
+	return worst, failures
+
+
+def save_worst(worst, size, path=None):
+	"""
+	Saves the inputs found by `search_worst` as a packed corpus file.
+
+	Returns:
+		str: The path written. Add it to tests.py with
+		`packed("Worst <size>", "<file name>", <size>)`.
+	"""
+	if path is None:
+		path = os.path.join(CORPUS_DIR, f"worst_{size}.bin")
+	write_packed(path, (numbers for _, numbers in worst))
+	return path
@@ -1,5 +1,6 @@
 import platform, os
 from config import PUSH_SWAP, CHECKER, COLOUR
+from launcher import launcher_path
 
 def check_bonus() -> bool:
 	# Check if bonus checker is available
@@ -17,10 +18,17 @@ def check_push_swap():
 
 def	check_checker() -> bool:
 	# Check if checker is available
-	if not os.path.isfile(CHECKER):
+	if CHECKER is None or not os.path.isfile(CHECKER):
 		raise FileNotFoundError("⚠️  Checker binary not found")
 	return True
 
+def check_launcher() -> bool:
+	# Build the launcher that measures push_swap's own CPU time and memory
+	if launcher_path() is None:
+		print(COLOUR["YELLOW"],"⚠️  No C compiler found, CPU and RSS figures include the tester's own overhead", COLOUR["ENDC"])
+		return False
+	return True
+
 def set_mem_tester():
 	# if macOS use leaks
 	# if linux use valgrind
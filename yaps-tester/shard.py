@@ -0,0 +1,75 @@
+import heapq
+from runner import _parse_case
+
+
+def parse_shard(text):
+	"""
+	Parses a "--shard i/N" value.
+
+	Returns:
+		tuple[int, int]: The 1-based shard index and the shard count.
+
+	Raises:
+		ValueError: If `text` is not of the form i/N with 1 <= i <= N.
+	"""
+	index, _, count = text.partition("/")
+	index, count = int(index), int(count)
+	if not 1 <= index <= count:
+		raise ValueError(f"shard must be i/N with 1 <= i <= N, got {text}")
+	return index, count
+
+
+def _cost(test):
+	# push_swap's cost grows with the input size; malformed cases still cost a run
+	numbers = _parse_case(test)
+	return max(len(numbers), 1) if numbers is not None else 1
+
+
+def assign_shards(suites, count):
+	"""
+	Splits the cases of `suites` between `count` shards of about the same total size.
+
+	Cases are placed largest first on the least loaded shard (the LPT rule), with
+	ties broken by suite and case position, so every machine computes the same
+	assignment from the same suites.
+
+	Parameters:
+		suites (list[tuple[str, iterable[tuple]]]): (name, cases) pairs, as in SUITES.
+		count (int): Number of shards.
+
+	Returns:
+		list[list[set[int]]]: For each shard (0-based), the positions of its cases
+		in each suite.
+	"""
+	costs = []
+	for s, (_, cases) in enumerate(suites):
+		for i, (_, test) in enumerate(cases):
+			costs.append((-_cost(test), s, i))
+	costs.sort()
+
+	assignment = [[set() for _ in suites] for _ in range(count)]
+	loads = [(0, shard) for shard in range(count)]
+	for cost, s, i in costs:
+		load, shard = heapq.heappop(loads)
+		assignment[shard][s].add(i)
+		heapq.heappush(loads, (load - cost, shard))
+	return assignment
+
+
+def shard_suites(suites, index, count):
+	"""
+	Returns the part of `suites` that shard `index` of `count` runs.
+
+	Returns:
+		list[tuple[str, list[tuple], list[int]]]: (name, cases, positions) for every
+		suite with at least one case in this shard; `positions` are the cases'
+		indexes in the full suite, so partial results line up with a full run.
+	"""
+	mine = assign_shards(suites, count)[index - 1]
+	selected = []
+	for (name, cases), positions in zip(suites, mine):
+		if not positions:
+			continue
+		picked = [(i, case) for i, case in enumerate(cases) if i in positions]
+		selected.append((name, [case for _, case in picked], [i for i, _ in picked]))
+	return selected
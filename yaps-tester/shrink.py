@@ -0,0 +1,106 @@
+from functools import partial
+from config import COLOUR
+from pool import default_jobs, ordered_map
+from runner import run_test
+
+
+class Shrinker:
+	"""
+	Delta-debugging minimiser for failing push_swap inputs.
+
+	An input "still fails" when push_swap's result has the same status ("ko",
+	"crash" or "timeout") as the original failure. The op budget is off unless a
+	`budget` option is given: going over it is about efficiency, not a bug that a
+	smaller input reproduces. Every candidate's outcome is remembered, so no
+	input is run twice, and each round's candidates are run in parallel.
+
+	Parameters:
+		jobs (int | None): Number of worker processes.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+	"""
+
+	def __init__(self, jobs=None, **options):
+		options.setdefault("budget", False)
+		self.jobs = jobs or default_jobs()
+		self._run = partial(run_test, False, **options)
+		self._tried = {}
+		self.status = None
+		self.runs = 0
+
+	def _fails(self, candidates):
+		# Evaluates the untried candidates in one parallel batch
+		todo = [c for c in candidates if tuple(c) not in self._tried]
+		for numbers, result in zip(todo, ordered_map(self._run, todo, self.jobs)):
+			self._tried[tuple(numbers)] = result.status == self.status
+			self.runs += 1
+		return [self._tried[tuple(c)] for c in candidates]
+
+	def _first_failing(self, candidates):
+		for candidate, fails in zip(candidates, self._fails(candidates)):
+			if fails:
+				return candidate
+		return None
+
+	def shrink(self, numbers):
+		"""
+		Returns a minimal input that fails the same way as `numbers`.
+
+		Parameters:
+			numbers (list[int]): A failing input.
+
+		Returns:
+			list[int] | None: The reduced input, or None if `numbers` does not fail.
+		"""
+		result = self._run(numbers)
+		self.runs += 1
+		if result.ok:
+			return None
+		self.status = result.status
+		self._tried[tuple(numbers)] = True
+		numbers = self._rerank(numbers)
+
+		# ddmin: try dropping each of `chunks` slices, refining the slices when none
+		# of them can go
+		chunks = 2
+		while len(numbers) >= 2:
+			size = len(numbers)
+			bounds = [size * i // chunks for i in range(chunks + 1)]
+			candidates = [numbers[:bounds[i]] + numbers[bounds[i + 1]:] for i in range(chunks)]
+			reduced = self._first_failing([c for c in candidates if c])
+			if reduced is not None:
+				numbers = self._rerank(reduced)
+				chunks = max(chunks - 1, 2)
+			elif chunks < size:
+				chunks = min(chunks * 2, size)
+			else:
+				break
+		return numbers
+
+	def _rerank(self, numbers):
+		# Replace the values by their ranks 1..n if the failure survives it, which
+		# keeps reproducers short. Inputs with INT_MIN or INT_MAX are tried too: a
+		# failure that needs the boundary values does not survive, and keeps them.
+		values = [int(n) for n in numbers]
+		rank = {v: i + 1 for i, v in enumerate(sorted(values))}
+		ranked = [rank[v] for v in values]
+		if ranked == list(numbers) or self._first_failing([ranked]) is None:
+			return numbers
+		return ranked
+
+
+def shrink_input(numbers, jobs=None, **options):
+	"""
+	Shrinks a failing input and prints it as a test case tuple for tests.py.
+
+	Returns:
+		list[int] | None: The reduced input, or None if `numbers` does not fail.
+	"""
+	print(COLOUR["HEADER"], f"Shrinking a failing input of {len(numbers)} values...", COLOUR["ENDC"])
+	shrinker = Shrinker(jobs, **options)
+	reduced = shrinker.shrink(numbers)
+	if reduced is None:
+		print(COLOUR["YELLOW"], "⚠️  Input does not fail, nothing to shrink", COLOUR["ENDC"])
+		return None
+	print(COLOUR["GREEN"], f"Reduced to {len(reduced)} values in {shrinker.runs} runs ({shrinker.status})", COLOUR["ENDC"])
+	print(f'("Shrunk {shrinker.status} ({len(reduced)} values)", "{" ".join(map(str, reduced))}"),')
+	return reduced
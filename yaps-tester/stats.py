@@ -0,0 +1,225 @@
+import math
+from collections import Counter
+
+
+def percentile(values, p):
+	"""
+	Returns the p-th percentile (0-100) of `values`, interpolating between ranks.
+
+	Parameters:
+		values (list[float]): The samples, in any order.
+		p (float): The percentile to compute.
+
+	Returns:
+		float: The percentile, or 0 if `values` is empty.
+	"""
+	if not values:
+		return 0
+	ordered = sorted(values)
+	rank = (len(ordered) - 1) * p / 100
+	low = math.floor(rank)
+	high = math.ceil(rank)
+	return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def spread(values):
+	"""
+	Returns (p50, p95, max) of `values`.
+	"""
+	if not values:
+		return 0, 0, 0
+	return percentile(values, 50), percentile(values, 95), max(values)
+
+
+def wilson_interval(successes, n, z=1.96):
+	"""
+	Returns the Wilson score interval (low, high) for a proportion successes/n.
+	"""
+	if n == 0:
+		return 0.0, 0.0
+	p = successes / n
+	denom = 1 + z * z / n
+	centre = (p + z * z / (2 * n)) / denom
+	margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n)) / denom
+	return max(0.0, centre - margin), min(1.0, centre + margin)
+
+
+class Distribution:
+	"""
+	Streaming summary of a sample.
+
+	Values are counted in a histogram keyed by `value / resolution`, so memory
+	depends on the number of distinct values rather than on the number of samples,
+	while mean and standard deviation are tracked exactly (Welford's method).
+
+	Parameters:
+		resolution (float): Bucket width used for percentiles and the histogram.
+	"""
+
+	def __init__(self, resolution=1):
+		self.resolution = resolution
+		self.counts = Counter()
+		self.n = 0
+		self.mean = 0.0
+		self._m2 = 0.0
+
+	def add(self, value):
+		self.counts[round(value / self.resolution)] += 1
+		self.n += 1
+		delta = value - self.mean
+		self.mean += delta / self.n
+		self._m2 += delta * (value - self.mean)
+
+	@property
+	def stddev(self) -> float:
+		return math.sqrt(self._m2 / (self.n - 1)) if self.n > 1 else 0.0
+
+	@property
+	def min(self):
+		return min(self.counts) * self.resolution if self.counts else 0
+
+	@property
+	def max(self):
+		return max(self.counts) * self.resolution if self.counts else 0
+
+	def percentile(self, p):
+		"""
+		Returns the nearest-rank p-th percentile (0-100).
+		"""
+		if not self.n:
+			return 0
+		rank = max(1, math.ceil(self.n * p / 100))
+		seen = 0
+		for key in sorted(self.counts):
+			seen += self.counts[key]
+			if seen >= rank:
+				return key * self.resolution
+		return self.max
+
+	def at_most(self, limit) -> int:
+		"""
+		Returns how many samples are <= `limit`.
+		"""
+		return sum(c for key, c in self.counts.items() if key * self.resolution <= limit)
+
+	def confidence_interval(self, z=1.96):
+		"""
+		Returns the normal-approximation confidence interval (low, high) of the mean.
+		"""
+		if self.n < 2:
+			return self.mean, self.mean
+		margin = z * self.stddev / math.sqrt(self.n)
+		return self.mean - margin, self.mean + margin
+
+	def histogram(self, rows=10, width=40):
+		"""
+		Returns a text histogram as a list of lines, one per bucket.
+		"""
+		if not self.n:
+			return []
+		low, high = self.min, self.max
+		rows = min(rows, round((high - low) / self.resolution) + 1)
+		step = (high - low + self.resolution) / rows
+		buckets = [0] * rows
+		for key, count in self.counts.items():
+			index = min(int((key * self.resolution - low) / step), rows - 1)
+			buckets[index] += count
+		peak = max(buckets)
+		lines = []
+		for i, count in enumerate(buckets):
+			start = low + i * step
+			bar = "█" * round(width * count / peak)
+			lines.append(f"{start:>12.6g} | {bar} {count}")
+		return lines
+
+
+def _relative_error(fs, ys, a, c):
+	errors = [((y - a - c * f) / y) ** 2 for f, y in zip(fs, ys) if y]
+	if not errors:
+		return float("inf")
+	return math.sqrt(sum(errors) / len(errors))
+
+
+def fit_model(xs, ys, model):
+	"""
+	Fits y = a + c * model(x) by least squares.
+
+	The intercept a absorbs the fixed cost of every run (process start-up, argument
+	parsing), which would otherwise swamp the growth term at small sizes. The fit
+	through the origin (a = 0) is kept instead when it has the smaller error, when
+	a would be negative, or with fewer than three points.
+
+	Returns:
+		tuple[float, float, float]: (a, c, relative RMS error). The error is relative
+		to each y so that the small sizes count as much as the large ones.
+	"""
+	fs = [model(x) for x in xs]
+	fits = []
+	denom = sum(f * f for f in fs)
+	if denom:
+		c = sum(f * y for f, y in zip(fs, ys)) / denom
+		fits.append((0.0, c, _relative_error(fs, ys, 0.0, c)))
+	if len(fs) >= 3:
+		mean_f = sum(fs) / len(fs)
+		mean_y = sum(ys) / len(ys)
+		sff = sum((f - mean_f) ** 2 for f in fs)
+		if sff:
+			c = sum((f - mean_f) * (y - mean_y) for f, y in zip(fs, ys)) / sff
+			a = mean_y - c * mean_f
+			if a >= 0:
+				fits.append((a, c, _relative_error(fs, ys, a, c)))
+	if not fits:
+		return 0.0, 0.0, float("inf")
+	return min(fits, key=lambda fit: fit[2])
+
+
+def fit_power(xs, ys, low=0.5, high=3.0, step=0.01):
+	"""
+	Fits y = a + c * x^k, with k searched from `low` to `high` in `step`s and a and
+	c fitted by `fit_model` for each k.
+
+	Returns:
+		tuple[float, float, float]: (a, c, k) with the smallest relative error.
+	"""
+	best = None
+	for i in range(round((high - low) / step) + 1):
+		k = low + i * step
+		a, c, error = fit_model(xs, ys, lambda x: x ** k)
+		if best is None or error < best[0]:
+			best = (error, a, c, k)
+	return best[1:]
+
+
+def wilcoxon_signed_rank(differences):
+	"""
+	Wilcoxon signed-rank test on paired differences, with the normal approximation.
+
+	Zero differences are dropped; tied magnitudes get their average rank and the
+	variance is corrected for them.
+
+	Returns:
+		tuple[float, float]: (z, two-sided p-value). z is positive when the
+		differences tend to be positive. (0, 1) if every difference is zero.
+	"""
+	nonzero = sorted((abs(d), d > 0) for d in differences if d)
+	n = len(nonzero)
+	if n == 0:
+		return 0.0, 1.0
+	positive = 0.0
+	ties = 0
+	i = 0
+	while i < n:
+		j = i
+		while j + 1 < n and nonzero[j + 1][0] == nonzero[i][0]:
+			j += 1
+		rank = (i + j) / 2 + 1
+		positive += rank * sum(1 for k in range(i, j + 1) if nonzero[k][1])
+		t = j - i + 1
+		ties += t ** 3 - t
+		i = j + 1
+	mean = n * (n + 1) / 4
+	variance = n * (n + 1) * (2 * n + 1) / 24 - ties / 48
+	if variance <= 0:
+		return 0.0, 1.0
+	z = (positive - mean) / math.sqrt(variance)
+	return z, math.erfc(abs(z) / math.sqrt(2))
@@ -0,0 +1,337 @@
+import glob
+import json
+import os
+import time
+from config import PUSH_SWAP, CHECKER, COLOUR, RESULTS_DIR
+from cache import file_hash
+from events import input_digest
+from runner import CaseResult
+from stats import percentile
+
+# Bump when the record layout changes incompatibly
+FORMAT_VERSION = 1
+
+
+class ResultWriter:
+	"""
+	Writes the results of one tester run to a JSON Lines file.
+
+	The first line is a "run" header (format version, time and binary hashes); every
+	following line is one "case" record, written as soon as the case is reported.
+	Registered with `events.add_sink`, it records every "case" event.
+
+	Parameters:
+		path (str | None): File to write. Defaults to a timestamped file in RESULTS_DIR.
+		shard (tuple[int, int] | None): (index, count) when this run is one shard of a
+			larger one; recorded in the header so that `merge_runs` can check coverage.
+	"""
+
+	def __init__(self, path=None, shard=None):
+		if path is None:
+			os.makedirs(RESULTS_DIR, exist_ok=True)
+			suffix = f"-shard{shard[0]}of{shard[1]}" if shard else ""
+			path = os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}{suffix}.jsonl")
+		self.path = path
+		self._indexes = {}
+		self._file = open(path, "w")
+		header = {
+			"type": "run",
+			"version": FORMAT_VERSION,
+			"timestamp": time.time(),
+			"push_swap_sha256": file_hash(PUSH_SWAP),
+			"checker_sha256": file_hash(CHECKER),
+		}
+		if shard:
+			header["shard"] = list(shard)
+		self._write(header)
+
+	def _write(self, record):
+		self._file.write(json.dumps(record) + "\n")
+
+	def record(self, suite, name, numbers, result, index=None):
+		"""
+		Appends one case result.
+
+		Parameters:
+			suite (str): The suite name.
+			name (str): The case name. Names need not be unique: cases are matched
+				between runs by suite and position.
+			numbers (list[int | str]): The case's input.
+			result (CaseResult): The outcome.
+			index (int | None): The case's position in its suite. Defaults to the
+				number of cases already recorded for the suite.
+		"""
+		if index is None:
+			index = self._indexes.get(suite, 0)
+		self._indexes[suite] = index + 1
+		self._write({
+			"type": "case",
+			"suite": suite,
+			"index": index,
+			"case": name,
+			"size": len(numbers),
+			"input": input_digest(numbers),
+			**result._asdict(),
+		})
+
+	def handle(self, event):
+		if event["event"] != "case":
+			return
+		record = {key: value for key, value in event.items() if key not in ("event", "id")}
+		self._indexes[event["suite"]] = event["index"] + 1
+		self._write({"type": "case", **record})
+
+	def close(self):
+		self._file.close()
+
+
+def load_run(path):
+	"""
+	Reads a results file written by ResultWriter.
+
+	Returns:
+		tuple[dict, list[dict]]: The run header and the case records.
+	"""
+	header = None
+	cases = []
+	with open(path) as f:
+		for line in f:
+			if not line.strip():
+				continue
+			record = json.loads(line)
+			if record["type"] == "run":
+				if record.get("version") != FORMAT_VERSION:
+					raise ValueError(f"{path}: unsupported results format version {record.get('version')}")
+				header = record
+			elif record["type"] == "case":
+				cases.append(record)
+	if header is None:
+		raise ValueError(f"{path}: not a results file")
+	return header, cases
+
+
+def to_result(record):
+	"""
+	Rebuilds the CaseResult stored in a case record.
+	"""
+	return CaseResult(**{field: record[field] for field in CaseResult._fields if field in record})
+
+
+def merge_runs(paths, output=None):
+	"""
+	Combines the partial results files of a sharded run into one results file.
+
+	Every shard of the run must be present exactly once; all files must come from
+	the same push_swap binary. Cases keep their suite positions, so the merged file
+	can be compared with a single-node run.
+
+	Parameters:
+		paths (list[str]): The partial results files, in any order.
+		output (str | None): File to write. Defaults to a timestamped file in RESULTS_DIR.
+
+	Returns:
+		tuple[str, list[dict]]: The merged file's path and its case records, grouped
+		by suite in the order the suites were run and sorted by position.
+
+	Raises:
+		ValueError: If the files are not the shards of one run.
+	"""
+	runs = [(path,) + load_run(path) for path in paths]
+	counts = {header["shard"][1] if header.get("shard") else 1 for _, header, _ in runs}
+	if len(counts) != 1:
+		raise ValueError("results files come from runs with different shard counts")
+	count = counts.pop()
+	shards = sorted(header["shard"][0] if header.get("shard") else 1 for _, header, _ in runs)
+	if shards != list(range(1, count + 1)):
+		raise ValueError(f"expected shards 1..{count} once each, got {', '.join(map(str, shards)) or 'none'}")
+	if len({header["push_swap_sha256"] for _, header, _ in runs}) > 1:
+		raise ValueError("results files come from different push_swap binaries")
+
+	# Each shard runs its suites in the global order, so a suite's rank is the
+	# earliest rank any shard gives it relative to the suites before it
+	order = []
+	for _, _, cases in sorted(runs, key=lambda run: run[1].get("shard", [1])[0]):
+		position = 0
+		for case in cases:
+			if case["suite"] in order:
+				position = order.index(case["suite"]) + 1
+			else:
+				order.insert(position, case["suite"])
+				position += 1
+	merged = {}
+	for _, _, cases in runs:
+		for case in cases:
+			merged.setdefault((order.index(case["suite"]), case["index"]), case)
+	cases = [merged[key] for key in sorted(merged)]
+
+	if output is None:
+		os.makedirs(RESULTS_DIR, exist_ok=True)
+		output = os.path.join(RESULTS_DIR, time.strftime("%Y%m%d-%H%M%S") + f"-{os.getpid()}-merged.jsonl")
+	header = dict(runs[0][1])
+	header.pop("shard", None)
+	header["timestamp"] = max(h["timestamp"] for _, h, _ in runs)
+	header["merged"] = sorted(paths)
+	with open(output, "w") as f:
+		for record in [header] + cases:
+			f.write(json.dumps(record) + "\n")
+	return output, cases
+
+
+def _has_cases(path):
+	# A results file holds cases if anything follows its header line
+	try:
+		with open(path) as f:
+			f.readline()
+			return any(line.strip() for line in f)
+	except OSError:
+		return False
+
+
+def latest_runs(count=2):
+	"""
+	Returns the paths of the `count` most recent results files in RESULTS_DIR that
+	hold at least one case, oldest first.
+	"""
+	paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.jsonl")), key=os.path.getmtime)
+	latest = []
+	for path in reversed(paths):
+		if len(latest) == count:
+			break
+		if _has_cases(path):
+			latest.insert(0, path)
+	return latest
+
+
+def _has_timings(path):
+	# Whether a results file holds a measured (not cached) case; stops at the first
+	try:
+		with open(path) as f:
+			for line in f:
+				if not line.strip():
+					continue
+				record = json.loads(line)
+				if record["type"] == "case" and not record.get("cached"):
+					return True
+	except (OSError, ValueError, KeyError):
+		pass
+	return False
+
+
+def baseline_run(new_path):
+	"""
+	Returns the results file in RESULTS_DIR to compare `new_path` with by default:
+	the most recent earlier run with measured timings, since a run served entirely
+	from the cache has none, or else the most recent earlier run with any cases.
+
+	Returns:
+		str | None: The path, or None if there is no earlier run with cases.
+	"""
+	paths = sorted(glob.glob(os.path.join(RESULTS_DIR, "*.jsonl")), key=os.path.getmtime)
+	if new_path in paths:
+		paths = paths[:paths.index(new_path)]
+	earlier = [path for path in paths if _has_cases(path)]
+	for path in reversed(earlier):
+		if _has_timings(path):
+			return path
+	return earlier[-1] if earlier else None
+
+
+def _suite_summary(cases):
+	# avg_ops is None without a passing case, p95_wall without a measured one
+	passed = [c for c in cases if c["status"] == "ok"]
+	ops = [c["ops"] for c in passed]
+	# Cached results carry no timings
+	wall = [c["wall"] for c in passed if not c.get("cached")]
+	return {
+		"count": len(cases),
+		"passed": len(passed),
+		"avg_ops": sum(ops) / len(ops) if ops else None,
+		"p95_wall": percentile(wall, 95) if wall else None,
+	}
+
+
+def _change(old, new):
+	# Relative change in percent; 0 -> 0 is no change, 0 -> x is infinite
+	if old == 0:
+		return 0.0 if new == 0 else float("inf")
+	return 100 * (new - old) / old
+
+
+def compare_runs(old_path, new_path, ops_threshold=2.0, time_threshold=10.0):
+	"""
+	Compares two results files per case and per suite and prints the differences.
+
+	A regression is a case that passed in the old run but not in the new one, or a
+	suite whose average op count grew by more than `ops_threshold` percent or whose
+	p95 wall time grew by more than `time_threshold` percent. A suite's ops are only
+	compared if both runs have passing cases in it, and its time only if both have
+	measured (not cached) ones.
+
+	Parameters:
+		old_path (str): The baseline results file.
+		new_path (str): The results file to check.
+		ops_threshold (float): Allowed increase of a suite's average ops, in percent.
+		time_threshold (float): Allowed increase of a suite's p95 wall time, in percent.
+
+	Returns:
+		list[str]: One description per regression; empty if there are none.
+
+	Raises:
+		ValueError: If the two runs have no suite (and so no case) in common,
+			leaving nothing to compare.
+	"""
+	old_header, old_cases = load_run(old_path)
+	new_header, new_cases = load_run(new_path)
+	if not {c["suite"] for c in old_cases} & {c["suite"] for c in new_cases}:
+		raise ValueError(f"{old_path} and {new_path} have no suites in common, nothing to compare")
+	print(COLOUR["HEADER"], f"Comparing {old_path} -> {new_path}", COLOUR["ENDC"])
+	if old_header["push_swap_sha256"] == new_header["push_swap_sha256"]:
+		print(COLOUR["YELLOW"], "⚠️  Both runs used the same push_swap binary", COLOUR["ENDC"])
+
+	old_by_key = {(c["suite"], c["index"]): c for c in old_cases}
+	regressions = []
+	suites = {}
+	for case in new_cases:
+		suites.setdefault(case["suite"], []).append(case)
+		old = old_by_key.get((case["suite"], case["index"]))
+		if old is None:
+			continue
+		label = f"{case['suite']} / {case['case']}"
+		if old["input"] != case["input"]:
+			print(COLOUR["YELLOW"], f"⚠️  Input changed, not compared: {label}", COLOUR["ENDC"])
+			continue
+		if old["status"] == "ok" and case["status"] != "ok":
+			regressions.append(f"{label}: {old['status']} -> {case['status']}")
+		elif old["ops"] != case["ops"]:
+			print(f"{label}: {old['ops']} -> {case['ops']} ops ({case['ops'] - old['ops']:+d})")
+
+	old_suites = {}
+	for case in old_cases:
+		old_suites.setdefault(case["suite"], []).append(case)
+	for suite, cases in suites.items():
+		if suite not in old_suites:
+			continue
+		old = _suite_summary(old_suites[suite])
+		new = _suite_summary(cases)
+		parts = []
+		if old["avg_ops"] is None or new["avg_ops"] is None:
+			parts.append("AVG not compared (no passing cases in one run)")
+		else:
+			ops_change = _change(old["avg_ops"], new["avg_ops"])
+			parts.append(f"AVG {old['avg_ops']:.2f} -> {new['avg_ops']:.2f} ({ops_change:+.1f}%)")
+			if ops_change > ops_threshold:
+				regressions.append(f"{suite}: average ops {ops_change:+.1f}% (threshold {ops_threshold}%)")
+		if old["p95_wall"] is None or new["p95_wall"] is None:
+			parts.append("TIME not compared (nothing measured in one run, e.g. all cached)")
+		else:
+			time_change = _change(old["p95_wall"], new["p95_wall"])
+			parts.append(f"TIME p95 {old['p95_wall'] * 1000:.1f} -> {new['p95_wall'] * 1000:.1f} ms ({time_change:+.1f}%)")
+			if time_change > time_threshold:
+				regressions.append(f"{suite}: p95 time {time_change:+.1f}% (threshold {time_threshold}%)")
+		print(COLOUR["BLUE"], f"{suite}: " + " ".join(parts), COLOUR["ENDC"])
+
+	for regression in regressions:
+		print(COLOUR["RED"], f"❌ {regression}", COLOUR["ENDC"])
+	if not regressions:
+		print(COLOUR["GREEN"], "✅ No regressions", COLOUR["ENDC"])
+	return regressions
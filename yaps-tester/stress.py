@@ -0,0 +1,127 @@
+import os
+import platform
+import random
+from functools import partial
+from config import COLOUR
+from pool import ordered_map
+from runner import run_test
+
+# Linux caps every single argument at 32 pages (MAX_ARG_STRLEN), whatever ARG_MAX is
+MAX_ARG_STRLEN = 131072 if platform.system() == "Linux" else None
+
+STYLES = ("argv", "string")
+
+
+def arg_max():
+	"""
+	Returns the kernel's limit on the total size of argv and the environment, in bytes.
+	"""
+	try:
+		return os.sysconf("SC_ARG_MAX")
+	except (ValueError, OSError):
+		return 256 * 1024
+
+
+def command_size(args):
+	"""
+	Estimates how much of ARG_MAX running push_swap with `args` uses: every
+	argument and environment string with its terminating NUL, plus one pointer each.
+	"""
+	strings = [a.encode() for a in args] + [f"{k}={v}".encode() for k, v in os.environ.items()]
+	return sum(len(s) + 1 for s in strings) + 8 * (len(strings) + 2)
+
+
+def too_large(numbers, style):
+	"""
+	Returns why `numbers` cannot be passed to push_swap in `style`, or None if it fits.
+	"""
+	args = [str(n) for n in numbers]
+	if style == "string":
+		joined = " ".join(args)
+		if MAX_ARG_STRLEN and len(joined) + 1 > MAX_ARG_STRLEN:
+			return f"one argument of {len(joined) + 1} bytes > MAX_ARG_STRLEN ({MAX_ARG_STRLEN})"
+		args = [joined]
+	size = command_size(["push_swap"] + args)
+	if size > arg_max():
+		return f"{size} bytes of arguments > ARG_MAX ({arg_max()})"
+	return None
+
+
+def stress_inputs(size, repeats, seed):
+	"""
+	Returns `repeats` random permutations of 1..size. Small values keep the command
+	line short, so the largest sizes still fit in ARG_MAX.
+	"""
+	rng = random.Random(f"{seed}:{size}")
+	inputs = []
+	for _ in range(repeats):
+		numbers = list(range(1, size + 1))
+		rng.shuffle(numbers)
+		inputs.append(numbers)
+	return inputs
+
+
+def run_stress(sizes, repeats=3, seed=42, jobs=None, **options):
+	"""
+	Measures push_swap's parse-and-sort throughput on large inputs, with the input
+	passed as separate arguments and as one space-separated string.
+
+	Inputs that would not fit on the command line in a style (ARG_MAX, or Linux's
+	per-argument MAX_ARG_STRLEN for the single string) are reported and skipped
+	rather than run. Throughput is elements per second of push_swap's own CPU time,
+	so the tester's verification of the output does not count against it.
+
+	Parameters:
+		sizes (list[int]): Input sizes, e.g. up to several tens of thousands.
+		repeats (int): Inputs per size.
+		seed (int): Seed for the input generator.
+		jobs (int | None): Number of worker processes.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		dict[tuple[int, str], float]: Elements per second for each (size, style) that ran.
+	"""
+	options.setdefault("budget", False)
+	# Every input is new, and results would only evict useful cache entries
+	options.pop("cache", None)
+	limit = f", MAX_ARG_STRLEN {MAX_ARG_STRLEN}" if MAX_ARG_STRLEN else ""
+	print(COLOUR["HEADER"], f"Stress test (ARG_MAX {arg_max()} bytes{limit})...", COLOUR["ENDC"])
+	throughput = {}
+	for size in sizes:
+		inputs = stress_inputs(size, repeats, seed)
+		for style in STYLES:
+			reason = too_large(inputs[0], style)
+			if reason:
+				print(COLOUR["YELLOW"], f"⚠️  {size} values as {style}: skipped, {reason}", COLOUR["ENDC"])
+				continue
+			run = partial(run_test, False, single_arg=style == "string", **options)
+			cpu = 0.0
+			wall = 0.0
+			ops = 0
+			passed = 0
+			failures = {}
+			for result in ordered_map(run, inputs, jobs):
+				if not result.ok:
+					# The messages quote the whole input, far too long to print here
+					failures[result.status] = failures.get(result.status, 0) + 1
+					continue
+				passed += 1
+				cpu += result.utime + result.stime
+				wall += result.wall
+				ops += result.ops
+			if failures:
+				counts = ", ".join(f"{count} {status}" for status, count in failures.items())
+				print(COLOUR["RED"], f"❌ {size} values as {style}: {counts}", COLOUR["ENDC"])
+			if not passed:
+				continue
+			rate = size * passed / cpu if cpu else float("inf")
+			throughput[(size, style)] = rate
+			print(
+				f"{size:>7} values as {style:<6}: {passed}/{len(inputs)} passed,"
+				f" {ops / passed:.0f} ops, {wall / passed * 1000:.1f} ms wall,"
+				f" {cpu / passed * 1000:.1f} ms CPU, {rate:,.0f} elements/s"
+			)
+		if (size, "argv") in throughput and (size, "string") in throughput:
+			ratio = throughput[(size, "string")] / throughput[(size, "argv")]
+			print(COLOUR["BLUE"], f"{size} values: string input runs at {ratio:.2f}x the speed of separate arguments", COLOUR["ENDC"])
+	return throughput
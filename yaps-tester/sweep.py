@@ -0,0 +1,109 @@
+import math
+import time
+from functools import partial
+from config import COLOUR
+from bench import generate
+from pool import ordered_map
+from runner import run_test
+from stats import fit_model, fit_power
+
+MODELS = {
+	"n": lambda n: n,
+	"n log n": lambda n: n * math.log2(n),
+	"n√n": lambda n: n * math.sqrt(n),
+	"n²": lambda n: n * n,
+}
+
+
+def geometric_sizes(low, high, steps):
+	"""
+	Returns `steps` sizes spaced geometrically from `low` to `high`, without repeats.
+	"""
+	if steps < 2 or high <= low:
+		return [low]
+	ratio = (high / low) ** (1 / (steps - 1))
+	return sorted({round(low * ratio ** i) for i in range(steps)})
+
+
+def _sweep_size(size, repeats, seed, seconds, jobs, options):
+	# Streams the repeats for one size; stops early once `seconds` have passed
+	deadline = time.monotonic() + seconds
+	count = 0
+	ops = 0.0
+	cpu = 0.0
+	failures = []
+	results = ordered_map(partial(run_test, False, **options), generate(size, repeats, seed), jobs)
+	for result in results:
+		if result.ok:
+			count += 1
+			ops += result.ops
+			cpu += result.utime + result.stime
+		else:
+			failures.append(result)
+		if time.monotonic() > deadline:
+			results.close()
+			break
+	return count, ops / count if count else 0, cpu / count if count else 0, failures
+
+
+def run_sweep(sizes, repeats=5, seed=42, seconds=30, targets=(), jobs=None, **options):
+	"""
+	Runs push_swap on random inputs of growing size and fits its complexity.
+
+	For each size, up to `repeats` seeded inputs are streamed through the worker
+	pool, stopping early once `seconds` have been spent on that size. The mean op
+	count and CPU time (user + system, from wait4) per size are then fitted as
+	a + c * f(n) for f = n, n log n, n√n and n², where a is the fixed cost of a run.
+	The same is done with a free power law, a + c * n^k, and the best model is
+	extrapolated to `targets`. CPU time rather than wall time
+	keeps start-up latency and the tester's own verification out of the series.
+
+	Parameters:
+		sizes (list[int]): Input sizes, smallest first.
+		repeats (int): Inputs per size.
+		seed (int): Seed for the input generator.
+		seconds (float): Time budget per size.
+		targets (iterable[int]): Sizes to extrapolate to.
+		jobs (int | None): Number of worker processes.
+		**options: Extra keyword arguments passed on to `runner.run_test`.
+
+	Returns:
+		list[tuple[int, int, float, float]]: (size, runs, mean ops, mean CPU seconds)
+		for every size with at least one successful run.
+	"""
+	# The per-size op budget is tuned for 3-500 values; a sweep wants the real counts
+	options.setdefault("budget", False)
+	# Cached results have no timings to fit
+	options.pop("cache", None)
+	print(COLOUR["HEADER"], f"Sweeping {len(sizes)} sizes from {sizes[0]} to {sizes[-1]}...", COLOUR["ENDC"])
+	points = []
+	for size in sizes:
+		count, ops, cpu, failures = _sweep_size(size, repeats, seed, seconds, jobs, options)
+		for result in failures[:1]:
+			print(result.message or f"❌ {result.status} at {size} values")
+		if not count:
+			print(COLOUR["RED"], f"⚠️  No successful runs at {size} values", COLOUR["ENDC"])
+			continue
+		points.append((size, count, ops, cpu))
+		print(f"{size:>7} values: {count} runs, {ops:.1f} ops, {cpu * 1000:.2f} ms CPU")
+
+	if len(points) < 2:
+		print(COLOUR["RED"], "⚠️  Not enough sizes to fit a model", COLOUR["ENDC"])
+		return points
+
+	xs = [p[0] for p in points]
+	for label, ys, unit, scale in (("OPS", [p[2] for p in points], "ops", 1), ("CPU", [p[3] for p in points], "ms", 1000)):
+		fits = {name: fit_model(xs, ys, model) for name, model in MODELS.items()}
+		best = min(fits, key=lambda name: fits[name][2])
+		a, c, error = fits[best]
+		_, _, k = fit_power(xs, ys)
+		model = f"{a * scale:.2f} {unit} + c·{best}" if a else best
+		print(
+			COLOUR["BLUE"],
+			f"{label}: best fit {model} (error {100 * error:.1f}%), power law n^{k:.2f} | "
+			+ " ".join(f"{name}: {100 * err:.1f}%" for name, (_, _, err) in fits.items()),
+			COLOUR["ENDC"],
+		)
+		for target in targets:
+			print(f"  {target} values: ~{(a + c * MODELS[best](target)) * scale:.1f} {unit}")
+	return points
@@ -1,22 +1,32 @@
-import random
+#!/usr/bin/env python3
+"""
+Builds packed test corpora for `corpus.packed`.
 
-random.seed(42)  # Fixed seed for consistency
+Example: ten 10k-element inputs drawn from the whole int range
+	python3 test_gen.py corpus/bm_10000.bin --size 10000 --count 10 --seed 42
+"""
+import argparse
+from corpus import DISTRIBUTIONS, generated, write_packed
 
-INT_MIN = -2147483648
-INT_MAX = 2147483647
-BM_500 = []
 
-for i in range(10):
-    test_case = []
-    for _ in range(500):
-        # 70% chance to pick smaller numbers, 30% chance for large numbers
-        if random.random() < 0.7:
-            test_case.append(random.randint(-1000, 1000))  # Smaller range
-        else:
-            test_case.append(random.randint(INT_MIN, INT_MAX))  # Full range
-    test_case_str = " ".join(map(str, test_case))
-    BM_500.append((f"500 values #{i + 1}", test_case_str))
+def main():
+	parser = argparse.ArgumentParser(description="Generate a packed push_swap test corpus")
+	parser.add_argument("output", help="file to write")
+	parser.add_argument("--size", type=int, required=True, help="values per case")
+	parser.add_argument("--count", type=int, default=10, help="number of cases (default: 10)")
+	parser.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+	parser.add_argument(
+		"--distribution",
+		choices=DISTRIBUTIONS,
+		default="uniform",
+		help="how values are drawn (default: uniform)",
+	)
+	args = parser.parse_args()
 
-# Print the BM_500 list to verify
-for test in BM_500:
-    print(test)
+	suite = generated("", args.seed, args.size, args.count, args.distribution)
+	write_packed(args.output, (numbers for _, numbers in suite))
+	print(f"Wrote {args.count} x {args.size} values to {args.output}")
+
+
+if __name__ == "__main__":
+	main()
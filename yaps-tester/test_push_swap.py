@@ -1,12 +1,15 @@
 #!/usr/bin/env python3
+import argparse
+import atexit
+import os
 import subprocess
 import random
 import sys
-from config import PUSH_SWAP, MAX_TEST_SIZE, TEST_COUNT, COLOUR, CHECKER
-from setup import check_push_swap, check_checker, check_bonus, set_mem_tester
+import time
+from config import PUSH_SWAP, MAX_TEST_SIZE, TEST_COUNT, COLOUR, CHECKER, RESULTS_DIR, TIMEOUT, MEMCHECK_SAMPLE
+from setup import check_push_swap, check_checker, check_bonus, check_launcher, set_mem_tester
 from tests import (
 	ERROR_HANDLING,
-	NO_ARGUMENT,
 	EDGE_CASES,
 	ALMOST_SORTED,
 	DESCENDING_ORDER,
@@ -16,72 +19,459 @@ from tests import (
 	BM_100,
 	BM_500,
 	)
-from runner import run_test_cases, run_error_cases
+from runner import run_error_cases, suite_summary
+from scheduler import run_scheduled, select
+import events
+from events import ConsoleRenderer, ProgressRenderer, JsonLinesSink, JUnitSink
+from bench import bench_sizes, generate, run_benchmark, run_exhaustive
+from cache import ResultCache
+from store import ResultWriter, baseline_run, compare_runs, latest_runs, merge_runs, to_result
+from shard import parse_shard, shard_suites
+from search import search_worst, save_worst
+from sweep import geometric_sizes, run_sweep
+from ab import run_ab
+from stress import run_stress
+from fuzz import run_fuzz
+from watch import Watcher
+from memcheck import memcheck_class
+from shrink import shrink_input
+from analyze import analyze_ops
+from pool import default_jobs
 from utils import print_error_exit
 
+SUITES = [
+	("Edge Cases", EDGE_CASES),
+	("Almost Sorted", ALMOST_SORTED),
+	("Descending Order", DESCENDING_ORDER),
+	("Random Order", RANDOM_ORDER),
+	("Benchmarks: 3", BM_3),
+	("Benchmarks: 5", BM_5),
+	("Benchmarks: 100", BM_100),
+	("Benchmarks: 500", BM_500),
+]
 
-def test_error_handling(bonus: bool):
+
+def parse_args(argv=None):
+	"""
+	Parses the tester's command line options.
 	"""
-	Tests the error handling capabilities of the PUSH_SWAP program and its optional BONUS checker.
+	parser = argparse.ArgumentParser(description="Yet Another Push Swap Tester")
+	parser.add_argument(
+		"-j", "--jobs",
+		type=int,
+		default=default_jobs(),
+		help="number of test cases to run in parallel (default: number of cores)",
+	)
+	parser.add_argument(
+		"--cross-check",
+		action="store_true",
+		help="also verify every run with the external checker binary",
+	)
+	parser.add_argument(
+		"--pipe",
+		action="store_true",
+		help="verify with the checker binary, piping push_swap's output straight into it",
+	)
+	parser.add_argument(
+		"--analyze",
+		action="store_true",
+		help="report operations that cancel out, could be merged or rotate the long way round",
+	)
+	parser.add_argument(
+		"--single-arg",
+		action="store_true",
+		help='pass each input as one quoted argument ("3 1 2") instead of one argument per number',
+	)
+	parser.add_argument(
+		"--no-budget",
+		dest="budget",
+		action="store_false",
+		help="do not stop push_swap when it exceeds the operation budget for its input size",
+	)
+	parser.add_argument(
+		"--no-dedupe",
+		dest="dedupe",
+		action="store_false",
+		help="run inputs with the same relative order separately instead of once",
+	)
+	parser.add_argument(
+		"--no-cache",
+		dest="cache",
+		action="store_false",
+		help="run every case even if its result is cached for the current binaries",
+	)
+	parser.add_argument(
+		"--results",
+		metavar="PATH",
+		help=f"file to save this run's results to (default: a new file in {RESULTS_DIR}/)",
+	)
+	parser.add_argument(
+		"--no-save",
+		dest="save",
+		action="store_false",
+		help="do not save this run's results",
+	)
+	parser.add_argument(
+		"-q", "--quiet",
+		action="store_true",
+		help="show a progress bar and one summary line per suite instead of the full report",
+	)
+	parser.add_argument(
+		"--events",
+		metavar="PATH",
+		help="also write every result as a JSON Lines event stream to PATH",
+	)
+	parser.add_argument(
+		"--junit",
+		metavar="PATH",
+		help="also write a JUnit XML report to PATH",
+	)
+	parser.add_argument(
+		"--suite",
+		dest="suites",
+		action="append",
+		metavar="NAME",
+		help="only run suites whose name contains NAME (case-insensitive; repeatable)",
+	)
+	parser.add_argument(
+		"--size",
+		dest="sizes",
+		type=int,
+		action="append",
+		metavar="N",
+		help="only run cases with N values (repeatable)",
+	)
+	parser.add_argument(
+		"--fail-fast",
+		action="store_true",
+		help="stop at the first failing case",
+	)
+	parser.add_argument(
+		"--time-budget",
+		type=float,
+		metavar="SECONDS",
+		help="stop after SECONDS and report how much of the suites ran",
+	)
+	parser.add_argument(
+		"--shard",
+		metavar="I/N",
+		help="run only shard I of N of the test suites (for splitting a run across machines)",
+	)
+	modes = parser.add_subparsers(dest="mode", metavar="MODE")
 
-	This function iterates through a predefined list of test cases (`ERROR_HANDLING`), where each test case
-	includes a name, the input arguments (`test`), and a boolean (`should_error`) indicating whether an error
-	is expected. It runs the PUSH_SWAP program with the given input and verifies if the output matches the
-	expected error behavior.
+	bench = modes.add_parser("bench", help="run seeded random inputs and report their statistics")
+	bench.add_argument("--count", type=int, default=TEST_COUNT, help=f"inputs per size (default: {TEST_COUNT})")
+	bench.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+	bench.add_argument(
+		"--sizes",
+		type=int,
+		nargs="+",
+		default=bench_sizes(),
+		help=f"input sizes (default: {' '.join(map(str, bench_sizes()))})",
+	)
 
-	If the BONUS feature is enabled, the function also tests the `checker` program by passing the output of
-	PUSH_SWAP as input and verifying its error handling behavior.
+	ab = modes.add_parser("ab", help="compare several push_swap binaries on the same inputs")
+	ab.add_argument("binaries", nargs="+", metavar="BINARY", help="push_swap binaries; the first one is the baseline")
+	ab.add_argument("--count", type=int, default=100, help="inputs per size (default: 100)")
+	ab.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+	ab.add_argument(
+		"--sizes",
+		type=int,
+		nargs="+",
+		default=bench_sizes(),
+		help=f"input sizes (default: {' '.join(map(str, bench_sizes()))})",
+	)
+
+	watch = modes.add_parser("watch", help="re-run the test suites whenever push_swap is rebuilt")
+	watch.add_argument("--interval", type=float, default=1.0, help="seconds between checks for a rebuild (default: 1)")
+
+	memcheck = modes.add_parser("memcheck", help="check benchmark and error inputs for leaks with Valgrind (or leaks)")
+	memcheck.add_argument(
+		"--sample",
+		type=int,
+		default=MEMCHECK_SAMPLE,
+		help=f"random inputs per size (default: {MEMCHECK_SAMPLE})",
+	)
+	memcheck.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+	memcheck.add_argument(
+		"--sizes",
+		type=int,
+		nargs="+",
+		default=bench_sizes(),
+		help=f"input sizes (default: {' '.join(map(str, bench_sizes()))})",
+	)
 
-	Prints:
-		- A success message if all tests pass.
-		- A failure message with details if any test fails.
+	stress = modes.add_parser("stress", help="measure parse-and-sort throughput on very large inputs")
+	stress.add_argument(
+		"--sizes",
+		type=int,
+		nargs="+",
+		default=[1000, 5000, 10000, 20000, 50000],
+		help="input sizes (default: 1000 5000 10000 20000 50000)",
+	)
+	stress.add_argument("--repeats", type=int, default=3, help="inputs per size (default: 3)")
+	stress.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+
+	fuzz = modes.add_parser("fuzz", help="check push_swap's argument parsing on generated malformed inputs")
+	fuzz.add_argument("--count", type=int, default=2000, help="inputs to generate (default: 2000)")
+	fuzz.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+
+	exhaustive = modes.add_parser("exhaustive", help="run every permutation of 1..SIZE")
+	exhaustive.add_argument("size", type=int, help="number of values (e.g. 6 for 720 permutations)")
+
+	sweep = modes.add_parser("sweep", help="fit push_swap's op count and run time against input size")
+	sweep.add_argument("--min", type=int, default=10, help="smallest size (default: 10)")
+	sweep.add_argument("--max", type=int, default=10000, help="largest size (default: 10000)")
+	sweep.add_argument("--steps", type=int, default=10, help="number of sizes (default: 10)")
+	sweep.add_argument("--repeats", type=int, default=5, help="inputs per size (default: 5)")
+	sweep.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+	sweep.add_argument("--size-time", type=float, default=30, help="time budget per size in seconds (default: 30)")
+	sweep.add_argument(
+		"--targets",
+		type=int,
+		nargs="*",
+		default=[100000],
+		help="sizes to extrapolate to (default: 100000)",
+	)
+
+	search = modes.add_parser("search", help="search for the inputs push_swap handles worst")
+	search.add_argument("--size", type=int, default=100, help="values per input (default: 100)")
+	search.add_argument("--time", type=float, default=60, help="time budget in seconds (default: 60)")
+	search.add_argument("--top", type=int, default=10, help="number of worst inputs to keep (default: 10)")
+	search.add_argument("--seed", type=int, default=42, help="random seed (default: 42)")
+	search.add_argument("--metric", choices=("ops", "time"), default="ops", help="what to maximise (default: ops)")
+	search.add_argument("--output", metavar="PATH", help="corpus file to write (default: corpus/worst_SIZE.bin)")
+
+	shrink = modes.add_parser("shrink", help="reduce a failing input to a minimal reproducer")
+	shrink.add_argument("numbers", nargs="+", help="the failing input, as separate arguments or one quoted string")
+
+	analyze = modes.add_parser("analyze", help="show the wasted operations in push_swap's output for one input")
+	analyze.add_argument("numbers", nargs="+", help="the input, as separate arguments or one quoted string")
+
+	compare = modes.add_parser("compare", help="compare two saved runs and fail on regressions")
+	compare.add_argument("old", nargs="?", help="baseline results file (default: second most recent run)")
+	compare.add_argument("new", nargs="?", help="results file to check (default: most recent run)")
+	compare.add_argument(
+		"--ops-threshold",
+		type=float,
+		default=2.0,
+		help="allowed increase of a suite's average ops, in percent (default: 2)",
+	)
+	compare.add_argument(
+		"--time-threshold",
+		type=float,
+		default=10.0,
+		help="allowed increase of a suite's p95 wall time, in percent (default: 10)",
+	)
+
+	merge = modes.add_parser("merge", help="combine the results of a sharded run and report them")
+	merge.add_argument("paths", nargs="+", metavar="PATH", help="the shards' results files")
+	merge.add_argument("--output", metavar="PATH", help=f"merged results file (default: a new file in {RESULTS_DIR}/)")
+
+	args = parser.parse_args(argv)
+	if args.jobs < 1:
+		parser.error("--jobs must be at least 1")
+	if args.shard:
+		try:
+			args.shard = parse_shard(args.shard)
+		except ValueError as e:
+			parser.error(f"--shard: {e}")
+		if args.mode:
+			parser.error("--shard only applies to the test suites, not to a mode")
+	# Only the suites and merge report through events; the other modes print their
+	# own reports, which these options would silently leave unchanged
+	if args.mode not in (None, "merge"):
+		for option, given in (("-q", args.quiet), ("--events", args.events), ("--junit", args.junit)):
+			if given:
+				parser.error(f"{option} only applies to the test suites and merge, not to {args.mode}")
+	return args
+
+def compare(args):
+	"""
+	Runs the `compare` mode.
 
 	Returns:
-		bool: True if all tests pass, False otherwise.
+		int: The exit status: 1 if the newer run regressed, 0 otherwise.
 	"""
-	count, bonus_count = 0, 0
-	for name, test, should_error in ERROR_HANDLING:
-		result = subprocess.run([PUSH_SWAP] + test.split(), capture_output=True, text=True)
-		if bonus:
-			result_bonus = subprocess.run(["./checker"] + test.split(), input=result.stdout, capture_output=True, text=True)
-			if ("Error" in result_bonus.stderr) != should_error:
-				print(f"❌ Error checker test failed: {name} - {test}")
-				return False
-			bonus_count += 1
-		count+=1
-		if ("Error" in result.stderr) != should_error:
-			print(f"❌ Error test failed: {name} - {test}")
-			return False
-	print(COLOUR["GREEN"],f"✅ Push Swap \"Error\" cases passed",COLOUR["ENDC"])
-	if bonus:
-		print(COLOUR["PURPLE"],f"✅ Checker \"Error\" cases passed",COLOUR["ENDC"])
-	return True
+	if args.old and args.new:
+		old, new = args.old, args.new
+	else:
+		# The newest run, against the newest earlier one that has real timings
+		runs = latest_runs(1)
+		new = runs[-1] if runs else None
+		old = args.old or (baseline_run(new) if new else None)
+		if old is None or new is None:
+			print_error_exit(f"Need two results files to compare (none given, fewer than two in {RESULTS_DIR}/)")
+	try:
+		regressions = compare_runs(old, new, args.ops_threshold, args.time_threshold)
+	except (OSError, ValueError) as e:
+		print_error_exit(e)
+	return 1 if regressions else 0
+
+def merge(args):
+	"""
+	Runs the `merge` mode: writes the combined results file and prints the same
+	per-suite report as a single-node run.
+
+	Returns:
+		int: The exit status: 1 if any case failed, 0 otherwise.
+	"""
+	try:
+		path, cases = merge_runs(args.paths, args.output)
+	except (OSError, ValueError) as e:
+		print_error_exit(e)
+	print(COLOUR["HEADER"], f"Merged {len(args.paths)} shards ({len(cases)} cases) into {path}", COLOUR["ENDC"])
+	suites = {}
+	for case in cases:
+		suites.setdefault(case["suite"], []).append(case)
+	failed = 0
+	# Replay the records as the events a single-node run would have emitted
+	for suite, records in suites.items():
+		events.emit("suite_start", suite=suite, count=len(records))
+		passed = []
+		sizes = []
+		for record in records:
+			fields = {key: value for key, value in record.items() if key != "type"}
+			events.emit("case", id=f"{suite}/{record['index']}", **fields)
+			result = to_result(record)
+			if result.ok:
+				passed.append(result)
+				sizes.append(record["size"])
+			else:
+				failed += 1
+		events.emit("suite_end", suite=suite, total=len(records), **suite_summary(passed, len(records), sizes))
+	return 1 if failed else 0
 
 def main():
 	"""
 	Main function to execute the push_swap tester.
 	"""
+	args = parse_args()
+	events.add_sink(ProgressRenderer() if args.quiet else ConsoleRenderer())
+	if args.events:
+		events.add_sink(JsonLinesSink(args.events))
+	if args.junit:
+		events.add_sink(JUnitSink(args.junit))
+	atexit.register(events.close)
+	if args.mode == "compare":
+		sys.exit(compare(args))
+	if args.mode == "merge":
+		sys.exit(merge(args))
 	try:
-		check_push_swap()
-		check_checker()
+		# ab runs the binaries it is given, not ./push_swap
+		if args.mode != "ab":
+			check_push_swap()
+		if args.cross_check or args.pipe:
+			check_checker()
 		mem = set_mem_tester()
 		bonus = check_bonus()
+		check_launcher()
 	except Exception as e:
 		print_error_exit(e)
 	if bonus:
 		print(COLOUR["GREEN"], "Bonus Checker found", COLOUR["ENDC"])
+	options = {"cross_check": args.cross_check}
+	if args.pipe:
+		options["pipe"] = True
+	if args.analyze:
+		options["analyze"] = True
+	if args.single_arg:
+		options["single_arg"] = True
+	if not args.budget:
+		options["budget"] = False
+	if args.cache:
+		options["cache"] = ResultCache()
+		atexit.register(options["cache"].prune)
+	recorder = None
+	# Only the suites, bench and exhaustive runs produce case results to save
+	if args.save and args.mode in (None, "bench", "exhaustive"):
+		recorder = ResultWriter(args.results, args.shard)
+		events.add_sink(recorder)
+	if args.mode == "bench":
+		for size in args.sizes:
+			run_benchmark(size, args.count, args.seed, jobs=args.jobs, recorder=recorder, **options)
+		return
+	if args.mode == "ab":
+		if len(set(args.binaries)) != len(args.binaries):
+			print_error_exit("Each binary can only be listed once")
+		for binary in args.binaries:
+			if not (os.path.isfile(binary) and os.access(binary, os.X_OK)):
+				print_error_exit(f"{binary} is not an executable file")
+		for size in args.sizes:
+			run_ab(args.binaries, size, args.count, args.seed, bonus, jobs=args.jobs, **options)
+		return
+	if args.mode == "watch":
+		Watcher(SUITES, bonus, args.jobs, args.interval, dedupe=args.dedupe, **options).watch()
+		return
+	if args.mode == "memcheck":
+		if not mem:
+			print_error_exit("No memory tester available (install valgrind, or leaks on macOS)")
+		clean = memcheck_class(mem, "error cases", [test.split() for _, test, _ in ERROR_HANDLING], args.jobs)
+		for size in args.sizes:
+			inputs = list(generate(size, args.sample, args.seed))
+			clean = memcheck_class(mem, f"{size} values", inputs, args.jobs) and clean
+		sys.exit(0 if clean else 1)
+	if args.mode == "stress":
+		run_stress(args.sizes, args.repeats, args.seed, jobs=args.jobs, **options)
+		return
+	if args.mode == "fuzz":
+		failures = run_fuzz(args.count, args.seed, bonus, args.single_arg, jobs=args.jobs)
+		sys.exit(1 if failures else 0)
+	if args.mode == "sweep":
+		sizes = geometric_sizes(args.min, args.max, args.steps)
+		run_sweep(sizes, args.repeats, args.seed, args.size_time, args.targets, jobs=args.jobs, **options)
+		return
+	if args.mode == "search":
+		worst, failures = search_worst(args.size, args.time, args.top, args.seed, args.metric, jobs=args.jobs, **options)
+		for numbers, result in failures[:3]:
+			print(result.message or f"❌ Failed on: {numbers} ({result.status})")
+		if failures:
+			print(COLOUR["RED"], f"❌ {len(failures)} inputs failed", COLOUR["ENDC"])
+		for score, numbers in worst:
+			print(f"{score * 1000:.2f} ms" if args.metric == "time" else f"{score} ops")
+		if worst:
+			path = save_worst(worst, args.size, args.output)
+			print(COLOUR["GREEN"], f"Saved {len(worst)} inputs to {path}", COLOUR["ENDC"])
+		return
+	if args.mode == "analyze":
+		numbers = [int(n) for n in " ".join(args.numbers).split()]
+		result = subprocess.run([PUSH_SWAP] + [str(n) for n in numbers], capture_output=True, text=True, timeout=TIMEOUT)
+		summary, optimized = analyze_ops(numbers, result.stdout.splitlines())
+		print(COLOUR["BLUE"], " ".join(f"{k}: {v}" for k, v in summary.items()), COLOUR["ENDC"])
+		print("\n".join(optimized))
+		return
+	if args.mode == "shrink":
+		numbers = [int(n) for n in " ".join(args.numbers).split()]
+		shrink_input(numbers, jobs=args.jobs, **options)
+		return
+	if args.mode == "exhaustive":
+		run_exhaustive(args.size, jobs=args.jobs, dedupe=args.dedupe, recorder=recorder, **options)
+		return
+
 	# Run tests
-	print(COLOUR["HEADER"], "Starting tests...", COLOUR["ENDC"])
-	run_error_cases(bonus, mem, "Error Handling", ERROR_HANDLING)
-	# run_test_cases(bonus, "No Arguments", NO_ARGUMENT)
-	run_test_cases(bonus, "Edge Cases", EDGE_CASES)
-	run_test_cases(bonus, "Almost Sorted", ALMOST_SORTED)
-	run_test_cases(bonus, "Descending Order", DESCENDING_ORDER)
-	run_test_cases(bonus, "Random Order", RANDOM_ORDER)
-	run_test_cases(bonus, "Benchmarks: 3", BM_3)
-	run_test_cases(bonus, "Benchmarks: 5", BM_5)
-	run_test_cases(bonus, "Benchmarks: 100", BM_100)
-	run_test_cases(bonus, "Benchmarks: 500", BM_500)
+	start = time.monotonic()
+	deadline = time.time() + args.time_budget if args.time_budget is not None else None
+	events.emit("run_start", push_swap=PUSH_SWAP, checker=CHECKER, shard=args.shard)
+	if args.shard:
+		index, count = args.shard
+		suites = shard_suites(SUITES, index, count)
+	else:
+		index = 1
+		suites = [(name, cases, None) for name, cases in SUITES]
+	# Error cases are not recorded, so only the first shard runs them. They have
+	# no size, so --size skips them too.
+	wanted = not args.sizes and (not args.suites or any(n.lower() in "error handling" for n in args.suites))
+	if index == 1 and wanted:
+		if not run_error_cases(bonus, mem, "Error Handling", ERROR_HANDLING, jobs=args.jobs, deadline=deadline) and args.fail_fast:
+			sys.exit(1)
+	_, failed = run_scheduled(
+		bonus, select(suites, args.suites, args.sizes),
+		jobs=args.jobs, dedupe=args.dedupe, fail_fast=args.fail_fast,
+		time_budget=args.time_budget, started=start, **options,
+	)
+	events.emit("run_end", elapsed=time.monotonic() - start)
+	if args.fail_fast and failed:
+		sys.exit(1)
 
 if __name__ == "__main__":
 	main()
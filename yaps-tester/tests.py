@@ -1,6 +1,5 @@
 import random
-
-random.seed(42)
+from corpus import Suite, packed
 
 # TODO: check if still using this one?
 NO_ARGUMENT = [
@@ -79,54 +78,59 @@ DESCENDING_ORDER = [
     ("Descending order range 0 to -100", " ".join(map(str, range(0, -100, -1)))),
 ]
 
-# Pre-generate random samples
-random_2_elements = random.sample(range(-2147483648, 2147483647), 2)
-random_3_elements = random.sample(range(-2147483648, 2147483647), 3)
-random_5_elements = random.sample(range(-2147483648, 2147483647), 5)
-random_10_elements = random.sample(range(-2147483648, 2147483647), 10)
-random_25_elements = random.sample(range(-2147483648, 2147483647), 25)
-random_50_elements = random.sample(range(-2147483648, 2147483647), 50)
-random_100_elements = random.sample(range(-2147483648, 2147483647), 100)
-random_500_elements = random.sample(range(-2147483648, 2147483647), 500)
+def _random_order():
+    # Drawn on first use rather than at import; the fixed seed keeps the samples
+    # identical from run to run
+    rng = random.Random(42)
+    random_2_elements = rng.sample(range(-2147483648, 2147483647), 2)
+    random_3_elements = rng.sample(range(-2147483648, 2147483647), 3)
+    random_5_elements = rng.sample(range(-2147483648, 2147483647), 5)
+    random_10_elements = rng.sample(range(-2147483648, 2147483647), 10)
+    random_25_elements = rng.sample(range(-2147483648, 2147483647), 25)
+    random_50_elements = rng.sample(range(-2147483648, 2147483647), 50)
+    random_100_elements = rng.sample(range(-2147483648, 2147483647), 100)
+    random_500_elements = rng.sample(range(-2147483648, 2147483647), 500)
 
-RANDOM_ORDER = [
-    ("Random order 2 elements 1", "1 2"),
-    ("Random order 2 elements 2", "2 1"),
-    ("Random order 2 elements 3", "0 -1"),
-    ("Random order 2 elements 4", " ".join(map(str, random_2_elements))),
-    # 3 numbers
-    ("Random order 3 elements 1", "1 2 3"),
-    ("Random order 3 elements 2", "1 3 2"),
-    ("Random order 3 elements 3", "2 1 3"),
-    ("Random order 3 elements 4", "2 3 1"),
-    ("Random order 3 elements 5", "3 1 2"),
-    ("Random order 3 elements 6", "3 2 1"),
-    ("Random order 3 elements 7", " ".join(map(str, random_3_elements))),
-    # 5 numbers
-    ("Random order 5 elements 1", "1 2 3 4 5"),
-    ("Random order 5 elements 2", "1 2 5 4 3"),
-    ("Random order 5 elements 3", "5 4 3 2 1"),
-    ("Random order 5 elements 4", "5 4 1 2 3"),
-    ("Random order 5 elements 5", "3 2 1 5 4"),
-    ("Random order 5 elements 6", "4 5 1 2 3"),
-    ("Random order 5 elements 7", " ".join(map(str, random_5_elements))),
-    # 10 numbers
-    ("Random order 10 elements 1", "1 2 3 4 5 6 7 8 9 10"),
-    ("Random order 10 elements 2", "1 2 3 4 5 10 9 8 7 6"),
-    ("Random order 10 elements 3", "10 9 8 7 6 1 2 3 4 5"),
-    ("Random order 10 elements 4", "10 9 8 7 6 5 4 3 2 1"),
-    ("Random order 10 elements 5", "5 4 3 2 1 10 9 8 7 6"),
-    ("Random order 10 elements 6", "6 7 8 9 10 1 2 3 4 5"),
-    ("Random order 10 elements 7", " ".join(map(str, random_10_elements))),
-    # 25 numbers
-    ("Random order 25 elements", " ".join(map(str, random_25_elements))),
-    # 50 numbers
-    ("Random order 50 elements", " ".join(map(str, random_50_elements))),
-    # 100 numbers
-    ("Random order 100 elements", " ".join(map(str, random_100_elements))),
-    # 500 numbers
-    ("Random order 500 elements", " ".join(map(str, random_500_elements))),
-]
+    return [
+        ("Random order 2 elements 1", "1 2"),
+        ("Random order 2 elements 2", "2 1"),
+        ("Random order 2 elements 3", "0 -1"),
+        ("Random order 2 elements 4", " ".join(map(str, random_2_elements))),
+        # 3 numbers
+        ("Random order 3 elements 1", "1 2 3"),
+        ("Random order 3 elements 2", "1 3 2"),
+        ("Random order 3 elements 3", "2 1 3"),
+        ("Random order 3 elements 4", "2 3 1"),
+        ("Random order 3 elements 5", "3 1 2"),
+        ("Random order 3 elements 6", "3 2 1"),
+        ("Random order 3 elements 7", " ".join(map(str, random_3_elements))),
+        # 5 numbers
+        ("Random order 5 elements 1", "1 2 3 4 5"),
+        ("Random order 5 elements 2", "1 2 5 4 3"),
+        ("Random order 5 elements 3", "5 4 3 2 1"),
+        ("Random order 5 elements 4", "5 4 1 2 3"),
+        ("Random order 5 elements 5", "3 2 1 5 4"),
+        ("Random order 5 elements 6", "4 5 1 2 3"),
+        ("Random order 5 elements 7", " ".join(map(str, random_5_elements))),
+        # 10 numbers
+        ("Random order 10 elements 1", "1 2 3 4 5 6 7 8 9 10"),
+        ("Random order 10 elements 2", "1 2 3 4 5 10 9 8 7 6"),
+        ("Random order 10 elements 3", "10 9 8 7 6 1 2 3 4 5"),
+        ("Random order 10 elements 4", "10 9 8 7 6 5 4 3 2 1"),
+        ("Random order 10 elements 5", "5 4 3 2 1 10 9 8 7 6"),
+        ("Random order 10 elements 6", "6 7 8 9 10 1 2 3 4 5"),
+        ("Random order 10 elements 7", " ".join(map(str, random_10_elements))),
+        # 25 numbers
+        ("Random order 25 elements", " ".join(map(str, random_25_elements))),
+        # 50 numbers
+        ("Random order 50 elements", " ".join(map(str, random_50_elements))),
+        # 100 numbers
+        ("Random order 100 elements", " ".join(map(str, random_100_elements))),
+        # 500 numbers
+        ("Random order 500 elements", " ".join(map(str, random_500_elements))),
+    ]
+
+RANDOM_ORDER = Suite(_random_order)
 
 # BENCHMARKS
 BM_3 = [
@@ -155,45 +159,8 @@ BM_5 = [
     ("Five values random #7", "758918509 1033660083 1684398416 194847796 -1774084222"),
     ("Five values random #8", "388662377 -335343207 -2010978061 -2019505554 -1745065638"),
 ]
-BM_100 = [
-	# 100 values: from 1 to 5 points depending on the number of actions:
-    ("100 values #1", "598833565 -1669320321 -2040063279 1037451515 -966241705 -1095681136 -1188800802 -1548172823 1015636137 -1707270233 758918509 1033660083 1684398416 194847796 -1774084222 388662377 -335343207 -2010978061 -2019505554 -1745065638 -1208440693 -1148212712 23000785 438167108 -2033512525 263045542 -1293482455 927797169 643748745 864684172 193022198 -345659740 -1200698400 -218145494 383393196 -952663664 1328993675 1586132811 -2119571681 1111569163 1313483709 -1461752124 851002234 -332368623 -686118794 -954035319 -1479704272 -1222718085 1963715171 1131698670 -701821063 -1708493843 -1749143279 -515708291 -1732089961 -605678962 1492476947 -670205071 445499907 -1011375194 1319105919 -1960865437 986690512 -174268826 155598469 -1611359368 2032016716 1813744801 -521690861 -1809039384 223512817 -888292543 1414782258 552503726 509038458 1655502639 1553519297 -594273040 332224959 -1321610452 878629360 -1848746542 -1950669415 692620697 -1168668018 1172819594 -904571827 2084010572 -1804779727 1526077990 -1147654408 1574035378 -1713685808 -514853929 -953596103 -200101229 582760239 1434993374 -580541375 -1448889623"),
-    ("100 values #2", "-557568504 -621607597 -1247657810 730896804 -1000822651 866811646 1875417161 788331224 635807147 -1840812201 468714099 579727331 -1412448767 146629639 984092116 -1096028725 -1445675281 -162091150 -517734921 -988066573 2102486758 1827041186 601294376 808149444 244597305 -1204243674 792912175 -754699905 1472537765 1152398028 1185410617 -1907231987 -1163729671 1382131627 -2009614173 1310161742 -792623108 -424493989 -997545314 -1863205759 -1241319252 1774406112 1902282724 288536126 1616486638 935934671 -795952425 -1234259601 667603989 -3301711 -448257584 1652201549 1780468325 613544114 -176729943 -1533854845 -1009831970 -1547775971 -1088226568 1052219673 263574139 167406184 -1019017028 1060916230 363294073 -307374393 1708636277 358771184 -432071529 -592720745 -1205508168 2135997924 2136907760 -1553353340 40915112 -27849249 -1757030696 1098576010 -1945120363 1550925206 -1676544203 -1491035169 547376580 -1460366207 1254471308 775160916 -334320408 414073652 -1874634224 -494920635 -508441310 411837641 2130825113 -137224702 125045161 -1067668244 2023266233 228603483 1549537005 1900226095"),
-    ("100 values #3", "-2098173040 774311335 947993017 -1655487669 780440087 1652653821 158786356 1077511952 -1001478200 1153622755 605426323 -686441105 -1668370711 -886910200 -280181094 -1468201270 -198755165 -2133545127 1949124556 953878130 1614276077 943521291 -1016236318 2026743947 2517343 1125119086 -1380179660 32992540 1772223087 -1690452644 1591365142 538160238 -865673048 1467458679 596783527 32911828 468023495 -1293166967 -1491043971 -541535892 1127475297 -1453635819 169131618 1947766591 1196691599 1814340549 130368030 1797415901 -2145027375 424963764 -755243973 -48938107 -2063831678 -1667015429 1842964529 -588493131 1626598064 2084439435 1424492601 1317587757 -826720513 -1119043785 -1898696934 -1112948055 1623538872 289295842 1919633270 -1809224697 -1779604887 996035535 -60170527 1357309536 -1850218168 2052927744 1119277765 140471910 1141750196 -1607346352 -1596046499 686124556 -106161378 1919200460 213904816 -1438268757 -1009074109 118857987 1599587738 457817382 -330120033 1994423488 -1237817311 1842169438 168775419 1096355667 987546410 815475292 -1283546401 914608870 -808672358 -433824774"),
-    ("100 values #4", "2126650302 737389881 643721358 -543654799 -265858143 1716329419 75487668 -208365425 -1627774569 -1082737123 -1182415921 -1872494500 -695417189 -2057142183 379283042 231591171 -1159148397 379847410 -1201657162 -2116599210 -1842570666 892670062 563082934 -1894622752 -1164186156 -1858001466 1741265702 -2012566021 1544622273 -728304068 -1843153645 60800080 -1125261523 -951432901 725754023 -62644249 -1227343558 168508467 -1579208593 959291947 1870519414 1642322787 305127770 327326531 -117377031 -1103818456 1222431135 -116080352 1320689565 -399174414 -1329679265 -1742357420 -1731168981 682825722 -296132909 -625787169 -328227311 -381812804 -141627981 1562666924 983873306 -1914820186 744595043 659086287 2079473744 627837249 -1724782098 -1887154193 -418238406 980169899 -690190073 1291034993 1553371742 -1678176729 -1079512828 -1324610560 -1330542609 155846116 -220703107 -1545405260 -335515807 -1359408522 -951141351 -160511211 -1074573121 1608404927 1817911932 -1823708014 -244251596 1322945467 1551982567 1528866158 216145571 -1726968859 -1930208424 653457336 2144401877 174323841 1443227504 -2084099160"),
-    ("100 values #5", "2014323587 -1746923081 1831232233 1089055536 1497636773 -1132241472 -1433182878 -401948550 -61670889 -80064962 -1229446015 1566161521 -425028731 1728478964 -1895646512 -1440372600 -519806493 -2138226393 2084385608 -470634972 -1008445188 1831881167 1220073926 1224621261 -193237574 -922347534 -330680342 844354072 1964164291 990012790 2127824253 1217028494 239523124 695231969 938056394 -57245831 -1482636329 -1331878516 -873133230 -1212465428 2013091398 -1896299818 340076736 1012483461 181227024 -1885672885 1065046939 -800561222 -1901960661 -1932123966 361540026 -99692566 12242276 1801253991 1514920394 133685755 -1471315227 -1903187744 1979030306 33623138 -1803407533 1509004752 -1349371498 -1853186775 408172673 -1855593968 752532172 1554001644 -1137290602 -413280849 -1632574582 1896640907 1676271257 299253624 -1089996780 338954755 405956694 -1976794498 512739685 -1795367596 -346926365 675912594 359369740 280147507 97851029 -788685505 1867049173 -1027503518 -1270197064 728967515 928536717 -798074214 -1122335267 -1006677999 -447596378 -1585365723 737403900 624921128 -859006014 -183719051"),
-    ("100 values #6", "-789512950 1842619707 1081749746 1871464539 -1835913341 -2107474061 -179162329 520375021 2140845506 270555620 2130718029 -1718067435 -1832831264 161638539 -1231992853 25274572 -1008456529 -1578587032 1860834878 -648502119 1635799169 -1852027229 1628953283 -1098290076 -560376878 -923472110 -1469966152 -265495264 1433423666 185619724 874197315 -848182426 479652332 2078134140 2092650073 1318984209 661323238 124299343 -2113883664 720966961 1361951898 234515030 -861661718 1854378078 701749191 -1702583014 1885189998 1624042949 -1570707697 -1011611153 -1651721300 1673803351 -1687767639 1041171739 228593815 -1479839958 -977756967 -937349669 450240683 -1242836179 934637223 -674824022 -1273039861 805294034 576547625 1515749002 -1013681434 23231729 -49255328 -1068926095 1740906951 1753029752 1486504128 -1929304049 -1751064759 576747299 -328239565 1414539292 -959151117 -1958132435 -2132255026 -714869226 1164448205 -1585617504 588897460 2060716514 -1022394339 -1453494337 1036078879 -249814583 221965721 883334972 -310582327 261593008 -2105952602 -1666988984 -1824313759 1911479203 1645429424 820423017"),
-    ("100 values #7", "1734860010 -1507300357 195808827 -1992743970 1437074667 -561713064 354375888 225593570 -1511425673 -301563753 -1600109310 -1967830050 -823524121 -581317334 1713612425 1860098823 1271835614 2028067495 1549205809 -1976136473 1713368256 -610704698 -1245211796 781970486 -1075761593 716973562 -1705988413 -628445494 1203090108 257197751 1649845980 1609378883 -402106049 2035114500 518237226 1071498201 -1483682115 1828641689 1846324917 -1130704564 1565969556 -1449543883 2045289321 1288004969 1334754394 -1387049520 1638170128 -376692625 -2041027014 -1377135469 1016036649 1823159041 -720757946 1212840744 1850340137 -379189078 1298090018 729745562 1563643079 1009564429 1334658154 -1081613470 -1001561845 -1463734127 1234264127 864483236 -1683216473 -504479462 1598444176 -1981162742 1540146295 -125885403 -1192138111 -1290324880 1359729104 1797237234 -170496300 -645712157 -836698854 1376693271 1268499238 1594820299 -1169968454 -1190034281 -2045845669 687337306 -1317997513 -436085296 -737609300 -950892630 1564883977 -1849323792 2005273424 1173928982 -948650920 -639322511 607659445 40397067 -430878050 771024429"),
-    ("100 values #8", "2066522149 1476013453 155545383 -725205800 1886509177 -2028940240 -1652094618 1619367643 2020355234 -1025572916 -1380540709 346130269 1986569751 2076833914 -1007314299 -1983170238 -1681898244 414770380 -281046516 -662768828 981593561 1230199651 -800249825 -273186191 456163541 2079777135 49061677 -1650788775 -493081885 1715859753 328943149 -1331101523 -1053458804 -1956844950 896725968 -274630859 -2140219677 85557236 1827831414 1316454144 165150060 802545317 942444660 1890915691 1039167658 1018069121 732843843 -1301224198 -583164330 -295075421 -1846948438 1927901229 705395476 1807197061 -729285297 528948455 -799226234 701743846 1494714259 -1612221994 943837344 1718188083 -857609328 30590942 -819116138 716799561 -393449451 -746538748 -419187146 847003686 -877654240 233699835 -1600786698 -1323536714 -341680386 708366497 1891347559 -519067073 761574764 1065729806 1730036646 -1400041916 496132783 296804825 -854913766 -403404075 205888738 1433338704 -2145740149 -842350665 -915198612 -1244755903 -301128120 1227324827 343532006 458107940 664455594 -763433734 -150374583 -250027164"),
-    ("100 values #9", "-248421783 754313246 -1229643110 47991950 -115164478 1261583925 1723058500 1974963399 1271416665 1013446705 -1418664667 682258776 -1783289592 -928630320 66365865 703746870 570976631 512221260 -707861029 -1746388694 1367618340 1941323745 1078630084 -1138730705 742151744 -814242203 -1182659329 1316677622 -1292227096 -1514603189 -2042577393 -1948997232 -1095892942 2078489380 -106788605 477918071 1502111965 1153152937 -1834688784 -191486108 -367473076 1658445405 557338076 325004042 -1312390676 937788545 843335079 -498308682 -24149867 -430987677 -1099578444 -1513669564 670264041 805832140 -2123668857 1686461089 1077884216 1548080441 1159839533 1655560457 -1689694699 1195806553 -321494637 -1207568121 -1392056113 1306141882 1966949168 841434668 77127955 -152257066 -1931797340 246556025 -1077185210 1793020037 1496093223 -1626252426 -186995009 -1574796575 1294574447 -151856130 719740865 133710413 2095482116 253082200 409964581 -784699310 1932905379 1096290450 1681161553 -246645260 483838034 1352942642 941774472 1683714350 20522051 -314646052 1419783763 1747427769 205608475 -232299290"),
-    ("100 values #10", "1705995833 -1463905656 1046492151 1552608816 -108772472 -214448743 -1034264417 1081373070 -1085597072 1459699981 591251375 -956440478 1141661073 1192604345 91482003 -66155304 544380393 -1119930471 -968096593 -258245225 -1814695177 917168219 -920290575 -1140341388 -980476135 -705029448 -774341532 1688037405 172452487 -1801405237 -1553171577 -1499670890 -1154223144 -502359597 833008113 -1491190046 886563470 -1228563028 -1871622831 -365639596 -396857670 -726358910 183013467 -146353990 -361746897 -1880054436 -1259136708 1429756686 -342980961 -474693493 1738768001 1158764031 361118326 1915821847 839764846 -2063594554 1532152408 1634907941 1140720003 325087583 -513759564 -98871290 -2122160188 1901560944 -636691076 -864952066 1088667389 -472503751 1518047381 1682087611 1947468465 1441943667 -347800947 164156075 1063071711 1007745618 198136737 1287923971 443466485 1708586726 -1200277172 -50553991 -1205074881 -975235402 -275582370 -61667137 -2022822982 -477354676 -703818258 725306679 769408531 1280511542 -410956769 962851711 -1438621934 1462460680 -140058244 1801917546 -1599326461 2064685183"),
-]
-
-BM_500 = [
-    # 500 values: from 1 to 5 points depending on the number of actions:
-    ('500 values #1', '1119 -1044 -1398 -374 -497 -586 -929 -1081 1271 733 -1144 918 228 -1370 -1378 -1117 -605 -548 569 965 -1392 798 -686 1432 1161 1372 732 218 -598 339 913 -361 -1474 -847 1359 231 -107 -362 -864 -619 -122 -1082 -1121 56 -1104 -30 -92 972 -417 -1323 381 696 -989 50 -1178 761 -300 1074 1033 -19 864 -713 1385 -1216 -1313 1208 -567 -315 -1174 -547 -1087 1456 1462 357 1103 -6 -834 16 -45 -642 1245 -407 1374 1299 1154 -1208 995 1100 -800 687 -498 -831 393 54 -395 1121 1318 781 -601 1304 -172 -1271 -562 -1369 -208 143 -404 -1229 -636 823 -212 -630 1184 544 120 1133 379 -915 -416 1493 -490 799 707 -424 894 254 890 135 -18 -602 -934 587 521 -1128 -1308 -1051 -874 1070 -845 1287 229 942 -1240 76 63 940 417 667 -471 766 -1453 1286 -1031 1292 699 -408 1125 1463 1498 -298 280 -853 358 -1487 -422 550 -769 579 -1065 1061 -278 1117 1332 994 1477 1363 31 -839 709 672 -1498 953 -173 501 -1421 -1042 -14 -241 -520 -1263 -514 1390 1445 -1150 490 -1217 681 -985 -975 1202 446 751 -824 -415 661 984 233 -633 708 -677 -224 134 1251 1475 29 294 619 349 -1005 -485 -580 -1238 -116 -1414 909 768 -558 910 1471 -1471 -1210 1084 -1259 -563 -1224 -1372 -147 1269 605 -526 -360 1240 488 -623 1291 -959 838 860 436 -505 437 167 -721 -1114 -1103 1199 265 -49 234 183 412 -1279 1176 1146 -1097 -1252 149 -111 -1053 -482 -716 1247 1448 337 -926 1487 -749 1259 394 -477 -1192 315 754 -1099 -1293 1171 714 -1440 -1118 -532 -819 164 489 471 -625 142 -1260 -826 52 -1492 99 -414 363 -332 232 776 493 -866 -723 -285 -609 -1261 872 720 -1251 -216 -1266 -1295 892 452 559 675 -856 -1268 580 -1172 -739 -1220 937 -1222 -537 153 -1009 833 -492 871 935 -1338 1036 -1165 217 1373 815 641 -205 -432 -664 -214 -523 -413 121 -964 1143 -272 372 1155 -1203 -1462 377 1044 806 -1091 -1200 702 -627 572 1198 -958 -71 -1219 -500 13 -333 -854 1284 725 -261 1005 666 -1468 771 -274 -1076 -950 1451 -1028 -1062 1350 1461 -385 -346 977 -638 -96 -667 1097 -419 570 1316 -472 -1292 -1122 1241 -367 -1320 -1486 -134 -965 -428 1322 309 759 251 797 -1461 1314 1219 -890 734 -1353 12 885 763 -894 260 -978 -1329 -238 -7 -1337 -35 -640 -478 -1079 -52 793 1434 1042 -867 -531 -835 -775 188 -1399 -766 -140 186 -484 1344 -848 -1058 66 -1342 427 -589 -683 385 -68 -250 -568 -587 -1404 -709 132 -156 -359 1436 -357 -62 586 137 1227 -144 -1387 1114 -431 1333 878 1150 -1344 -1056 943 279 -85 1387 287 983 594 -1027 77 861 -722 -457 -1319 286 -1494 629 705 -693 -9'),
-    ('500 values #2', '266 -1214 1220 -148 1052 -215 1217 -990 1448 -270 577 -234 1231 172 -164 148 1355 -289 770 -979 -715 222 1223 52 1274 -788 1021 831 -268 163 744 -1499 -256 -325 -640 260 875 984 1181 -181 404 309 311 1267 -625 593 438 -805 1198 -1153 -338 611 1219 1092 1036 -128 -1118 -538 1255 -229 -580 -685 -897 -1400 -1311 -498 446 1003 -1202 365 197 1079 857 -704 1352 72 524 136 -501 -896 1187 1316 -1478 -1064 241 -604 -780 1350 621 402 -1295 783 -480 -1003 369 -954 403 1234 675 789 938 -201 312 1009 567 247 1469 326 -849 444 343 -439 -488 1111 -365 635 484 1067 -521 -376 301 -1183 -330 -540 -388 -125 -191 712 -1170 -934 -883 -553 68 1342 -875 -624 -1237 199 169 -145 722 408 203 -1245 -653 220 95 892 1348 -1420 858 58 453 -1476 -60 -277 97 216 704 736 970 -597 499 -602 -383 285 489 -1382 92 -124 1239 1281 156 -824 414 -978 1048 687 -1390 113 924 811 1215 -1389 -1157 1132 255 -945 391 -756 1409 -435 1476 -160 -634 362 -162 -118 1307 -361 226 -467 -1165 426 -1421 709 -1287 -67 -582 1162 -1219 1169 -1336 -1373 1387 -684 -1417 1044 -876 -523 -983 439 1242 -1032 810 -608 1459 -451 10 -813 981 987 -1031 -830 -226 -1058 870 -1395 -223 1349 37 124 -688 -1189 925 1069 -506 -1083 -265 959 -1005 818 -1332 -78 682 254 1209 17 -1218 572 1152 -103 -1449 1354 507 -1068 275 -17 1103 383 -874 283 -779 637 1164 -394 1022 1341 480 1273 284 926 -401 -180 -495 -1146 -358 346 -502 1403 834 999 1301 -123 -1383 1423 -169 1310 497 -632 -47 -442 -106 -355 941 -369 776 -1459 616 -718 -1150 -512 164 501 774 -516 450 1145 510 335 -1430 -1119 -295 -593 1327 -504 -246 882 11 1453 767 674 -92 242 754 -146 -59 358 -391 -245 -471 -556 -1006 -712 -208 -1011 694 -742 -716 -614 483 -368 914 648 944 -341 -1089 -705 -287 -569 -22 -766 -262 -1443 1322 -982 -377 -1314 -1277 766 -304 1279 1112 1461 -1080 -1450 851 -336 422 460 304 -105 -745 -1290 -466 456 -1033 -1233 141 514 -1197 863 1078 -1281 -879 -889 805 1467 -1152 -484 -1015 785 204 983 1195 1033 -576 640 1351 345 313 -283 910 256 -250 829 1043 -1254 997 -1094 -649 1062 -636 -417 -1168 -857 -518 -789 760 -1193 -859 -1490 173 1090 932 424 -308 -1367 -552 -320 -342 359 -1209 -544 1076 915 -690 1415 -1030 730 1439 -890 -412 -918 -1208 -1256 -821 -241 937 1472 -318 298 -991 419 -255 1484 -385 549 711 522 293 -1171 949 -1337 269 1216 972 -475 1262 -1126 -563 856 904 -1416 -397 860 1287 -783 427 625 1457 1300 -757 897 1334 1110 -1127 425 -75 1486'),
-    ('500 values #3', '-135 -185 1244 -1072 -842 -150 186 1341 529 -320 1213 140 753 -1350 362 -1140 -212 -467 -176 -1026 155 607 -1496 1193 722 392 192 -1278 -732 623 -19 1050 541 1061 310 -1289 -667 -407 749 -964 -321 294 1360 485 -1003 -1382 1080 993 -520 1407 -852 -228 756 -1444 762 171 -1119 -580 -1036 390 -1019 1153 -870 1467 1435 -305 584 1389 -381 201 476 434 -502 370 757 -908 71 -720 955 581 -941 -1215 -369 199 -108 579 -406 -1490 -342 -278 904 875 1203 505 -892 329 706 483 -87 -139 760 725 45 365 -182 -728 1356 -522 842 68 -544 182 -1322 -197 437 61 81 1218 1170 -877 528 -1349 -983 557 917 -141 -1089 303 -1092 654 371 -1438 -910 179 1181 -868 -1194 423 -415 -114 1052 1337 128 1161 -1172 -155 1262 685 56 -203 1067 498 716 -1353 1029 -1220 -539 1085 1303 -323 -569 -1130 277 -1097 1095 1373 317 -819 -274 1454 -1312 -172 -1271 -299 -32 35 264 -904 -500 675 187 818 1292 -763 -804 -783 -1177 996 66 1038 1298 -514 538 888 -914 -549 388 1112 -460 382 -455 1231 -1462 405 -322 1275 738 -853 -1198 309 -85 906 -275 1117 237 -476 1369 -263 -685 75 479 -1064 -529 62 1391 -30 854 -289 -291 -1411 1196 121 -376 -1467 1318 -1300 983 534 -328 -558 986 -57 -603 1107 -722 1043 -474 1200 -940 1073 -1103 1070 1147 -1339 -235 305 -1364 873 -6 -962 -1131 -292 -162 1430 -781 -678 -959 709 -2 674 555 -384 -827 -448 473 1238 -113 -1029 418 -1192 -924 -576 127 782 1309 1239 116 -1443 -417 697 -994 1485 9 -427 894 60 1115 21 -1057 -543 431 -1398 1037 799 -157 998 -594 1152 -1242 1102 401 1282 1159 172 -1023 -928 -1315 -1348 -254 517 -1025 -1102 1343 701 -945 91 358 19 712 216 905 1364 1416 -1095 504 1021 1444 -355 -1366 17 -611 316 321 -533 -15 -1094 4 730 1141 -31 -1252 130 -370 -723 -1000 1208 -1125 -632 1128 1119 945 -1413 -1293 -134 -503 -985 812 -660 -1219 770 -652 901 -616 -546 1354 -896 941 -1489 -365 1424 -968 1171 1253 -786 -1050 -1395 -961 -1440 -33 -526 911 -174 -1436 -787 -414 -1286 -981 224 1370 -1035 -1240 450 336 -18 602 931 -1054 351 563 -593 1019 -1323 635 -265 376 -1373 -1251 461 145 246 -1058 508 1158 -1199 -1170 -181 991 -893 -1231 -984 -374 1057 897 746 -169 1204 946 673 -293 1173 570 979 262 1154 -1032 758 -620 261 349 -565 194 -112 357 133 203 -1111 -220 248 1254 -456 33 -875 442 -1226 -1127 -1151 1443 268 -1105 26 1140 778 -1255 902 800 1025 1494 1145 1388 -52 232 -1290 1295 959 -221 -60 -1076 867 578 -629 -867 475 -582 1201 -66 1028 5 -1030 -359 851'),
-    ('500 values #4', '-574 257 797 1046 1013 1264 1132 780 -1393 994 1194 1340 -405 -1382 -762 -381 1378 -235 -109 -63 -1475 -757 -914 819 1192 141 -1215 -919 1093 -1375 -1125 672 -619 40 219 358 -104 -856 15 -224 1455 -172 824 942 -1153 -1285 -863 1462 1030 -1297 1260 -1166 -386 314 1211 236 489 986 310 196 -382 -618 598 -1034 -87 260 -1046 -340 1277 1279 929 493 658 1232 -237 -1314 -597 118 954 -1276 -1469 -663 -266 -635 -938 -454 -315 -157 -1009 1419 537 263 -781 -971 57 681 1382 -558 549 788 1236 -50 -1205 126 -1327 286 -1424 383 -1182 -218 858 258 848 156 1122 210 1413 -1029 159 -1415 -170 -797 1031 384 1324 -18 -1140 288 -1067 -504 284 912 140 646 -1178 121 -230 -110 -593 -136 -812 -1188 590 1471 -1033 673 588 -706 -69 -62 1143 -896 -533 -1079 -901 -452 -692 -790 967 -874 1184 -1192 -775 1072 523 400 809 873 338 1289 812 1133 1102 1058 -177 1069 -206 -882 301 -1221 420 311 1086 -260 -375 922 -1270 -59 578 -1197 -229 391 351 -1346 -1267 10 -325 -1186 1140 -1131 1019 933 576 74 395 877 770 -1332 342 841 1169 -729 -184 978 448 553 -883 -1247 345 -1077 -94 -1155 566 1146 -794 -1340 -486 293 299 1366 641 997 -850 -10 27 -342 86 174 -115 948 -1286 1084 1151 -130 -1231 -150 -1113 785 83 -337 -468 1189 968 -885 -135 -1167 886 1218 -921 -68 1363 1187 1212 105 -972 937 1459 -232 789 42 1135 -155 -977 656 -1118 1276 234 582 1374 -1426 -15 1482 1485 -623 -101 491 -714 -573 -937 -866 -1184 -289 -1086 579 710 1226 1306 -121 1377 -964 946 43 -869 -836 -760 1326 -822 292 -1322 182 -8 -528 319 1000 -333 1331 -542 687 -521 -233 421 1352 6 836 304 1308 -346 64 559 660 214 -837 -683 976 -934 -476 -1287 1126 468 20 771 -1080 613 -990 1185 -1157 -844 -383 340 602 -897 291 1469 -591 347 1351 -1391 199 -1282 123 556 31 -535 81 1448 35 -581 -1385 -195 -1095 -127 -902 1445 -1344 1303 435 -932 1179 337 1020 -1479 -1176 -1423 1344 -617 -888 747 993 661 233 -1045 -320 -527 -267 -1001 -1305 -524 1465 1051 372 -1243 1433 547 944 695 -1433 1088 610 855 -510 -912 -307 1388 -1494 1018 -55 -515 837 206 -733 -1150 644 -23 -1223 654 728 1311 1206 769 -1417 99 425 1191 84 29 -462 -1434 -38 -1224 -88 -513 -1076 883 -139 -954 -1319 -57 736 -114 -783 403 460 -754 -948 -1242 374 -1349 -299 -675 -1321 1167 -1329 -208 1239 611 131 724 439 -463 -1351 -718 -329 1062 1104 -141 1484 -991 7 289 138 1321 1251 -112 -735 532 1409 4 626 -408 -1162 238 -1177 1408 1341 -761 734 -297 -185 1158 -1173'),
-    ('500 values #5', '-157 1207 -290 -245 326 968 1439 245 -818 1325 318 -61 331 -1327 1477 -56 1018 281 -376 1119 -1266 -1193 1249 1111 163 -12 601 1282 -845 -1373 -916 988 1277 294 -1358 -983 -1225 -534 1142 0 -17 68 823 -1368 978 -872 1281 342 19 23 1489 -1186 850 -937 668 3 130 -213 1160 -359 -478 -1036 -1394 -738 544 620 85 800 -1018 -428 -434 1383 327 -622 1006 -331 1342 511 -681 -998 -945 -1197 351 -793 323 -1141 1293 -191 1235 -77 1406 -1235 752 720 -311 -272 -855 1368 1112 -787 -20 583 -582 -1003 -677 -932 -531 523 -1393 -22 769 844 11 414 759 -969 1425 -1147 -1231 -234 1443 460 653 182 177 854 -1198 -987 -202 1131 1418 343 408 1285 619 -89 -975 758 1120 907 -755 -972 272 559 -1274 -992 622 -874 -255 -826 -837 -179 -577 -83 625 -337 -1177 -474 -696 1101 756 1481 -988 1060 -260 1016 685 -1118 558 1125 -810 924 878 -869 -799 1198 1057 1455 -118 808 -1332 -1384 -1168 -1314 1127 862 -416 1167 -637 843 206 1031 1117 -1376 539 1068 734 -314 1129 -263 478 -497 1475 -282 357 -1202 -1255 -853 300 202 483 402 -665 -107 984 -912 -220 -193 -86 133 -965 17 609 1432 -1066 1472 -510 410 -999 -405 341 -485 -923 -1104 -1293 -312 73 1020 212 -484 -846 -159 866 1283 -723 -848 540 608 412 542 -237 537 -1406 -1132 110 570 372 -514 -619 889 -55 -1301 1265 -348 527 947 1179 427 -330 698 -1467 -1060 265 -952 -417 -2 151 1224 -1315 140 -1291 835 801 -703 -16 766 -318 -1199 82 565 344 1407 -355 1052 1002 -1014 -973 1266 113 28 -112 784 -3 -910 -685 967 585 144 548 -1336 1221 -1341 -939 -136 440 627 371 -890 983 611 -928 1499 1011 -196 -835 109 1025 -275 931 -123 577 587 680 506 805 -273 445 -1432 8 -144 -1052 1309 890 -240 1077 -1391 944 443 -413 869 865 -568 -1290 1157 467 -802 647 1076 1038 57 -895 -508 -1371 845 -1050 -719 -1423 306 -216 215 -880 191 1287 180 555 1004 431 -1245 -935 624 -651 797 -169 459 652 43 -215 -791 382 683 -98 737 -49 -418 998 1289 -713 -491 -358 785 -278 -579 -281 -317 1480 502 1371 465 -72 795 -380 -322 -1001 848 724 55 116 -87 -901 1405 -1328 1088 1343 -82 311 -450 462 -624 -673 706 -390 802 -388 -938 -1053 1021 903 -520 -507 1237 675 -576 -547 -1285 -1090 192 -148 434 -1089 1446 -1479 754 -854 166 448 455 -684 -324 -185 1424 -1258 -1134 851 -549 691 -1348 -783 211 -780 -1352 126 529 -737 -315 -1347 -1463 1099 826 1494 -1061 -128 -335 361 725 1143 1392 -951 1210 417 -383 -711 -1039 -146 1175 379 -447 1436 -1443 -120 -292'),
-    ('500 values #6', '825 1262 -709 -782 1002 1116 160 251 610 -157 -1145 141 1241 -1110 -744 -925 455 -175 -484 -1473 -432 71 -536 329 -407 -150 -264 885 1460 846 -1454 -429 1177 -28 1337 -533 -1246 1235 -1016 406 -244 -846 1493 1310 558 1381 -227 1327 -1020 1494 -292 5 1017 -596 -603 -953 458 -873 363 981 30 203 1375 749 428 701 1220 -606 -487 1286 940 -1165 652 1476 663 1382 -19 -1181 810 -1041 -1248 743 570 -672 845 698 -887 -827 1490 631 309 -1024 1430 -659 888 502 -1128 590 324 -1273 357 -960 602 201 371 809 -1264 788 393 1255 -238 -1411 121 -458 -1488 -608 868 -1201 -1315 235 -89 1368 -1239 716 -1254 -1218 433 -1371 -325 174 -763 -946 1127 1145 221 33 66 337 46 38 -1172 1296 1210 708 -956 1176 -76 -1015 -769 700 109 666 -979 -588 -1486 -1407 -278 396 1258 730 237 678 53 -560 1431 386 -83 -865 -371 -728 -1038 -1369 1204 217 1018 -1436 -515 -656 -1225 -1087 932 -1363 328 948 1252 -1301 -498 -1319 147 297 -541 710 -611 -1269 -927 563 -316 1309 859 -194 865 949 1254 -187 -530 1473 -914 1452 635 -595 193 -270 -373 -1251 780 923 -783 1064 1280 249 776 530 -1308 -90 1135 1249 61 648 -195 205 172 -889 -272 41 -747 703 439 -513 -577 -269 -909 1342 1393 803 190 206 782 670 -951 90 -506 -456 -668 -148 1148 -1177 342 19 -1122 693 -720 -1289 -401 44 977 969 -1339 -1202 -730 906 789 -612 463 -645 -137 -259 -1438 -633 -722 1451 461 -507 975 -663 124 -520 761 -183 -341 59 409 685 1157 -29 -237 1468 -27 600 536 408 -1097 423 -189 1247 18 -219 195 -1313 804 -594 -903 -1434 1479 766 892 872 210 -291 -876 -697 -149 -558 55 833 -494 545 755 -118 -446 501 1128 509 387 -811 -58 -807 1305 738 500 1265 720 1169 -1260 646 -1362 -1196 -1302 -1474 189 -937 1083 -553 -1222 -882 -1463 -605 571 367 28 -1253 1030 1112 1025 479 498 1324 1480 679 759 184 -1452 -1432 668 -375 694 -326 -1430 557 263 -766 -1062 -1106 647 -891 1498 -714 1038 656 -467 -49 -406 125 1244 1141 163 380 814 -504 -575 1267 -1170 1372 -1118 1457 1465 1236 763 449 -1271 -1462 -799 -1162 547 277 -144 817 1486 1425 -1326 -559 -635 821 447 -390 -1310 1154 -352 724 808 -1366 1120 -212 1134 -652 904 -910 131 -1185 -275 -835 1394 -516 1078 93 714 -142 72 1163 -1179 551 -84 -1281 -1100 290 -550 -1189 -105 978 1014 939 1215 -164 -1379 -381 345 1168 -566 -43 765 37 268 -740 899 56 -1149 1182 -491 -1199 -1164 -403 -869 1026 1019 95 -203 -23 -1064 -1126 -1479 1389 321 -26 -396 -1082 -958 -1143 -733 265 338 781'),
-    ('500 values #7', '772 598 171 -1077 -1393 -1133 -51 770 -1119 945 949 -172 77 -1450 -305 194 88 -1154 1468 791 -506 842 634 -806 1307 59 1476 -932 -399 -267 -401 519 -903 -1241 -816 280 -370 224 -273 483 -1185 -21 -470 -490 1452 1060 530 932 1025 -700 375 -1062 -946 -253 -1473 120 -140 1040 56 -151 303 -129 263 1166 934 -943 -270 -187 970 1347 -678 462 -214 -773 131 -193 -307 1346 1092 511 858 -508 -166 40 -352 109 -5 -1034 809 -682 925 734 -764 1292 753 -1390 390 1401 -642 295 1423 1337 -1217 175 1256 545 -930 1094 -260 -509 -466 1197 -869 233 44 -1198 339 1489 1428 884 141 688 575 1333 213 726 -1350 -28 699 1455 1113 -1152 -1053 -484 1193 1222 -46 -819 1150 1009 -1319 806 1142 1274 1149 136 -142 1437 -1067 -1457 -1097 -441 -591 591 624 785 877 1316 856 -595 325 32 102 396 1283 910 1328 549 -883 -88 -1400 477 -1072 -290 203 -1149 -1025 -920 -74 -223 -95 365 -653 1477 478 1321 450 -1101 294 353 -194 -1225 -271 -1317 -1029 -1408 1319 1154 1367 1273 -827 -501 613 -786 760 -845 -145 793 246 392 -551 159 1079 -745 -737 1123 1192 270 1444 -1381 1015 -692 341 1409 259 92 -1482 -621 -658 -360 -1244 864 -1084 1371 -735 -2 -165 -693 374 1412 -426 1247 504 661 1117 -217 1490 91 1003 107 904 -1033 -75 -59 1449 1028 -794 -282 1016 917 -1153 -952 -218 -1018 -523 -250 -1021 -751 29 -921 592 1252 1375 942 -936 854 71 232 -740 493 1103 701 1357 -791 1499 -817 505 -317 -926 -734 -212 347 1037 -1281 -30 -1461 484 -941 -701 72 800 570 1174 527 1396 514 202 318 501 -815 -1162 815 -1374 -597 -304 -1367 -375 -580 702 -318 -812 373 816 528 751 1229 -1037 845 1248 -403 724 2 720 -1330 307 737 -605 241 -1081 -487 -281 -1368 342 -424 -73 -1144 298 -1020 -530 -641 908 -64 999 1091 253 -821 1023 1393 -654 1317 -1257 835 1148 680 -349 944 706 -811 -175 -302 -315 1172 -405 607 -1110 -945 185 -1258 -365 -981 -957 -478 -901 -181 1160 108 1257 -918 865 1090 -400 1071 196 36 351 -1191 1095 1491 150 611 -361 11 362 499 -160 883 -1490 1102 377 -33 1466 689 129 -608 1275 -633 526 1469 -178 -339 -117 741 867 -966 818 487 -93 -1302 -1312 -1093 1064 382 -1434 -992 -853 1165 369 -1498 252 -672 -960 -264 -849 -378 -1118 -24 -475 -1163 23 -823 -1288 123 -249 -541 258 -1127 -1111 -1496 -626 453 -1181 1119 931 -574 627 322 -1462 -1467 1073 -1007 229 -959 456 -1210 -563 69 -1135 1161 -1078 1254 5 -275 -939 67 -955 -915 -1220 672 807 -1466 1147 -828 302 -62 -628 -880 186 312 -611 -1145'),
-    ('500 values #8', '-1089 -927 -996 914 1490 72 -61 258 -212 -928 -486 -366 1140 -1155 -484 766 961 957 1453 988 -333 1328 -1391 1196 -265 -659 620 985 587 -728 104 -290 1146 -1277 -520 527 80 -1039 -513 546 1113 932 -1210 663 -1451 -21 -204 -960 84 828 223 -4 737 1297 -793 429 -1202 -1432 905 -1224 -1444 -427 -617 -1337 -1253 130 575 -327 1074 1418 552 201 234 1374 147 -1163 1123 697 702 1023 -875 -364 -1158 -231 -1177 594 -668 -864 1422 -162 100 902 1098 1161 1289 1134 -1230 -230 1361 291 -523 -1263 -499 -1147 279 -1025 357 1007 993 -1275 -234 1228 1195 -781 -1011 -1449 -938 1373 -1454 -829 533 -80 642 618 -439 -817 23 -981 -400 -1017 -1380 -128 1492 -386 645 -1239 -423 861 1070 -1185 532 364 592 -25 -1273 1460 821 1426 6 -856 -456 -1079 850 1261 -1028 -565 584 -1490 -1320 -1450 1397 -1312 432 -10 68 -886 -767 -1356 764 1185 217 -581 -182 1485 204 -190 -389 -1181 841 27 1385 556 1257 -1285 -766 -586 612 1338 142 -1218 405 -344 -228 -160 1396 765 370 -1468 11 -679 -306 809 -256 1050 -507 400 8 923 520 -700 738 -496 -884 -1474 179 -1403 -546 718 -82 1104 -1461 1368 -1495 1192 41 -241 -1075 -660 670 -525 219 515 -1255 -917 -354 -1119 -1321 -552 628 191 25 377 -1153 878 -1109 570 -954 1110 115 -1194 924 825 -1245 281 1213 -965 -531 1299 -431 -210 109 -164 -198 354 -387 -544 -1195 -670 -943 894 -1054 1412 -1068 -827 341 408 -214 165 -1006 695 -33 -650 351 -238 397 -415 -1009 -1130 -855 -254 971 -1335 -620 -158 -893 -1127 1326 -43 123 603 -1300 -276 -435 -788 -1373 156 352 777 753 -477 -1113 392 -1083 1495 -1003 -1452 -1248 -590 1244 -689 140 24 1081 1487 -1156 885 900 -440 -1193 -1411 -1236 -691 1145 316 -973 -1124 -142 -999 -1326 388 -1293 -812 1347 274 117 1359 1369 67 247 1445 -51 -621 -734 -374 1265 326 -892 -1359 1015 1036 1027 -494 -292 543 187 755 462 -1251 -1141 -355 1335 1383 1329 -684 653 -480 1083 726 -1421 66 -30 464 730 485 -91 816 557 -183 90 -393 -764 -1394 -194 945 -603 1153 -350 -1261 1337 668 -36 892 -547 -847 -1090 -485 1461 -409 685 -1271 -602 858 1111 -47 -789 -779 -532 926 1237 -31 1292 -1385 -60 1248 808 -918 806 -729 516 720 -235 1386 508 -1345 -1131 -1270 -548 964 -604 -1419 656 457 -1498 1163 1141 -675 -966 -105 -774 -175 -1257 1170 -895 1408 -920 -1046 655 -6 -1203 30 120 1173 -1087 -122 -264 -179 -942 1211 289 495 -201 -787 801 1013 -39 1314 912 -782 49 -244 -294 -979 -773 -1493 846 103 824 -1368 -755 967 -197 1004 -596 1114 -1074 1154 -924 -144 -1182 -526'),
-    ('500 values #9', '-80 -192 -813 1105 -1137 1403 1244 1117 1487 -125 329 -1454 -414 -642 -478 1339 -1223 -65 -449 -1058 1450 -1495 -1303 80 294 218 -819 195 519 51 -62 736 37 -1085 463 867 1166 1314 -577 -834 348 -1199 -1364 -293 -1418 -195 -431 -1072 -1197 -100 -804 1467 -841 -1193 740 -1119 -116 933 1013 477 1385 -1374 266 1177 -825 987 278 -857 -1281 -1086 -144 -659 -722 176 1355 769 712 1491 1205 -347 -282 -528 -1108 -1297 109 841 751 510 -871 -1277 -23 -1485 251 -1142 -294 1211 1060 958 467 -683 -1103 -1395 -653 -801 1114 -305 -1165 439 -1027 -237 128 428 503 1207 -415 -1127 1129 728 87 -743 19 62 13 -736 325 -1318 -422 301 404 1373 -574 -400 811 -1248 -881 1352 1233 -1104 -1149 1236 -92 717 1472 915 -569 767 -1251 85 640 214 693 1462 444 845 -535 450 -276 -1177 117 -1358 556 839 616 840 1275 1040 -897 -1008 339 -792 -816 -633 -711 -984 -1326 234 -1180 1298 283 -673 1069 -895 937 -444 -191 -1226 -1144 89 778 127 761 -165 -369 628 376 -1450 1052 906 1351 1474 -1040 197 -888 -893 820 908 886 -1090 -1068 804 -1087 -329 1349 1359 183 -419 68 1182 488 843 994 437 -1347 -795 -372 150 -911 1032 993 145 -1342 121 -143 -527 -1299 446 1368 25 1455 -117 -259 -227 -352 513 -1098 -567 -950 -270 314 -186 -397 207 977 1144 -1135 -731 309 -635 167 484 615 31 -1270 610 -849 -1232 -226 575 152 -945 647 829 -1382 -789 1327 -678 -1264 -479 -1365 369 -1293 -24 -685 -378 8 401 568 125 1102 -993 -1375 -510 1262 502 1442 327 -773 443 903 758 -68 -90 -831 -441 -1130 -333 -1388 83 1416 -833 1280 -623 -594 1151 -578 -654 -398 1168 177 602 1261 -1464 441 -959 1186 -791 962 -1466 -584 -467 991 -249 1132 -373 235 42 -72 380 -468 -607 411 -263 632 1054 126 894 -1081 -1470 595 32 799 932 1279 -343 -278 1480 473 -1239 -123 -368 1123 -169 -366 1453 -277 -729 -886 618 -516 -1268 957 155 1315 -927 -1396 537 -290 -438 1350 157 90 -1356 888 1189 -723 -95 -590 689 448 -32 577 -271 1449 786 -759 -297 -1101 1388 -976 1196 789 -751 -126 1245 1113 -45 -586 -243 222 1267 22 -433 898 -296 399 -1018 427 1431 890 876 1042 -1209 434 -704 549 -1010 63 670 1145 192 -1279 -883 -938 -680 -97 1426 832 374 -914 -205 -762 -1169 497 -138 -776 -217 -1263 -1481 351 -380 -643 -810 860 -852 505 -1140 -970 1016 276 258 1231 257 455 70 1303 -1346 686 -684 28 -1443 -181 675 -720 -1427 -1484 -481 1369 1198 -222 -972 -1080 71 561 911 -247 1329 -1233 -1313 -279 -309 367 631 942 646 1260 1041 -952 1065 507 -29'),
-    ('500 values #10', '-729 -825 152 -1422 -565 -582 1478 -963 -635 -1411 915 566 -808 -996 1 1412 1164 -1347 36 1122 -453 690 1052 -1301 932 -1304 1211 -1058 1177 -1420 -1303 1325 -1026 207 319 57 -994 741 -465 443 1374 -873 -659 1347 1308 1081 -1462 -267 223 1210 -1087 1213 631 -395 1050 980 1370 -939 215 -1071 595 1030 -1018 -343 -1034 -1065 538 -687 994 -682 -423 642 -674 -34 1381 178 -291 -844 -1339 745 533 -650 1318 468 -146 -540 -1489 -1448 1251 -1136 -1048 851 1240 523 -890 -1132 1439 -1193 -1086 -452 1139 -554 370 -288 -419 401 -1295 -1092 -785 1421 -310 -25 1272 -220 244 1467 -1111 -1313 -1461 -934 1217 1150 -802 -154 -36 292 1046 -402 -1120 26 -97 -751 1435 141 139 369 -387 79 1468 458 227 1157 -817 -1037 -958 1351 -1260 -848 -1076 204 919 477 830 1278 294 -758 1003 55 -32 1004 -1382 1303 -965 478 499 -1038 184 305 -1312 -1241 -429 1182 -213 -1450 1276 649 861 814 -583 1243 -115 626 1428 1032 -1110 272 1450 -482 473 -84 1218 1270 1127 76 -892 786 1010 -1277 -1453 1135 -858 570 422 530 -823 -1194 513 -187 -514 -145 -361 -1294 576 -588 754 1300 50 151 -538 -1178 380 1465 847 335 -1140 541 331 -206 -1014 537 1176 -1428 -1080 1497 188 -1354 782 749 -1500 -1128 974 1035 1111 -253 582 803 -653 1181 1250 368 -104 -12 -1278 -587 361 -141 794 1038 957 437 1191 1248 353 -1033 -1101 1198 -592 -1492 -102 -46 1095 -305 743 638 31 1434 1382 -828 516 -925 176 -1062 -459 1002 -698 -732 -1006 109 -617 372 -720 -116 -1059 197 -1310 1093 911 1486 345 373 1197 913 565 -949 543 -1483 672 -1302 766 1314 896 1336 1255 -775 869 -789 -975 1354 86 959 982 -182 564 75 214 1431 -484 -380 129 -96 -296 354 -954 -935 190 967 598 -276 1227 -215 767 1091 -610 -678 -642 1056 1389 -86 -957 -772 563 722 1108 -180 -1028 -58 1254 467 887 837 209 686 -329 230 1484 641 -1064 -1397 60 -905 -1283 -1269 1430 -407 -841 -327 -474 -901 -1246 -292 -665 716 -1368 -31 1237 -1081 1023 801 1494 798 92 -527 592 -322 -1308 62 87 206 1386 761 -1280 -1447 -471 -669 1041 314 -577 6 910 738 971 -696 -708 1169 338 -774 -1195 -735 1184 604 -1012 45 -1334 255 -357 779 -418 -968 1125 892 -456 -1477 -147 410 -866 -1337 -871 -179 944 -1292 1021 1452 509 845 753 1426 -1202 -199 652 -600 -747 632 -1221 569 1352 203 724 699 1266 -1124 -69 -594 -627 1244 -144 -23 -298 -606 1193 445 799 -1464 -1031 -83 325 -516 1013 -502 1064 -186 1104 -1036 80 -450 712 -342 -1399 617 35 606 583 1025 493 -1321 -286 -712 -188 1080 -1163 -1107'),
-
-    ('500 values #1', '598833565 -1669320321 -2040063279 1037451515 -966241705 -1095681136 -1188800802 -1548172823 1015636137 -1707270233 758918509 1033660083 1684398416 194847796 -1774084222 388662377 -335343207 -2010978061 -2019505554 -1745065638 -1208440693 -1148212712 23000785 438167108 -2033512525 263045542 -1293482455 927797169 643748745 864684172 193022198 -345659740 -1200698400 -218145494 383393196 -952663664 1328993675 1586132811 -2119571681 1111569163 1313483709 -1461752124 851002234 -332368623 -686118794 -954035319 -1479704272 -1222718085 1963715171 1131698670 -701821063 -1708493843 -1749143279 -515708291 -1732089961 -605678962 1492476947 -670205071 445499907 -1011375194 1319105919 -1960865437 986690512 -174268826 155598469 -1611359368 2032016716 1813744801 -521690861 -1809039384 223512817 -888292543 1414782258 552503726 509038458 1655502639 1553519297 -594273040 332224959 -1321610452 878629360 -1848746542 -1950669415 692620697 -1168668018 1172819594 -904571827 2084010572 -1804779727 1526077990 -1147654408 1574035378 -1713685808 -514853929 -953596103 -200101229 582760239 1434993374 -580541375 -1448889623 -557568504 -621607597 -1247657810 730896804 -1000822651 866811646 1875417161 788331224 635807147 -1840812201 468714099 579727331 -1412448767 146629639 984092116 -1096028725 -1445675281 -162091150 -517734921 -988066573 2102486758 1827041186 601294376 808149444 244597305 -1204243674 792912175 -754699905 1472537765 1152398028 1185410617 -1907231987 -1163729671 1382131627 -2009614173 1310161742 -792623108 -424493989 -997545314 -1863205759 -1241319252 1774406112 1902282724 288536126 1616486638 935934671 -795952425 -1234259601 667603989 -3301711 -448257584 1652201549 1780468325 613544114 -176729943 -1533854845 -1009831970 -1547775971 -1088226568 1052219673 263574139 167406184 -1019017028 1060916230 363294073 -307374393 1708636277 358771184 -432071529 -592720745 -1205508168 2135997924 2136907760 -1553353340 40915112 -27849249 -1757030696 1098576010 -1945120363 1550925206 -1676544203 -1491035169 547376580 -1460366207 1254471308 775160916 -334320408 414073652 -1874634224 -494920635 -508441310 411837641 2130825113 -137224702 125045161 -1067668244 2023266233 228603483 1549537005 1900226095 -2098173040 774311335 947993017 -1655487669 780440087 1652653821 158786356 1077511952 -1001478200 1153622755 605426323 -686441105 -1668370711 -886910200 -280181094 -1468201270 -198755165 -2133545127 1949124556 953878130 1614276077 943521291 -1016236318 2026743947 2517343 1125119086 -1380179660 32992540 1772223087 -1690452644 1591365142 538160238 -865673048 1467458679 596783527 32911828 468023495 -1293166967 -1491043971 -541535892 1127475297 -1453635819 169131618 1947766591 1196691599 1814340549 130368030 1797415901 -2145027375 424963764 -755243973 -48938107 -2063831678 -1667015429 1842964529 -588493131 1626598064 2084439435 1424492601 1317587757 -826720513 -1119043785 -1898696934 -1112948055 1623538872 289295842 1919633270 -1809224697 -1779604887 996035535 -60170527 1357309536 -1850218168 2052927744 1119277765 140471910 1141750196 -1607346352 -1596046499 686124556 -106161378 1919200460 213904816 -1438268757 -1009074109 118857987 1599587738 457817382 -330120033 1994423488 -1237817311 1842169438 168775419 1096355667 987546410 815475292 -1283546401 914608870 -808672358 -433824774 2126650302 737389881 643721358 -543654799 -265858143 1716329419 75487668 -208365425 -1627774569 -1082737123 -1182415921 -1872494500 -695417189 -2057142183 379283042 231591171 -1159148397 379847410 -1201657162 -2116599210 -1842570666 892670062 563082934 -1894622752 -1164186156 -1858001466 1741265702 -2012566021 1544622273 -728304068 -1843153645 60800080 -1125261523 -951432901 725754023 -62644249 -1227343558 168508467 -1579208593 959291947 1870519414 1642322787 305127770 327326531 -117377031 -1103818456 1222431135 -116080352 1320689565 -399174414 -1329679265 -1742357420 -1731168981 682825722 -296132909 -625787169 -328227311 -381812804 -141627981 1562666924 983873306 -1914820186 744595043 659086287 2079473744 627837249 -1724782098 -1887154193 -418238406 980169899 -690190073 1291034993 1553371742 -1678176729 -1079512828 -1324610560 -1330542609 155846116 -220703107 -1545405260 -335515807 -1359408522 -951141351 -160511211 -1074573121 1608404927 1817911932 -1823708014 -244251596 1322945467 1551982567 1528866158 216145571 -1726968859 -1930208424 653457336 2144401877 174323841 1443227504 -2084099160 2014323587 -1746923081 1831232233 1089055536 1497636773 -1132241472 -1433182878 -401948550 -61670889 -80064962 -1229446015 1566161521 -425028731 1728478964 -1895646512 -1440372600 -519806493 -2138226393 2084385608 -470634972 -1008445188 1831881167 1220073926 1224621261 -193237574 -922347534 -330680342 844354072 1964164291 990012790 2127824253 1217028494 239523124 695231969 938056394 -57245831 -1482636329 -1331878516 -873133230 -1212465428 2013091398 -1896299818 340076736 1012483461 181227024 -1885672885 1065046939 -800561222 -1901960661 -1932123966 361540026 -99692566 12242276 1801253991 1514920394 133685755 -1471315227 -1903187744 1979030306 33623138 -1803407533 1509004752 -1349371498 -1853186775 408172673 -1855593968 752532172 1554001644 -1137290602 -413280849 -1632574582 1896640907 1676271257 299253624 -1089996780 338954755 405956694 -1976794498 512739685 -1795367596 -346926365 675912594 359369740 280147507 97851029 -788685505 1867049173 -1027503518 -1270197064 728967515 928536717 -798074214 -1122335267 -1006677999 -447596378 -1585365723 737403900 624921128 -859006014 -183719051'),
-    ('500 values #2', '-789512950 1842619707 1081749746 1871464539 -1835913341 -2107474061 -179162329 520375021 2140845506 270555620 2130718029 -1718067435 -1832831264 161638539 -1231992853 25274572 -1008456529 -1578587032 1860834878 -648502119 1635799169 -1852027229 1628953283 -1098290076 -560376878 -923472110 -1469966152 -265495264 1433423666 185619724 874197315 -848182426 479652332 2078134140 2092650073 1318984209 661323238 124299343 -2113883664 720966961 1361951898 234515030 -861661718 1854378078 701749191 -1702583014 1885189998 1624042949 -1570707697 -1011611153 -1651721300 1673803351 -1687767639 1041171739 228593815 -1479839958 -977756967 -937349669 450240683 -1242836179 934637223 -674824022 -1273039861 805294034 576547625 1515749002 -1013681434 23231729 -49255328 -1068926095 1740906951 1753029752 1486504128 -1929304049 -1751064759 576747299 -328239565 1414539292 -959151117 -1958132435 -2132255026 -714869226 1164448205 -1585617504 588897460 2060716514 -1022394339 -1453494337 1036078879 -249814583 221965721 883334972 -310582327 261593008 -2105952602 -1666988984 -1824313759 1911479203 1645429424 820423017 1734860010 -1507300357 195808827 -1992743970 1437074667 -561713064 354375888 225593570 -1511425673 -301563753 -1600109310 -1967830050 -823524121 -581317334 1713612425 1860098823 1271835614 2028067495 1549205809 -1976136473 1713368256 -610704698 -1245211796 781970486 -1075761593 716973562 -1705988413 -628445494 1203090108 257197751 1649845980 1609378883 -402106049 2035114500 518237226 1071498201 -1483682115 1828641689 1846324917 -1130704564 1565969556 -1449543883 2045289321 1288004969 1334754394 -1387049520 1638170128 -376692625 -2041027014 -1377135469 1016036649 1823159041 -720757946 1212840744 1850340137 -379189078 1298090018 729745562 1563643079 1009564429 1334658154 -1081613470 -1001561845 -1463734127 1234264127 864483236 -1683216473 -504479462 1598444176 -1981162742 1540146295 -125885403 -1192138111 -1290324880 1359729104 1797237234 -170496300 -645712157 -836698854 1376693271 1268499238 1594820299 -1169968454 -1190034281 -2045845669 687337306 -1317997513 -436085296 -737609300 -950892630 1564883977 -1849323792 2005273424 1173928982 -948650920 -639322511 607659445 40397067 -430878050 771024429 2066522149 1476013453 155545383 -725205800 1886509177 -2028940240 -1652094618 1619367643 2020355234 -1025572916 -1380540709 346130269 1986569751 2076833914 -1007314299 -1983170238 -1681898244 414770380 -281046516 -662768828 981593561 1230199651 -800249825 -273186191 456163541 2079777135 49061677 -1650788775 -493081885 1715859753 328943149 -1331101523 -1053458804 -1956844950 896725968 -274630859 -2140219677 85557236 1827831414 1316454144 165150060 802545317 942444660 1890915691 1039167658 1018069121 732843843 -1301224198 -583164330 -295075421 -1846948438 1927901229 705395476 1807197061 -729285297 528948455 -799226234 701743846 1494714259 -1612221994 943837344 1718188083 -857609328 30590942 -819116138 716799561 -393449451 -746538748 -419187146 847003686 -877654240 233699835 -1600786698 -1323536714 -341680386 708366497 1891347559 -519067073 761574764 1065729806 1730036646 -1400041916 496132783 296804825 -854913766 -403404075 205888738 1433338704 -2145740149 -842350665 -915198612 -1244755903 -301128120 1227324827 343532006 458107940 664455594 -763433734 -150374583 -250027164 -248421783 754313246 -1229643110 47991950 -115164478 1261583925 1723058500 1974963399 1271416665 1013446705 -1418664667 682258776 -1783289592 -928630320 66365865 703746870 570976631 512221260 -707861029 -1746388694 1367618340 1941323745 1078630084 -1138730705 742151744 -814242203 -1182659329 1316677622 -1292227096 -1514603189 -2042577393 -1948997232 -1095892942 2078489380 -106788605 477918071 1502111965 1153152937 -1834688784 -191486108 -367473076 1658445405 557338076 325004042 -1312390676 937788545 843335079 -498308682 -24149867 -430987677 -1099578444 -1513669564 670264041 805832140 -2123668857 1686461089 1077884216 1548080441 1159839533 1655560457 -1689694699 1195806553 -321494637 -1207568121 -1392056113 1306141882 1966949168 841434668 77127955 -152257066 -1931797340 246556025 -1077185210 1793020037 1496093223 -1626252426 -186995009 -1574796575 1294574447 -151856130 719740865 133710413 2095482116 253082200 409964581 -784699310 1932905379 1096290450 1681161553 -246645260 483838034 1352942642 941774472 1683714350 20522051 -314646052 1419783763 1747427769 205608475 -232299290 1705995833 -1463905656 1046492151 1552608816 -108772472 -214448743 -1034264417 1081373070 -1085597072 1459699981 591251375 -956440478 1141661073 1192604345 91482003 -66155304 544380393 -1119930471 -968096593 -258245225 -1814695177 917168219 -920290575 -1140341388 -980476135 -705029448 -774341532 1688037405 172452487 -1801405237 -1553171577 -1499670890 -1154223144 -502359597 833008113 -1491190046 886563470 -1228563028 -1871622831 -365639596 -396857670 -726358910 183013467 -146353990 -361746897 -1880054436 -1259136708 1429756686 -342980961 -474693493 1738768001 1158764031 361118326 1915821847 839764846 -2063594554 1532152408 1634907941 1140720003 325087583 -513759564 -98871290 -2122160188 1901560944 -636691076 -864952066 1088667389 -472503751 1518047381 1682087611 1947468465 1441943667 -347800947 164156075 1063071711 1007745618 198136737 1287923971 443466485 1708586726 -1200277172 -50553991 -1205074881 -975235402 -275582370 -61667137 -2022822982 -477354676 -703818258 725306679 769408531 1280511542 -410956769 962851711 -1438621934 1462460680 -140058244 1801917546 -1599326461 2064685183'),
-    ('500 values #3', '525089657 146559900 -2031663623 1747746171 -455179546 394676472 276561462 700078631 -2031081217 -1786932063 613105086 -306605822 -1564658808 1575614563 -164503907 -1366963423 -1931512789 -1030120796 -519244941 -741514648 -1238409636 -194564903 -743691591 -697929825 1121973045 1630541335 -519148956 -952380584 1082373946 1937906941 1425603954 -336876495 -1063985683 1438431440 -1795699059 -127531163 -2064233082 1069551048 169303550 -1923777695 2147087749 1940980315 -644415421 -1184456793 644863991 -1852769992 1207886751 1964026707 651781283 -1974576272 1091923309 -2014210823 1931067685 -1085409951 -1291236043 1456976824 -2059952138 521132685 -1493006453 -1122940926 -1605368684 -113554382 727820209 -1656184719 274747234 1923101785 -1211333061 -150177896 856695536 -1046925345 1146318621 -563090937 -1426834761 454805653 460624453 1991725559 1064832575 937837180 -1655568725 1193107040 1371388096 -1444114871 1995960524 -811581658 -1683203051 337948373 -2037195677 1842056374 -807637477 325544450 761700797 1752458967 1967837346 -535552535 -443865821 1896101765 923481120 -1295663735 -1821081274 395557300 818682683 1419794343 546501930 -1104453487 -1709820884 846937488 1170296500 -852195899 1504498008 791386548 431264592 1312232623 -1627556119 1272286198 2078095667 283178144 1213909574 -1971093058 -656254840 140639768 -307614104 693728867 -555893825 -1851316727 25601398 633693452 -681906900 -2093143090 1501415885 -343345091 1384400748 -42083347 -1694197661 -285514831 1979067543 -591897875 582333592 1681801864 1411787138 -172918187 890383864 -1490391666 -277080598 -1390981175 1004143170 93401554 1999194449 646209689 -987488602 497839747 1323705552 1802244118 163951386 1179576035 -70877665 -150865989 -276705457 1399019446 992250019 397175464 -994733577 -763196032 1510596512 -1093089940 1420478883 1866686780 -1775269340 -949495956 1639093470 -211303795 -1100098165 1075787455 -151575979 300001942 473871061 722363982 -519736981 -702671151 -2024218111 -24453401 1507330957 -751558426 -1366487417 -53472611 -1236435833 -623522042 1279180254 -1037868485 -685739450 -946359607 1633461862 412982602 864077626 1632548621 -960919151 239620643 -2103884950 71413501 1924414143 -1326902542 -1779778777 -1110867312 945213493 -401888157 -49057768 236980004 1108808745 -1115300215 818660895 -102679318 626648163 909856195 -39422075 -222588627 1258137107 -2073424395 -1747822546 -883751451 -1195734340 -410594042 823719565 -1102495933 -832338757 704202930 350278586 -562552873 -114845325 229664582 132808693 -671056894 -319958691 2133015903 1056284646 216416845 -726745829 -636468951 871255355 -198662570 -983906462 -830547929 -1067713079 -1157330293 -1629270588 950408991 -1320340415 -792215546 -1633999940 1043166218 154034529 1936504363 1126095804 816746248 -1352271110 -1324821432 -1218118694 1024799176 -67866558 -959926786 964585219 384772822 2047011564 1117584396 105814547 415713066 -932013491 2063777467 -1715727298 1428627943 -1313754983 -875114778 -1170450882 -597511262 -1376788077 -849254211 -2086716891 893432590 146609105 -1603813972 -969325445 -1951995207 2037081226 -1913296186 229175012 -892766323 847901220 1907350373 -1605117374 592145654 1582528778 1085734114 -39175696 -1706873078 1600819091 -2094804158 318103419 -926255535 -131439136 -91421782 -255684545 -684162787 -1355647714 1999297179 -1926822311 -1063097248 1894353723 1553588300 -95652396 -1657483122 1383476188 -1866835741 -426458301 -35448239 -1829303145 330803334 555965068 800801050 -1917234431 -1495821101 -1506684917 1336345037 269893985 1928979962 -842520034 -1781634458 2121362196 -1081511614 -1638738064 249421773 1135775952 -360029841 456630827 412861658 1248722337 508602946 -1178164790 1184094737 96948299 -513772455 -212538769 1754512957 -246011410 -870361685 1546904057 380212559 2104668240 -305673529 -835885499 294761315 519808395 -1888796464 470861170 1976152135 1031175733 -1721278714 1922385262 1128447275 -1255041395 539082954 -1241137324 -1010837199 689033618 -1798786124 -1472928576 -1117270551 -1400960135 223304999 -1825082466 -1475181158 -2135991494 -392914035 -212584982 813342822 402916002 -129224919 -896534512 -2007296517 -1153300795 -910082585 888868537 -933217486 871824909 1544499151 -197433950 -1841768912 804812109 -1144936057 1820684087 -1011230189 1236211960 1250899539 537120040 385643341 692275872 1305264954 1862591869 -1297856590 -321525671 -1654523197 191393973 -1181934426 634086306 -1507579072 1754113817 -1006600870 1402870155 -1536583448 -1840780722 -1891340209 -1434850712 1256830119 -826300989 408211022 1069265279 1392601481 297241998 1809008150 -907910595 -261333930 -1613388765 -134441213 810365814 -841421947 857849633 -418722724 1901279976 -978195163 2027994 171719518 -26649331 -267323623 -1801988520 421064262 -1976282884 1672558588 -291934658 1007315549 -763123001 445446716 -1072161682 -2036394767 -1755237651 -1164260770 1983893057 748605782 1442931255 1548408171 322977709 374190143 1936112340 -2058382593 2145647177 1137137169 739943764 1380493735 -989942610 327478315 -1974689921 1130044556 1100666252 -1395045189 -126698005 81449066 650728319 -248122847 1787019008 -952810247 -1367993717 2134364572 366487936 -275371902 578895940 1349671772 -35537410 2014576898 -1755600499 -128804364 -653002285 -393641922 -715934978 -768548931 730717876 -1698230592 1536451952 -1456746154 -730987686 -379481442 831822091 -19460393 -909597633 698290968 1912091710 -427554333 1346755868 1118838013 215163312 -1989870657 -194021231 -1769269723 -796642750 -1063438846'),
-    ('500 values #4', '-759033311 -1649604174 2019428001 1170584442 -411564997 1567279032 62690424 1395551693 2096456072 -2142539861 677146186 1586421259 182938093 -163310339 -372598830 -1914678874 -1341822766 79196603 -593653123 526708461 1101414971 -6472092 538626450 -248932215 1116650864 -1925812740 -1273207660 -1000485832 211396756 -1584786122 1836840534 -910407873 -265789370 1635723745 851477396 -65662323 -1625962570 -2023490352 2032150092 558441410 467600247 1285542708 -1119708868 901010378 -1467254603 -812821960 218351902 -2088752272 224418102 -395176967 -1747153153 -1182401694 2114228313 1466326234 1773520335 -1660171843 -165580051 1920111286 -1642970397 634408275 1426544089 -1486182706 -6977156 1858230748 930304202 -893947794 38105012 882236238 -973132669 -362966229 1437628384 -75163750 2062634992 -119315125 -1100667389 -185600699 220181824 -1526251135 -499994246 -1328818347 1811909909 426823520 35394358 1057818429 1629193869 -1561184782 1563483785 -1847651625 -961010087 1171130780 1245567065 1522189581 -365319514 -687730615 1865082643 1235736863 33233075 -999985813 1376749520 -2136465943 -932699463 970881594 -865196033 1449448036 373394669 343268297 2142769197 686940305 -44494394 1568782325 -1509271198 -229577192 165702323 -67253230 -665187590 -719664918 222983608 1129029563 186530717 -527378793 -191793420 1859086290 -765460450 1587427159 -1337227888 2064911299 848249310 -1121821648 308368541 -502636372 -1144340603 1529064076 1183454511 -383218030 -1960019926 -780926728 1051000625 -116066136 881447024 1775669027 1337491055 -510108332 -489288045 2097722156 703038164 1255821184 1377600248 652916638 2065098203 -1494196273 -20063313 1996405774 -1988485616 -1605260049 9840408 1998678459 387321998 -721577261 1587850775 -1716420992 1607135415 1481933040 -256382872 -1719225166 111459044 1762833599 -184992489 -2081566216 955388963 -1528340850 -386638898 1593144969 664780719 2018449075 -1484507249 -1826098756 -131036880 1209141902 2015214241 -1009219472 -693374223 529395095 827659964 -440305771 643543538 -1802531980 1510820447 -736305203 1513294497 748859720 1543362942 144406741 -515355725 1950514699 -787434350 544598311 939384177 1664036451 1114122302 -51765179 1599372880 176162445 -1993298186 504484557 -1853618771 -1139153123 563332274 791990117 1807876719 -913200229 2136428075 -1170437519 1059853472 -1759307363 -283590392 2054444897 -1724673652 1118279305 574442543 875704432 1600215644 -1715808338 -241898782 -1432952350 833228650 -861286649 1732693177 -2023156129 -1949953946 -754305057 1271926514 -1906453406 -887478629 -607895311 -537553430 -297697977 -1522266144 -1098663649 133858330 -377734877 283158875 780826643 1256361574 -1374145196 -1417409433 -1395566486 -1808317175 470263633 1592743951 -504468389 514152106 786557035 -1113127561 -10019092 1773087133 357157169 -1532797710 -1150241887 -166859845 592295877 -1056659275 -173643391 -1050863798 716575433 -2107121997 1713299088 1308389088 -149236139 1723181356 -912115063 762832943 200137490 -1468983501 -1830249200 -250268685 1912272485 -663290615 2094448074 376117604 -862625942 596737177 1984399750 -325090631 817390319 -1073319950 -185388797 1483069082 -849880960 -1291853164 2144793138 -495238751 1517564242 -72120827 -1689411330 -1128692912 -509536471 308905624 -605765807 321314813 -876721409 2116096208 855897144 -879477200 -2053253795 2052755914 1417500539 679591891 -447510915 -968599372 -2112703148 283162975 1567952536 798002748 1195339291 1050844670 2034108629 -1936840221 1763586382 457012413 1053006391 -14056203 1429532189 1735833734 1730592291 -918289125 1184298470 1283594458 -1159132674 459840648 1296787881 -634276660 -1206866330 586769315 -1330872965 519223614 -1071049748 763492541 1097696237 948880152 1148778225 683679493 776766719 1453146865 -1560021306 550821437 -1730167748 1732605700 547428409 628528145 -1978164962 -820627040 1239572596 -254162440 -2004184084 341766884 -580416591 997977603 -1583074225 -1760363754 1759338074 -879993892 -744235686 1062922214 -362911456 -1393115275 -1285076555 -1579861647 1230563166 169255020 1616885948 2025032331 -576137518 132509950 7708447 1775913034 -976987586 1419369113 -1440770726 -1043805556 1778326702 1394532122 1907772158 -77962982 2007399316 1316358061 -879860780 1058964326 1590842832 -692712708 1306668828 -1652833517 -136015673 1988111579 -1824075351 -1542936868 1091572326 2003603166 -1178475934 1546792087 757304630 963003434 749069053 2061336227 -440614286 2006908272 1484961217 1308193959 246155827 -576491749 -1759635764 1248469540 -452798814 -2087703459 -1011642700 157076889 -1616674072 -194192521 -564420291 742292237 1069496699 740198104 -1021508961 363182842 -510991611 1384771755 595064561 1891039295 -552016509 -1682140681 750917280 -1143226210 -122505911 -2040003602 513449859 1650276075 1903396950 263742692 -738707413 1783510551 472799454 -1196718772 634162167 -1875968539 581555416 1390948152 -153469792 1758306508 863619870 -849586745 640978552 -393866277 -1646364311 -1547145936 -1952720588 1916678717 -1987658773 -840247739 2129991846 -31677023 -1648749977 -1730047183 -1139025204 1663266074 161261442 -1564810994 -478262527 -199098554 -554001317 732232707 1930075698 1044278871 843892303 1915444120 172625453 -347347951 375123935 1040537479 973235951 -1483812851 1655339613 -365568167 665384502 -1722188966 1433200874 -45754129 496722481 -394639280 1885718551 1939270199 -946008870 -2006968269 817249231 -556069572 -1214317458 -243167793 -237529499 1935119712 -1133387586 1526646953 -589758950'),
-    ('500 values #5', '-1720758790 2065568827 797490668 -569792018 190979393 1725272093 2052318029 622026400 -606991208 -1887422987 -437486899 -962581861 -1332262101 2010933216 -1622811651 1928486639 1494791141 1392390110 -194487400 -1753749301 699086410 -1236496102 608616050 599117518 417238715 2023330374 -2055754071 -1930250597 1231773403 -715072734 -1101363229 2099469807 -1606644699 1232561560 277360303 -1266132410 -1852805296 1416556804 1138842245 232820674 -1257749520 371012538 -1219979649 1344552306 1587829785 -1146761937 -736331130 1178404078 -1513743291 1239715468 1720267689 412237996 -2135305053 -956597261 1539342589 2078885017 -1526053512 2093913846 -1589171691 172724092 -1070932068 1282107109 -1398024217 -1675353586 691737293 1573881702 -2036758735 -1581393087 -2083659037 -608844788 1245474655 1238804027 -1125575193 381620395 -756895783 -2079704402 -1399101906 -1007738858 -1922431565 -1603059859 1038171163 -339471810 112036492 -1659363607 1055124345 -1874503963 -102022808 -222156266 1194074083 -592538096 56856583 402292484 -1679100244 -206135141 16487062 -1195934713 1913045609 494380126 -1961232242 976001230 1216450661 1755575105 1576170987 682483510 92132275 -851991239 -180206010 615643537 1992977291 -2013692667 -1886240543 2141413822 -90272017 1491635899 -422550671 -316652394 799282661 -1683791129 -41794972 912256681 1759651651 -242397947 -1831843443 1714837705 -1800491172 -764023916 465133909 -1510394689 -1865380591 -1605494900 -966298930 533939577 571560185 366638529 207689300 911189322 -750822798 -511511737 2124410026 418294827 131240614 -880907460 -198790765 23841695 452804629 -299791607 -1721515411 1258838141 866636000 -1656078975 1515233261 664487094 648182119 1622235834 1155186139 220483134 948500205 1569777566 -1223966621 -300347326 -208070073 1666838241 -1166111212 -370167887 -691783452 1406254863 -199720695 -434950551 -360821706 986178233 -1739093073 -805098699 -314546188 -805205125 709132889 -1052740308 -539873015 1948165036 -1491904468 802390212 1816706901 -110518574 -1859148270 -1755676180 1424949418 -1780846500 -1747063423 -292588127 -1732742587 1050501614 1025621009 -546977586 1339038909 -1588642030 242110467 -1889867309 371364680 1961187813 264511634 264928106 -731664953 730201433 -1622504287 -383073991 -628791472 1604631455 710132124 1894638339 1074962687 -330983690 1580943727 1786034968 949448389 -1926524433 2011756773 -912124754 431258068 -805525839 -637174767 -1702522611 334657484 31836662 -1233777435 -1482922614 673177283 -76495944 -1184359295 1491534127 -1682689230 -643755506 1483367520 241658369 -568820956 -1654054982 1127882604 -951042275 318257108 -1176137744 1319505740 -304459891 1482430141 261845678 2038162141 1148613974 1367632953 522799755 487793507 751519258 612888235 243695420 -2034724303 468129591 1842902984 677879958 1415023321 830952422 -998804414 -2023130666 -1372602505 -973796270 870584586 1127040294 -820404544 1810489863 -687947847 -639849520 -2121259488 -1368352712 1588548237 -1532223184 284846935 675790055 -426127975 -1848616526 -1538136668 1034954239 571969412 2026409902 -2015812402 -1753387394 1057041970 130922145 -1223494959 -531740981 -344316832 -199089817 -683346538 -1471415966 -558117723 -809011352 951747432 -754269753 1188999920 1895830439 290312110 413277980 -1782595945 1646442150 -1921530464 -1479273034 -1471413294 1092793779 506111148 -1933755389 747189948 -1797093659 -978810839 -244327926 695521401 -326354070 -61582497 459887949 -248918329 -368578029 -974240979 -1221621990 1094972454 53026999 -1658641178 -664977530 -301018648 -1671215701 -930949316 765440013 766592624 400008544 -57411892 115681107 717828886 -822832447 -1952417560 -1200364161 -449840311 2080678248 426597456 -1912196915 -2114467860 -1269493001 -852897365 1912652385 -1240240619 1148257472 -1558064671 1134562415 -1050035716 -904317695 -738208862 -1632154794 -2114283954 -11229935 1060917568 -297834438 -1392880208 -1592635268 -514505113 139940119 874761438 -1159165658 1126763 252215790 1431745405 721761407 1315119798 -626347217 -1837921757 -442075966 1553766110 1039559589 -1965796816 -273934733 -2066989346 -172854187 1808878892 -1813066298 1555250675 -802898490 325383120 -303721678 315249242 -410500599 899791177 601903881 -353501753 -904025294 -1652817768 -407883133 -2057905430 2002312418 -752614916 -1409293957 1294168770 1922488816 507344141 -171382515 1426040422 814368917 1802897353 -593338167 -1768968686 -271820835 1479549057 -1692804936 -1102447351 -276267224 381699280 -427564793 102918353 -1809696961 -447678646 1591390247 -814864565 1055723702 -689285197 -1195838898 -716964804 1198802123 -1425359139 -1819436724 45025372 572195591 -1657742960 131446718 42743783 -1314673587 1743424858 1186391213 -646928295 -639521783 976585806 1968054297 1369873799 624672804 1353073662 -1513160639 -1132716667 -1705941558 -1518510510 -1048108501 -1300207711 -1402311014 439800300 -1490912914 1117616171 1113050995 667906140 -1823843793 -1386646842 1938284989 1171873617 549535797 -25267175 -154820388 1092836497 273741807 1116163846 341312846 -219450252 777962341 1821728647 1640884351 276990107 614145241 581101855 2089638803 534816967 -759314847 1564428414 2022813891 546394592 -789677422 -1499126557 -258716709 -1854196389 -133482921 -248214486 564294789 -846879790 1272726296 -967769241 392644864 -1906226227 -635903325 31511689 -1828837185 -814292088 -164314775 -206528367 -1985961738 -1903142730 -563767724 1424626186 -914497171 -1817926510 621337749 1564441982 2050282216 1525973415 -1759663111 493957252 404069740'),
-    ('500 values #6', '30356050 -496143971 -160152209 345012162 233287020 1950909317 1253347899 1026158057 1700277782 -1971292436 -215892117 1756856187 1330649225 307763127 652136920 -1339001293 -766536705 450996625 -104672540 5872531 -1499540279 1965902578 -1881738114 -212501603 -1702946469 1335592280 1714236678 1449023965 -672429647 2071830300 920478295 -1785292798 19537819 627611078 -1406348757 -1979369488 -1083432457 891728429 -267326189 2108768926 -260181423 103373661 97702054 471610647 -1465673863 -584553820 -546096578 1795024857 -932464961 -483542178 -391832472 1178817280 -694207821 768359855 420416603 -1922575474 1242220204 562153566 632671682 -710175635 -1864394380 -731472615 -1741583709 248950110 766133450 -487203029 -927081666 -1065169991 960928719 1509965590 672437602 1994625878 1745228604 441096626 1603223959 -1501635122 -715704584 -1797435295 355363515 702708649 -1540053384 1789912387 -645014804 -815048504 2008741214 670249907 852464941 696365208 -464036924 -1593640503 408198946 896935262 1881205138 -1783618256 -817839569 253068361 -529658340 616298850 1252678590 -736687593 1345118401 -1598613627 730644375 871151953 1412868008 1920316915 1025529403 2135303599 796348942 1771450615 113358539 -1746106212 627171817 732103115 -328967147 36457778 -593443800 -2069184073 -590138519 -820913956 -1373260306 1937757453 -1227533164 -679754406 1922720569 1143132222 -58965938 -1322827448 -1174488676 2147383240 -1556644932 -1481999172 -1816062124 -877066260 1479308645 1237466729 -1713087382 33027067 1163398066 170814099 1439328683 1024968168 1647902355 113952500 -1985359423 695480795 -701091692 1616594629 1143782457 506941306 -1584632292 417670297 -529484127 -1484973079 -1450637184 -1370756156 1423116181 828265718 1164356225 535756287 1327332666 1729394280 -1436498350 949973747 -267690657 -1959826084 -382859338 -582829591 757472965 943113288 -1127299220 2016867697 -239664726 475003718 -923727507 1084011782 1067456194 1218913257 -219352722 -1142448652 146076788 -1120262782 -818329176 1999722313 1325529412 1221360894 -133076990 1735056553 1439301063 -1314190506 -567618771 765821975 1920409443 302448984 2080653064 -255132200 -164583257 1157229773 -937283296 1194533636 -507354022 12484149 117938900 -349349111 2002606495 -1451449089 1361037504 -1289788421 1293898520 449526090 -1553066488 1602031063 -1073728016 -1923373107 606359331 -83362511 1606820046 -553139803 234250714 1865276612 -1706864122 907960283 1485596013 68330293 1508246707 -1611996704 -923147312 -1787242743 1130078186 -1458947397 -975853939 -217672312 1740776922 57349575 -1514626001 1421834827 -268553293 -1753576865 1917330347 1763105367 -1193837670 1360230112 -209903690 1651972293 -646027195 1848862861 -2032936045 -365514984 -1918747044 -444726839 8620488 -541331279 -1134824537 -488912816 2123970211 -1796990964 -537245969 -1183097007 -2026419066 -778742557 1850383197 -1721924872 1456751052 922147825 644076237 -707422545 1251470325 -1520206653 -1556497895 -1982972677 -915346022 1792702883 1416315229 -118305173 842122763 1422108722 -1551373578 1111714279 882771148 -132670977 -220754979 495416992 -2124929949 1743144647 -1807211529 -2065862572 -1048298749 -1221253587 1438655565 -1505301767 209612610 1890756049 975965977 467636466 119277700 -329618285 -1669939722 1186152422 -910096791 -1126826625 -854049094 -1624148987 -1942401337 -1123393780 -344346676 596793137 1262287050 527467368 -184195595 -1877728975 -1671352638 1446062720 1740092614 -733498 415491018 154849842 -2076894364 566742154 66038259 322326398 -1108367287 938640754 -1530825799 -896479988 -303916639 -2140764867 493103410 -632150298 -1114268097 303498357 -358339425 -1342976540 705969368 722477518 -1779774513 100865386 2038625504 -598702304 -1856803175 1947353952 111924455 189330582 31472222 1230131589 2097367770 32738772 232580889 -2060148479 -470497635 1603446305 -128268848 -1960504711 582701611 -485841049 2066048589 -544162090 -1058064075 1062216692 -2077723784 -613777150 1239184056 -1857317561 -666568196 -1111855704 1000474058 674758248 550859464 -1702250722 1166089517 351772090 1010120415 1102427594 -719327098 -1574493793 -1957063326 -634370776 197627521 -693434246 1346510330 613302513 -1395481596 1418986992 1198908309 793205577 -151943509 2065102679 839190459 -92207906 565801168 -1364605630 1337872361 -1568296209 -1876468909 927906451 1186228719 1905269630 -181764827 -1988639469 -887157381 -1281656920 -1959337130 1250304549 -1290767243 1656957098 -1967498994 -792009939 1861314196 -815717865 66072007 -437124359 2100766009 1354658798 184815433 -114247136 -1059509298 -1990198655 1087876211 630932863 -1326700650 -918646707 -614291233 1555373139 1206205371 -1942166908 1571091623 668861132 -721877975 -974027239 -1612867574 1285665884 -566853337 -270791763 1672831840 -429403205 1044998636 -258829187 1694955120 1960561159 -486857001 -691332432 2034627325 -1345109824 -16307015 824927872 -10636957 -569740629 1822399572 1276854615 82789156 -1001926997 1293421186 -1792669928 975306853 -324271476 -1808494750 -298040014 440033539 2126430427 1384445262 -1372428953 195311052 -885766468 -767891053 -1706828972 -1803590288 -739078383 691142804 -877719714 -831093958 -232290034 440756541 934855077 -317329041 -1431749821 815033642 -240911662 -637600836 -227076372 -1965569630 974160407 1589297542 1767839596 -633252941 493283349 2139540529 -279428413 -968277354 599016125 2061701451 1251887714 1923734666 -1901132619 -1825184293 735229202 590611850 -402823996 -587074209 56204022 1293197374 1073303677'),
-    ('500 values #7', '770562688 -1460345906 1944715652 -2013735696 -1534250516 1497523276 462022091 764885863 1208225719 -265545695 -1998023209 -1605329822 -1858718555 -1133891212 1196214416 623469823 -574114842 -592058724 -503136538 1930446556 288813560 -2008389760 451378859 -1488471748 769065673 -215080938 1927682399 -554203208 -549698340 -240778932 1129939210 -1817263242 317491631 -1556087678 126529241 -571445620 -437940428 -797208462 642358492 -950520197 -1075409764 1977918577 -1660225545 -2036186705 1012215819 -1348413374 -4106152 76215360 -485385526 1776151541 264882283 -1641704008 -1023161407 1180963461 -1029547610 876335743 -230755226 -1225910720 2131871930 480508851 -920940311 833140511 1788763277 2141594576 -37794879 -1287724220 -1620759929 -1564534539 1515377390 -1829432550 -205975080 -1405930228 1712313376 916416707 -235745649 2135725782 -1770425297 1333644099 781380209 2008160199 1484002312 2089822264 -774864631 720866407 -655303389 899969536 -1868572434 214736106 181124617 -900387168 1680756791 -859179534 1509088525 -1471003771 909713156 900069606 1835344564 859935160 591417096 -1399768452 1261416355 -594886554 37605639 -1184373238 -1626235889 2083628439 -1284279538 1254412523 -1551012028 -1130709488 1247142795 -25675575 -2034594605 -597444877 232020315 310429098 -563022241 -139990857 1304217171 2074520567 221821912 -1590120480 480814532 1650325928 -1777190967 -1865097671 -819090113 -437399581 2145744374 931722705 940038026 -91632661 110362013 -383132045 1156052957 -388980056 1388732132 321695233 -1830726746 -1609209230 2028855498 -785860175 611339592 -1828947321 -214857911 -146745295 773562217 74560688 -667803932 -1596290702 1623326494 1413274989 1203720124 220346598 600410340 377037954 -1365957930 1150113360 2002591292 -1593291303 -289402263 12299858 1763995753 1581456902 -1909487272 1423312693 -1614215688 77748076 -1490287224 -841278666 -1440286864 -1451840846 -761666299 1867184776 899074684 -1179096142 -661325839 1921925410 1893668484 81165391 1696193918 -927505451 1485773972 -1808782935 -1071142019 -1304373343 580065786 1960015297 218362234 -968725435 -1609881341 536966944 -846861881 491465721 143787055 -1746211709 11051581 605536403 -1423197975 394314261 1896687560 346374110 -1485224315 -1412182579 681752493 534634030 947610500 1726580682 451568175 -697418562 1471155164 1820764304 273237379 -1970555468 1396879112 1562428351 -2025620421 -1798634140 -1952226695 1926494049 607539149 1164032220 329729938 -1010795197 649098328 -1242068548 1146580163 309826932 -358257043 507271816 596962644 -2017406698 -8426486 1670728881 546165275 195753796 -903353358 609487159 1961297562 -849999299 -73251448 -1095741055 1308625648 1320055247 794529607 -403329534 -870014893 -199526411 -1834066910 810089121 -1890159112 -1468533287 -259392403 -362401842 -67640877 -152719752 -1271211478 -686367698 458102347 -1530431323 -804952049 1552566562 937861452 -776030194 1005880270 2096044402 1549526993 -664128406 2041716334 -435008844 -1585847312 1119547616 -556025618 64339179 264789952 -1691427109 -776891332 -1109227431 -143999223 -1621256049 -998701550 -216483475 -1082680146 -1542418790 -1731680746 -1930135569 -901032605 1912913545 -497572702 1564071827 495542343 -351608605 -1081170934 1987220580 1568983756 1727911855 -1461578820 1346377095 -741157523 1862948669 333663285 949739391 -804383296 -1332152398 1130097708 -1463113187 -7449469 2130172394 63242699 -142527970 -5327032 1628117575 -822312376 -11294578 -2047942188 -1760725753 1912260327 -458521317 23383788 -183693010 2004403830 -1113561994 -1223445402 357960237 -631810759 -1938498545 -1930414260 -939067388 -21929231 418839935 1642135548 1472528028 662541809 740970353 -126328512 -920203681 157585579 -2112361970 1491093982 -1685787197 -296662963 -1572237466 1642634878 -1011581211 977139711 -576480653 1133256172 -415520579 -575794687 -1953169028 -426998665 -1927763051 301857359 265501436 -1311445495 -590455895 228590741 -907948781 -1831667194 -488128090 18277372 -213226333 1135607038 214134587 -946092489 1397201467 2100628575 529318559 774806265 476926677 -1637194200 -1594878614 2040465156 -1732239829 -455680065 -544609006 1266573928 2090737099 -691123390 248385832 1885269758 -577216235 1095067079 -1527860058 -1292536560 440075033 39180897 -423539254 334608 -1974590126 -1952907212 -1980349435 -1558916920 917369995 -717084706 1305523412 -112768006 83033359 -184732719 -1507788375 456385444 1688487756 66596630 -1547128869 -738881060 1852714610 485623897 -779407583 -1449542673 -459756567 2107178547 500365790 1027868829 1471464084 -862281948 402544325 -702770672 31417623 1409992169 41721740 138898518 -43608290 896530638 270257647 -859892963 -107835478 1356130919 -2076028453 -565398905 -724820438 746492796 -1676735524 2061146357 -358456810 359497956 -826017424 1274552198 1712691656 967760100 1598153525 807641322 555169561 -2033034989 416223624 -109134201 -1007039125 2006053349 668258128 1215063364 2027468785 1186106863 337044700 333437191 -1170192931 950906247 -1926914902 358729747 -83971820 -1415139917 104077080 554159174 949973049 514261372 1179424327 1465301660 -514578587 -1512791812 1381524722 776216097 -1107257330 -2011889337 311686917 1925026546 861230757 -1675485974 -1328071177 -2066148258 -253237418 -800184697 -348835963 -1497091338 -373833478 818192412 -1271775546 -384926110 7814707 1180997031 478794612 1806123730 -121953627 1601239850 1496267806 1012913373 976684579 -1879987553 883797897 -1554423900 80243782 -1256957808 261506693'),
-    ('500 values #8', '-751406533 2139421423 696758808 -92895915 109423530 -529033565 -799926528 1961449268 -1403670793 -173243828 1770059784 142279653 -677200306 198741965 -625832630 755349778 1168187228 1579063626 948863759 776297670 615507901 1304177692 830274337 -1012056734 472775319 -67945932 -1321715339 1964249176 -1088692016 -949160308 249480269 -865439500 -1181687095 1896165970 2031135667 2071292195 -869238844 1164684620 -906220328 880042825 -1257232302 817074197 880417883 -47231400 -785804019 -86743647 -649385414 259792217 1862728907 1866100519 1268756333 952041277 -972992472 -911437689 -1624038355 315580449 758586782 185503409 -516709555 1699778210 2062273817 -452979677 1367420791 -665141509 1952530185 1172802339 1308315065 -1518373483 -899998977 -1966809467 -912120767 1955557532 919729851 -1808054813 -659863688 1821107511 -247492724 669894872 -1046065171 1062310754 -89853870 -1228417286 -1279608184 1408541851 165690914 -982977498 1859823618 266365366 842549321 -980878309 -1557900783 -1678359050 496829070 1034618855 372934167 -1119774978 -1106134274 -1929447805 729431324 1740252844 133322198 -1178231303 592467428 -1147458235 -1922036060 -1717136695 -372367794 -728883349 933545753 -118524314 -1715646573 778213644 1162931368 -1557067224 -2125229535 1995092896 216262595 2052610855 1842969114 -1469131888 -399829446 656669554 1868448630 1634868355 1625214013 -104369248 -96857887 646558756 -1290826783 1099129621 1992495640 -913775592 -768078862 -921634082 626626791 -1893382275 1752075875 1154165071 -1763252800 654118065 318400351 -1150105491 150977856 1025150795 958283118 1504669193 1875480734 -1987288909 1774808146 1810203679 -1395586145 -352681332 1641729642 1450001959 -1392476923 1863683419 1802317805 -1991405203 2135336639 1443981729 -442404951 1236781500 -19826005 -1347281306 1875220280 1069460602 1984839164 1598976318 1829826564 -904232459 1618099606 -1986567622 -2107681469 -865898859 291893997 441449484 -1686630690 1840199526 2074442952 -708488708 -925300666 -196069241 2100666218 606932183 185974164 104447297 -26145963 1671858800 1883603011 -1571099284 1507790094 18093304 -137349730 -975657299 -1319364998 1326345515 -1663669495 -727206245 -1449576116 992649542 -176461015 636880693 -1042539424 938872031 -1347764725 -2086992500 1016266113 -699597870 1248837624 -880364127 291118128 749047189 1105021002 -1317862219 -1393738739 476545939 1529637576 595822746 1705285691 -405915761 1404410615 -310512176 65629940 -739049357 -1774947749 -425917953 726948373 -1737807744 -1353854439 2068822154 -1543560237 -96833898 -757625072 1871855798 -1082129531 -2118148493 -1027419413 -500044173 -1135927572 -228769191 1089876521 -1000751762 1950064722 -731753753 -850636160 354166229 957273163 313005843 -2098367538 -1024121415 660065040 -603219184 827934791 -1132571800 -1880661687 720635895 -1639711790 -148627391 -829760437 -1461505098 -406232572 799180121 10825317 1817226468 1697020459 1665594389 874270799 1158958488 -811843545 817290975 -1643186874 595760595 1787266398 1892515589 -880306785 -568894618 492312552 -1198943382 -1206333485 1964348564 -1573810096 -93708025 -1489556654 -193365151 1064013023 2099543057 454145328 -542777174 -361440329 867328823 211460585 1772949147 -125292456 1105312074 161137234 1297058603 704780240 1398456442 -1209412894 1124678510 -1084627726 774562625 1094098021 411519998 1602602871 1234247730 -1795853360 109550249 -228715699 121002628 875168854 -593629472 -1812035031 1792052361 275602572 -1665550534 -1882234849 1412073822 204651954 1730391459 23566751 -1279226895 312251315 157454190 -1503872551 -1440801951 -738229151 1522505806 87366249 -249792909 -1648236565 774362162 -1265290978 931655565 357116546 -47983495 -1756892281 1713216734 44561798 -234150069 1325822407 -1908529678 -200006731 -1580787037 56899043 -363248690 -185549138 274496477 -1899506078 252532032 -161583947 742031663 1318191414 -823905458 958980671 -2053980251 -446896888 -1054598220 1359156260 -2134532304 1055722233 -1211604654 336344323 -1833824211 -1952965427 -327717227 -667743440 860646515 -1873636909 176795888 2122244962 -1888687681 1866518882 1693155328 -1851048687 2087943570 1863051855 -119953270 -2011183396 -914438447 -391413526 -1374469747 1155226210 -1565821102 1141721204 607845242 2054425800 984790909 626553315 1991930971 -342042852 -539186241 2116802951 1680765050 -504746192 -221031336 1587507035 1791495585 1747052310 -526149164 -534098345 -1802812554 784820866 1993484923 694893634 1608695968 168793352 -1576296791 659423913 1547419096 -653823335 -1637958060 -1380945267 2116760792 160023979 -459309688 123877783 -1600532096 978643232 2056105538 -1191036455 1438047877 -2132565978 1100282239 -2049836189 2055101844 -866024354 -158897054 745176197 941001451 190891281 -325867631 137153822 -518503621 1388822523 -1161083997 -1084427533 -169113150 -660738896 -1481242404 -963577067 -1337966276 1878663170 1611506845 966470490 1140270590 -1662819592 -2009111357 1329198664 688043839 -346858983 493591394 1142690942 1873627625 1648222122 1670919867 -2080285459 -1113829788 -1262369814 -1858471406 -1714135573 403487068 -2003274654 -230033876 419982919 738835895 873107841 1598640183 -1938420440 -1096358478 1033116074 -1957488334 -419767136 -262152715 -1141004122 170767078 -1214319513 1092578293 1562209489 1185684228 -1905058345 -1545605929 16732531 2119495243 -905106573 -1141767585 1356291639 1788411640 994360028 326891419 -777802714 332751790 420553191 1170542688 741018876 1367442385 -770237453 -1129988567 -851415269 1616017209'),
-    ('500 values #9', '-1532184798 2086046547 688107111 91272607 -1198112291 -371256087 -856841884 -965706538 -1885672592 243602445 1926379839 393707280 1630858748 1010228313 1767712609 -1395292327 541136402 767725944 -312671113 239876789 -18808550 -1946118006 2028471131 -668233234 1896599196 615537801 735910543 -510436976 1227521404 105068035 -778529576 843138178 -359382956 -394023826 -1506598888 -859472371 -530599445 -1357729456 1092708827 162900656 -113735798 -1112533170 1500407887 -1179636182 -855830591 1535627932 891535582 -1527497630 1313298622 -158805729 1781299793 -1899990723 267945629 -375047345 2009126391 -358595987 246044737 128813862 -1571559674 -479236516 -1104414263 -1052285690 -1274159031 -729014908 630096861 -1807878733 1813447320 -215663965 1490926528 -553717937 -1750353821 153053458 964583972 1414789223 -1329371306 -1926135506 -994449918 -527559522 745915204 450840329 442046836 -1977628193 1604687650 -1834877315 -1339328463 1308464433 1123977556 376169077 963383651 736374397 252760894 -1215404784 -88501208 -1250311869 1586878101 1748192677 -717412827 -845301013 1962884922 1756616547 -2081625857 -1237776193 1877586896 -1331338098 1984607980 1037128112 -1643614432 1060338197 2145645414 1092342212 -90534155 1780011820 -1105553858 840208482 448401173 875179411 -1269106380 -443961951 1782954561 -1119565012 223678878 -766157707 1183323134 -931753645 -512553912 -144953163 144526198 638753308 -604475588 -822820019 -1024085003 -602821779 55046618 1644164800 -11693940 -146011398 -1723964531 1300587466 2067247022 955259022 -131037647 1123687848 1459134330 -772092166 1779535963 -1275057725 -555318123 -803493807 -369667087 -1951137305 268541652 1563732504 -1197118647 1036171083 -1520750366 -2077819703 -1027467369 228971419 1867272473 360914264 339916262 944944077 -353999486 -879642421 -1492881627 -1304846341 -730723027 -1159561181 -516084247 299743679 1431781953 -1092081277 -3000125 217508024 664036128 1904665722 793910164 -697656089 -1042273655 1131125258 1381226854 -48872032 2003637757 960174075 608573027 1029048772 -40391665 -168238168 -1424925642 999749122 1266910194 -634898510 -1420492934 -1546366357 946239402 199914945 -50181011 -1357004511 1790569218 1672307924 180976385 2105923578 609066988 1963817527 -1895231396 102840493 -2002211713 1456288085 1489053927 -1828236969 1912068356 1365782025 722480283 -1939115916 1135326705 -2120065327 -376272530 -1556962034 1471218345 561359299 -1153484800 -1855563570 889786523 -1498816256 -2108221359 -1208089812 24622689 -188937069 -544598851 -1887852377 506098468 591539792 716206101 1863602276 500446837 1772753995 -72137605 684121024 -52164999 -2079916220 -2119083799 138351558 221807399 -380798208 -2096584098 -2075645406 126347809 954310486 -967481161 153493983 2050758184 -916165738 -2073856754 9517761 1345000003 849798248 747465853 -298185816 1314980249 1888548256 1759963200 -1377538415 -1687851605 1795506116 -1733818641 104734506 -1507973803 -1112530379 -1323141742 514454792 113627606 -1063355776 1353835499 -625170715 -999332643 1266741896 -442826491 -1808098561 -545239317 1972669012 -403609204 -176103344 279182271 -1102913701 2105534835 847123522 -1177434113 -859102379 790452762 1409015875 1494077851 -1801236609 660289882 2111726767 1538539553 643791754 1114912747 -2011399724 -1745902047 -406826613 -518557072 -527552676 226350962 -103057310 -1906471830 587328515 -2106895485 871213297 -1411396799 -1792349460 -608220 1483180171 -283855882 622371864 1221386946 -724687170 282852054 2050113385 1537427823 2035126219 -1737907689 1695615329 120942754 1800245058 -1964725231 -1160644045 -1239454320 1723454234 1581049995 825869430 1664533059 286835712 -105225462 -983139256 -1947501516 1821750188 -1828161164 792115404 1827872851 -943290744 1715030484 184815443 272772791 679074040 -2006171553 -1377161939 1841537475 1505075076 -796782171 -2080232644 1981995074 -1257746310 373817247 -1528185603 1083424688 1377356246 913588493 1378265267 -436815277 1842003860 -1817039636 -862099193 -1449765150 274698390 -1114663436 286456768 1437313198 1500843776 -476068751 760359389 1703065208 174214333 -722714829 -498876713 1097833420 1029697683 -1546400436 1247679771 2097996851 813082588 962775207 -1810639283 3405250 1054227872 2037203192 -662028409 -1916859217 -1727926393 -270203893 -1150432755 1454596580 -1820987760 -684648951 451696296 1155370485 489047449 1953601926 410636085 -443657054 2013998314 1174909417 -745706612 -2020242401 576053691 -973553011 1217829979 2115640233 -212385307 -40357841 -1167636724 -619286184 227795274 1894694094 -535036981 -292710844 -1349745691 771783550 368830838 690080588 -515083747 -1779430220 1168950100 509451386 -878838440 1280137241 -1088989900 915294202 -1831774843 -1795133072 -996552538 -1485109657 -515396117 909146445 1219299481 575099933 -1484869462 1029311646 -474069987 -787360995 -598287940 -1689850916 -1754406369 -2125170352 1902499705 -823485000 -237357639 -601649779 1122474648 -988845586 -1708403044 -1578370391 -1772544887 -1342642050 -296440723 -219714735 244748839 235106511 53433028 -394947259 -1703843897 -2034689622 -1762573662 -627433366 232872300 -1747775694 416287788 421094890 1221655013 -754066010 1562157671 -492899368 -2094481098 -894008804 -370182941 -481897233 1199022207 -1783702001 965696958 1722866186 255707519 1740353276 2116260083 2053737682 -1104912449 309067685 90643288 -1419130530 795926128 -512252047 -1419479172 -1551170121 -992485478 -854134711 -994685247 -29532444 -1520698340 -1875753293 -1429333335 -280563279 -962236440'),
-    ('500 values #10', '-338862873 -860057532 -67725998 1214043924 -1817108903 -596463939 -1066441514 1907920229 -1088387390 948755934 537015594 -18028403 402895406 501088648 -1307610432 -180982881 -1688040803 -1565560545 -838987497 -2118418020 1927682088 -447999527 -720621591 1467218317 516221512 -515868717 1305998432 1555629918 -732112755 -256740604 -709802524 -298001073 1354956824 1389573256 1544077097 648698341 2036782495 405414519 -1562833485 -857123929 -770237304 443289017 1921048349 838774035 -1284833077 -90152471 -798076729 -1384537391 1995332827 -437057671 2013159503 -776797822 -895723362 1008777714 837337245 570811727 -38623318 2009027140 325899036 1211070717 -1106279218 -747812905 -532338423 -943603689 1359333590 1227787411 -459840109 -579753832 -1658339174 1855714273 274235871 -1289348985 396112079 2135736591 195975454 -1374702157 780449820 1149410161 215174242 -2031879863 1945639985 975873978 -164831300 1902562767 894929664 -1247050650 -264333953 1278549583 -896225633 1422844540 828221229 -1850449431 1369946656 1493737761 1269836427 1267211314 -390233897 742933350 -2992658 -1549713888 572673942 -846827331 -1108010649 -1062224065 681452274 -1485443518 924433256 -330162925 1241575256 -528320401 -1829805823 -218756776 2107543072 420622698 -89186303 353235360 -426038856 147606857 28401081 1818900397 1805570676 1587564742 823383307 -350895845 187454730 -1989578495 1248636827 2011883118 -603316245 866012658 1698666052 1341305284 158510013 402953570 593480129 1779839828 -1782489009 -1677745543 1155148846 -1081339753 676893919 707354877 -622732371 -1433065277 631359525 483947915 -1957230816 271529061 2077081438 622904272 762235991 630259004 -431138526 2004938543 1085264275 -723286663 2000238313 1272302726 -298691160 -1692455247 -2102181292 -1723971709 -1036210787 -1193996257 45854084 1060225695 80735801 249079821 345823444 806012492 323133599 -1198159559 -232879329 -540652336 -467575194 -158642306 1169700971 771184932 380490975 817921996 2000528 -1500039091 -665860005 2137616957 -2041987850 -73997615 -1698447567 -878611917 -360882794 1806237921 1983106093 -1778740093 -1648969660 1422998869 1892689679 988489835 -1538993407 -651423481 -807924805 -674023469 -191844885 1220930346 -1258995264 90687493 -73332272 -651545271 -102381142 -1728195911 -265575265 953456712 845091807 -204237737 -777777878 -1858972036 -857859221 -1955571405 1332238456 905288880 -1653196186 -2050481333 1499716722 -673975075 635525973 -1677774526 760807645 1288705473 -1441588193 1846502824 2078336696 1032894490 -1099885517 68693301 -1398212733 222953023 -1459706015 -725893896 257049299 -316241097 1969081965 -162976156 -1151671672 1278851365 -407818176 557316324 -1355269309 -1346957909 603352161 675632323 -291480301 -448470253 -2022103798 1019575264 490085558 1645390716 -1299981660 -216573670 396009553 -302568237 -477446666 -2128370872 879332787 -1224941396 -1263646019 -952001720 1083729744 875141412 1325984340 1271344922 -1878774398 332206737 -1710461948 1286352821 1597639050 158437098 -1344497262 -576414535 -747389107 -1301056065 -182319546 -1658050783 -1020684416 733157031 1557512110 -45165970 119035073 2001095682 597466822 -801423240 416486539 -478290730 478066037 -461519982 373682404 -1656860614 -653158692 -635719922 1483987673 -180987409 504068865 -1406483637 1347495551 745558481 884713279 1291124656 -869967837 1798227982 491707249 387270195 -1783476707 739207169 -1572182362 -802361106 -1641271683 -1122821571 -835886507 -1645191912 -1361313410 -544146297 830803640 -1540353318 46492449 -479046620 -351160373 414145738 -1555348126 321289509 -499461892 -330545909 -1349677587 -57250987 581975115 160542746 830788092 1800282753 623887340 1849820654 2147052239 -1403445848 235847731 -1430801681 -44487143 -906947715 -1544914602 -1343901376 -796372781 1468815315 -210449217 512861980 -1917225047 1569906044 -605422157 1940646413 -2106323085 -66104163 -1561071512 -1309413184 1353842144 -498455984 1992130759 264493011 23356107 657429629 -21604322 -390264997 793266160 -35537059 -362364540 902554613 1459824175 -241154915 -48535202 -1429135384 -1792416011 280881408 -2014937936 1270798720 1121229654 -1200316612 -892967040 -2007059319 -966999349 -1181788517 161527787 -907654110 -1425031612 1205769962 -183303239 281966569 1041607954 1170583178 1142115778 -20129036 213572325 46411336 -1661246113 312304503 -1656969820 -996909559 1181601459 185139627 1388489056 2108372033 -571824329 180574916 1385603373 1102888537 -1968767815 1116709227 940512965 -251828622 199085795 -1208853194 2103570747 -321458159 -1707608387 1013563733 1417642929 660014939 1079520677 -1084343412 -868833524 1609796010 2144531601 -2009055142 -215897934 -1018700854 -650356949 1555635551 1360338943 -1773894496 -261692791 1568910595 2121532109 -1643314507 1183828901 1339552697 -1129808079 -1246063785 1334457998 1020539983 377630242 812322572 -641535661 1550692351 905181354 473570827 570245511 -308520112 -1434598020 498865600 -1549474034 1223418490 -1260058983 1346600524 -1258671434 1311856951 -1892543693 300967037 -640742643 138644962 -940232679 416000594 166509649 -1424308372 -757401983 2057289998 876404234 -890627185 -904806844 312396946 -999253944 1943031803 1537670648 61911900 2085156373 1718653856 770084689 1353691701 -1738494680 -1565133737 1987590578 1074146139 1227033700 -379691351 1798597946 -1892852715 2115212237 -956388140 1576457388 669569422 -1602503135 865120345 1572296462 -1577580755 -1075128054 -1519372837 907933958 -764088815 1410818608 -1084244145'),
-]
-
-
 
-# "598833565 -1669320321 -2040063279 1037451515 -966241705"
+# Large benchmarks are stored packed in corpus/ (see test_gen.py) and only read
+# when the suite is run
+BM_100 = packed("100 values", "bm_100.bin", 100)
+BM_500 = packed("500 values", "bm_500.bin", 500)
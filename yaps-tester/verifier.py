@@ -0,0 +1,113 @@
+from collections import deque
+
+
+class Verifier:
+	"""
+	In-process replacement for the checker binary.
+
+	Replays push_swap operations on two deques, one operation at a time, so it can
+	be fed while push_swap's output is still being read.
+
+	Parameters:
+		numbers (list[int]): The initial contents of stack a, top first.
+	"""
+
+	def __init__(self, numbers):
+		self.a = deque(numbers)
+		self.b = deque()
+		self.count = 0
+		self.error = None
+		self._ops = {
+			"sa": self.sa, "sb": self.sb, "ss": self.ss,
+			"pa": self.pa, "pb": self.pb,
+			"ra": self.ra, "rb": self.rb, "rr": self.rr,
+			"rra": self.rra, "rrb": self.rrb, "rrr": self.rrr,
+		}
+
+	def apply(self, op) -> bool:
+		"""
+		Applies a single operation.
+
+		Returns:
+			bool: False if `op` is not a valid operation. The first invalid operation
+			is remembered in `error` and nothing further is applied.
+		"""
+		if self.error:
+			return False
+		handler = self._ops.get(op)
+		if handler is None:
+			self.error = f"invalid operation {op!r} at op {self.count + 1}"
+			return False
+		handler()
+		self.count += 1
+		return True
+
+	def is_sorted(self) -> bool:
+		"""
+		Returns True if b is empty and a is in ascending order.
+		"""
+		if self.error or self.b:
+			return False
+		a = self.a
+		return all(a[i] < a[i + 1] for i in range(len(a) - 1))
+
+	def verdict(self):
+		"""
+		Returns None if the stacks are sorted, otherwise a description of why not.
+		"""
+		if self.error:
+			return self.error
+		if self.b:
+			return f"stack b not empty after {self.count} ops ({len(self.b)} left)"
+		if not self.is_sorted():
+			return f"stack a not sorted after {self.count} ops"
+		return None
+
+	# The operations below follow the subject: each one is a no-op when its stack
+	# is too small, exactly like the reference checker.
+	@staticmethod
+	def _swap(stack):
+		if len(stack) > 1:
+			stack[0], stack[1] = stack[1], stack[0]
+
+	@staticmethod
+	def _push(src, dst):
+		if src:
+			dst.appendleft(src.popleft())
+
+	def sa(self):
+		self._swap(self.a)
+
+	def sb(self):
+		self._swap(self.b)
+
+	def ss(self):
+		self._swap(self.a)
+		self._swap(self.b)
+
+	def pa(self):
+		self._push(self.b, self.a)
+
+	def pb(self):
+		self._push(self.a, self.b)
+
+	def ra(self):
+		self.a.rotate(-1)
+
+	def rb(self):
+		self.b.rotate(-1)
+
+	def rr(self):
+		self.a.rotate(-1)
+		self.b.rotate(-1)
+
+	def rra(self):
+		self.a.rotate(1)
+
+	def rrb(self):
+		self.b.rotate(1)
+
+	def rrr(self):
+		self.a.rotate(1)
+		self.b.rotate(1)
+
@@ -0,0 +1,177 @@
+import os
+import time
+from config import PUSH_SWAP, CHECKER, BONUS_CHECKER, COLOUR
+from cache import ResultCache, file_hash
+from runner import _parse_case, iter_cases
+
+
+class Watcher:
+	"""
+	Re-runs the test suites every time push_swap or a checker it uses is rebuilt.
+
+	The suites are loaded once and kept in memory, and the worker pool stays up
+	between builds. Every `interval` seconds the binaries' modification times are
+	polled; when one changes, its content hash decides whether it really is a new
+	build. The checker is only watched with `cross_check` or `pipe`, and the bonus
+	checker only with `bonus`. Each build runs the cases that failed on the
+	previous build first, then the rest from the smallest input up, prints each
+	failure as soon as it is known and ends with a diff against the previous build.
+
+	Parameters:
+		suites (list[tuple[str, iterable[tuple]]]): (name, cases) pairs, as in SUITES.
+		bonus (bool): Whether to enable bonus checker verification.
+		jobs (int | None): Number of worker processes.
+		interval (float): Seconds between polls.
+		dedupe (bool): Whether to run order-isomorphic inputs only once (see
+			`runner.iter_cases`).
+		**options: Extra keyword arguments passed on to `runner.run_test`. A `cache`
+			is replaced by a fresh ResultCache for every build.
+	"""
+
+	def __init__(self, suites, bonus=False, jobs=None, interval=1.0, dedupe=True, **options):
+		self.bonus = bonus
+		self.jobs = jobs
+		self.interval = interval
+		self.dedupe = dedupe
+		self.use_cache = options.pop("cache", None) is not None
+		self.options = options
+		self.suites = [name for name, _ in suites]
+		self.cases = []
+		for name, cases in suites:
+			for index, (case, test) in enumerate(cases):
+				numbers = _parse_case(test)
+				if numbers is not None:
+					self.cases.append((name, index, case, numbers))
+		self.results = {}
+		self.builds = 0
+		self._stamps = {}
+		self._hashes = {}
+
+	def _binaries(self):
+		# Only the binaries a build actually runs
+		checker = CHECKER if self.options.get("cross_check") or self.options.get("pipe") else None
+		return [path for path in (PUSH_SWAP, checker, BONUS_CHECKER if self.bonus else None) if path]
+
+	def changed(self):
+		"""
+		Returns True if a binary's content changed since the last call.
+
+		Only binaries whose modification time or size moved are hashed. A binary that
+		is missing (e.g. half way through `make re`) counts as unchanged until it is back.
+		"""
+		changed = False
+		for path in self._binaries():
+			try:
+				stat = os.stat(path)
+			except OSError:
+				continue
+			stamp = (stat.st_mtime_ns, stat.st_size)
+			if self._stamps.get(path) == stamp:
+				continue
+			self._stamps[path] = stamp
+			digest = file_hash(path)
+			if digest and digest != self._hashes.get(path):
+				self._hashes[path] = digest
+				changed = True
+		return changed
+
+	def _order(self):
+		# Previous failures first, then the cheapest cases, keeping suite order on ties
+		def priority(item):
+			position, (suite, index, _, numbers) = item
+			previous = self.results.get((suite, index))
+			return (previous is None or previous.ok, len(numbers), position)
+		return [case for _, case in sorted(enumerate(self.cases), key=priority)]
+
+	def run_build(self):
+		"""
+		Runs every case against the current binaries, printing each failure as its
+		result arrives, then prints the diff.
+
+		Returns:
+			bool: False if a binary changed again before the build finished; its
+			partial results are then dropped.
+		"""
+		self.builds += 1
+		options = dict(self.options)
+		if self.use_cache:
+			options["cache"] = ResultCache()
+		order = self._order()
+		print(
+			COLOUR["HEADER"],
+			f"🔁 Build {self.builds} (push_swap {self._hashes.get(PUSH_SWAP, '')[:12]}): running {len(order)} cases...",
+			COLOUR["ENDC"],
+		)
+		start = time.monotonic()
+		last_poll = start
+
+		# Results are shared within this build only: the next one has new binaries
+		current = {}
+		inputs = [numbers for _, _, _, numbers in order]
+		results = iter_cases(self.bonus, inputs, self.jobs, self.dedupe, memo={}, **options)
+		for position, result in results:
+			suite, index, name, _ = order[position]
+			current[(suite, index)] = result
+			if not result.ok:
+				if result.message:
+					print(result.message)
+				print(f"❌ Test failed: {suite} / {name}")
+			if time.monotonic() - last_poll >= self.interval:
+				last_poll = time.monotonic()
+				if self.changed():
+					results.close()
+					print(COLOUR["YELLOW"], "⚠️  Binary changed again, restarting", COLOUR["ENDC"])
+					return False
+		self._report(current, time.monotonic() - start)
+		self.results = current
+		return True
+
+	def _report(self, current, elapsed):
+		names = {(suite, index): name for suite, index, name, _ in self.cases}
+		previous = self.results
+		better = worse = 0
+		for key, result in current.items():
+			old = previous.get(key)
+			if old is None:
+				continue
+			if old.ok and not result.ok:
+				print(COLOUR["RED"], f"❌ Newly failing: {key[0]} / {names[key]}", COLOUR["ENDC"])
+			elif result.ok and not old.ok:
+				print(COLOUR["GREEN"], f"✅ Fixed: {key[0]} / {names[key]}", COLOUR["ENDC"])
+			elif result.ok:
+				better += result.ops < old.ops
+				worse += result.ops > old.ops
+
+		for suite in self.suites:
+			ops = [r.ops for (s, _), r in current.items() if s == suite and r.ok]
+			if not ops:
+				continue
+			average = sum(ops) / len(ops)
+			line = f"{suite}: LOW: {min(ops)} HIGH: {max(ops)} AVG: {average:.2f}"
+			old = [r.ops for (s, _), r in previous.items() if s == suite and r.ok]
+			if old:
+				old_average = sum(old) / len(old)
+				if old_average != average:
+					line += f" ({average - old_average:+.2f} vs previous build)"
+			print(COLOUR["BLUE"], line, COLOUR["ENDC"])
+
+		failed = sum(1 for r in current.values() if not r.ok)
+		summary = f"{len(current) - failed}/{len(current)} passed in {elapsed:.2f}s"
+		if previous:
+			summary += f", fewer ops on {better} cases, more on {worse}"
+		print(COLOUR["RED"] if failed else COLOUR["GREEN"], summary, COLOUR["ENDC"])
+
+	def watch(self):
+		"""
+		Runs a build now and after every rebuild, until interrupted with Ctrl-C.
+		"""
+		self.changed()
+		print(COLOUR["HEADER"], f"Watching {', '.join(self._binaries())} ({len(self.cases)} cases)", COLOUR["ENDC"])
+		try:
+			while True:
+				if self.run_build():
+					print(COLOUR["HEADER"], "Waiting for a rebuild... (Ctrl-C to stop)", COLOUR["ENDC"])
+					while not self.changed():
+						time.sleep(self.interval)
+		except KeyboardInterrupt:
+			print()